@@ -1,16 +1,30 @@
+"""Streamlit UI for the box office suite; a thin client of the headless `boxoffice` core."""
 import streamlit as st
-import requests
-import re
+import functools
 import json
 import math
+import os
+import time
+import numpy as np
 import pandas as pd
 import altair as alt
-from datetime import datetime, timedelta
 
-# --- PART 0: SHADCN/UI THEME (ZINC) ---
-st.set_page_config(page_title="Box Office Suite", page_icon="🎬", layout="wide")
+from boxoffice import metrics
+from boxoffice.datasets import upcoming_data, historical_data, rendered_data
+from boxoffice.engines import GENRE_BASELINES, IP_MULTS, MODEL_PARAMS_VERSION, calculate_box_office, calculate_long_lead
+from boxoffice.comps import comps_forecast, find_comps
+from boxoffice.montecarlo import MC_BIN_EDGES, simulate_box_office
+from boxoffice.pageviews import features as wiki_features
+from boxoffice.release_calendar import calendar_competition, release_calendar
+from boxoffice.runs import project_slate_runs
+from boxoffice.sensitivity import SWEEP_RANGES, sweep_grid, sweep_one_at_a_time, tornado
+from boxoffice.slate import score_slate
+from boxoffice.signals import live_data_for, prefetch_live_data, signal_cache
+from boxoffice.windows import optimize_windows, weekly_windows
+from boxoffice.refresher import SignalRefresher
 
-st.markdown("""
+# --- PART 0: SHADCN/UI THEME (ZINC) ---
+THEME_CSS = """
 <style>
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
 
@@ -88,354 +102,16 @@ st.markdown("""
     }
 
 </style>
-""", unsafe_allow_html=True)
-
-# --- SHARED HELPER FUNCTIONS ---
-@st.cache_data(ttl=3600)
-def get_live_data(wiki_title, yt_id, yt_fallback, rt_slug, movie_name_simple, frozen_views=None, poly_slug=None):
-    # 1. Wikipedia
-    wiki_views = 0
-    try:
-        headers = {'User-Agent': 'BoxOfficePredictor/1.0'}
-        end = datetime.now()
-        start = end - timedelta(days=30)
-        url = f"https://wikimedia.org/api/rest_v1/metrics/pageviews/per-article/en.wikipedia/all-access/user/{wiki_title}/daily/{start.strftime('%Y%m%d')}/{end.strftime('%Y%m%d')}"
-        data = requests.get(url, headers=headers).json()
-        total = sum([item['views'] for item in data['items']])
-        wiki_views = int(total / len(data['items']))
-    except:
-        wiki_views = 0
-
-    # 2. YouTube
-    if frozen_views:
-        yt_views = frozen_views
-    else:
-        yt_views = yt_fallback
-        try:
-            url = f"https://www.youtube.com/watch?v={yt_id}"
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
-            response = requests.get(url, headers=headers)
-            match = re.search(r'"viewCount":"(\d+)"', response.text)
-            if match:
-                yt_views = int(match.group(1))
-        except:
-            pass 
-
-    # 3. Rotten Tomatoes
-    rt_score = None 
-    if rt_slug:
-        try:
-            url = f"https://www.rottentomatoes.com/m/{rt_slug}"
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36'}
-            response = requests.get(url, headers=headers)
-            match = re.search(r'tomatometerscore="(\d+)"', response.text)
-            if not match: match = re.search(r'"ratingValue":\s*"(\d+)"', response.text)
-            if not match: match = re.search(r'class="percentage">\s*(\d+)%', response.text)
-            if match:
-                rt_score = int(match.group(1))
-        except:
-            pass
-
-    # 4. Polymarket
-    poly_data = None
-    top_prob = 0
-    if poly_slug:
-        try:
-            url = f"https://gamma-api.polymarket.com/events?slug={poly_slug}"
-            response = requests.get(url)
-            if response.status_code == 200 and len(response.json()) > 0:
-                event = response.json()[0]
-                markets = event.get('markets', [])
-                for m in markets:
-                    try:
-                        prices = json.loads(m.get('outcomePrices', '["0", "0"]'))
-                        current_prob = float(prices[0])
-                        if current_prob > top_prob:
-                            top_prob = current_prob
-                            poly_data = {
-                                "outcome": m.get('groupItemTitle', m.get('question')),
-                                "prob": int(top_prob * 100),
-                                "url": f"https://polymarket.com/event/{poly_slug}"
-                            }
-                    except: continue
-        except: pass
-
-    # 5. Manifold Markets
-    manifold_data = None
-    try:
-        search_query = f"{movie_name_simple} box office"
-        url = f"https://api.manifold.markets/v0/search-markets?term={search_query}&limit=1"
-        response = requests.get(url)
-        if response.status_code == 200 and len(response.json()) > 0:
-            market = response.json()[0]
-            if 'probability' in market: 
-                manifold_data = {"question": market['question'], "prob": int(market['probability'] * 100), "url": market['url']}
-    except: pass
-
-    return wiki_views, yt_views, rt_score, poly_data, manifold_data
-
-# --- CALCULATION ENGINES ---
-
-# 1. SHORT TERM ENGINE
-def calculate_box_office(interest, total_aware, theaters, rt_score, popcorn_score, buzz, comp, trailer_views, intl_multiplier, studio_type, market_demand, release_format):
-    # Base
-    base_gross = (interest * 0.15) * (total_aware * 0.05) * 1_000_000
-    
-    # Efficiency
-    view_efficiency = 1.0
-    if studio_type == "Cult / Indie (A24/Neon)": view_efficiency = 0.6 
-    elif studio_type == "Major Franchise": view_efficiency = 1.0 
-    
-    effective_views = trailer_views * view_efficiency
-    trailer_multiplier = 1.0
-    if effective_views > 60_000_000: trailer_multiplier = 1.4
-    elif effective_views > 15_000_000: trailer_multiplier = 1.2
-    elif effective_views > 5_000_000: trailer_multiplier = 1.05 
-    
-    base_gross = base_gross * trailer_multiplier
-
-    # Scale
-    blockbuster_mult = 1.0
-    if theaters > 2500:
-        if total_aware > 60: blockbuster_mult = 3.0
-        elif total_aware > 40: blockbuster_mult = 2.0
-        elif total_aware > 25: blockbuster_mult = 1.5
-        else: blockbuster_mult = 1.1
-    
-    base_gross = base_gross * blockbuster_mult
-
-    # Demand
-    demand_mult = 1.0
-    if market_demand == "Pent-up / Starved": demand_mult = 1.2
-    elif market_demand == "Saturated / Crowded": demand_mult = 0.85
-    base_gross = base_gross * demand_mult
-
-    cap = 5000 if theaters > 3000 else 3500
-    weighted_gross = (base_gross * 0.7) + ((theaters * cap) * 0.3)
-    qual_mult = 1.15 if rt_score > 80 else (0.85 if rt_score < 50 else 1.0)
-    raw_opening = weighted_gross * qual_mult * buzz * comp
-
-    if raw_opening > 150_000_000:
-        final_opening = 150_000_000 + (math.sqrt(raw_opening - 150_000_000) * 3500)
-    else:
-        final_opening = raw_opening
-
-    # Holiday Logic
-    extended_opening = None
-    if release_format == "5-Day Holiday (Wed-Sun)":
-        extended_opening = final_opening * 1.45
-    elif release_format == "4-Day Holiday (Fri-Mon)":
-        extended_opening = final_opening * 1.25
-
-    # Legs Logic
-    legs = 2.7
-    if popcorn_score >= 95: legs += 1.2
-    elif popcorn_score >= 90: legs += 0.8
-    elif popcorn_score >= 80: legs += 0.3
-    elif popcorn_score < 60: legs -= 0.5
-    
-    if rt_score > 90: legs += 0.2
-    if theaters < 2000: legs += 0.4
-    
-    if final_opening > 120_000_000: 
-        if "Family" in studio_type or "Animation" in studio_type or market_demand == "Pent-up / Starved":
-            legs -= 0.1
-        else:
-            legs -= 0.5
-            
-    dom_total = final_opening * legs
-    global_total = dom_total * intl_multiplier
-        
-    return final_opening, extended_opening, dom_total, global_total
-
-# 2. LONG LEAD ENGINE (Restored)
-def calculate_long_lead(genre, cast_score, budget, rating, ip_status, season, competition_level):
-    genre_baselines = {"Action/Adventure": 25.0, "Horror": 18.0, "Sci-Fi": 22.0, "Drama": 8.0, "Comedy": 12.0, "Family/Animation": 28.0, "Thriller": 14.0}
-    base = genre_baselines.get(genre, 10.0)
-    star_power_add = math.sqrt(cast_score) * 2.5
-    production_add = budget * 0.08
-    
-    ip_mult = 1.0
-    if ip_status == "Sequel (Major Franchise)": ip_mult = 2.5
-    elif ip_status == "Adaptation (Book/Game)": ip_mult = 1.5
-    elif ip_status == "Original": ip_mult = 0.9
-
-    season_mult = 1.0
-    if season == "Summer (May-Jul)": season_mult = 1.3
-    elif season == "Holiday (Nov-Dec)": season_mult = 1.4
-    elif season == "Dump Months (Jan/Sept)": season_mult = 0.8
-
-    rating_mult = 1.0
-    if rating == "R": rating_mult = 0.85
-    elif rating == "G/PG": rating_mult = 1.1
-
-    comp_mult = 1.0
-    if competition_level == "High (2+ Wide Releases)": comp_mult = 0.85
-    elif competition_level == "Extreme (vs Blockbuster)": comp_mult = 0.7
-
-    raw_prediction = (base + star_power_add + production_add) * ip_mult * season_mult * rating_mult * comp_mult
-    return raw_prediction
-
-# --- DATASETS ---
-upcoming_data = {
-    "Wicked: Part Two (Nov 21)": {
-        "type": "upcoming", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
-        "aware": 92, "interest": 62, "theaters": 4200, "buzz": 1.6, "comp": 0.8, 
-        "wiki": "Wicked_(2024_film)", "yt_id": "vt98AlBDI9Y", "yt_fallback": 113000000,
-        "rt_slug": "wicked_part_two", "source_label": "Official Trailer", "source_status": "success",
-        "tracking_source": "Real Data (The Quorum)", "competitors": "Rental Family, Gladiator II",
-        "market_demand": "Normal", "popcorn_est": 97, "simple_name": "Wicked Part Two",
-        "intl_multiplier": 1.6, "benchmarks": {"Wicked: Part One": 114.0, "Frozen II": 130.0, "Barbie": 162.0},
-        "poly_slug": "wicked-for-good-opening-weekend-box-office"
-    },
-    "Eternity (Nov 26)": {
-        "type": "upcoming", "studio_type": "Cult / Indie (A24/Neon)", "release_format": "5-Day Holiday (Wed-Sun)",
-        "aware": 21, "interest": 34, "theaters": 2400, "buzz": 1.2, "comp": 0.85, 
-        "wiki": "Eternity_(2025_film)", "yt_id": "irXTps1REHU", "yt_fallback": 9300000,
-        "rt_slug": "eternity_2025", "source_label": "Official Trailer", "source_status": "success",
-        "tracking_source": "Real Data (The Quorum)", "competitors": "Zootopia 2 (Direct)",
-        "market_demand": "Normal", "popcorn_est": 88, "simple_name": "Eternity A24",
-        "intl_multiplier": 1.8, "benchmarks": {"Priscilla": 5.0, "Age of Adaline": 13.2, "Me Before You": 18.7}
-    },
-    "Zootopia 2 (Nov 26)": {
-        "type": "upcoming", "studio_type": "Major Franchise (Animation)", "release_format": "5-Day Holiday (Wed-Sun)",
-        "aware": 68, "interest": 53, "theaters": 4300, "buzz": 1.3, "comp": 0.8, 
-        "wiki": "Zootopia_2", "yt_id": "xo4rkcC7kFc", "yt_fallback": 25000000,
-        "rt_slug": "zootopia_2", "source_label": "Official Trailer", "source_status": "success",
-        "tracking_source": "Real Data (The Quorum)", "competitors": "Eternity",
-        "market_demand": "Pent-up / Starved", "popcorn_est": 94, "simple_name": "Zootopia 2",
-        "intl_multiplier": 2.8, "benchmarks": {"Inside Out 2": 154.0, "Super Mario Bros": 146.0, "Moana": 56.6},
-        "poly_slug": "zootopia-2-5-day-opening-box-office"
-    },
-    "Rental Family (Nov 21)": {
-        "type": "upcoming", "studio_type": "Cult / Indie (A24/Neon)", "release_format": "Standard 3-Day",
-        "aware": 15, "interest": 25, "theaters": 1500, "buzz": 1.1, "comp": 0.7, 
-        "wiki": "Rental_Family", "yt_id": "sZT37sM2VgE", "yt_fallback": 5000000, 
-        "rt_slug": "rental_family", "source_label": "Official Trailer", "source_status": "success",
-        "tracking_source": "Estimated (Searchlight Comps)", "competitors": "Wicked: Part Two (Direct)",
-        "market_demand": "Normal", "popcorn_est": 85, "simple_name": "Rental Family",
-        "intl_multiplier": 1.4, "benchmarks": {"The Menu": 9.0, "Next Goal Wins": 2.5}
-    },
-    "Five Nights at Freddy's 2 (Dec 5)": {
-        "type": "upcoming", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
-        "aware": 85, "interest": 60, "theaters": 3800, "buzz": 1.6, "comp": 0.9, 
-        "wiki": "Five_Nights_at_Freddy's_2_(film)", "yt_id": "0VH9WCFV6Xw", "yt_fallback": 45000000,
-        "rt_slug": "five_nights_at_freddys_2", "source_label": "Proxy (FNAF 1 Data)", "source_status": "warning",
-        "tracking_source": "Estimated (Fan Event)", "competitors": "Wicked Part 2 (Holdover)",
-        "market_demand": "Normal", "popcorn_est": 89, "simple_name": "Five Nights at Freddy's 2",
-        "intl_multiplier": 1.7, "benchmarks": {"FNAF 1": 80.0, "Halloween": 76.2, "M3GAN": 30.4}
-    },
-    "Avatar: Fire and Ash (Dec 19)": {
-        "type": "upcoming", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
-        "aware": 95, "interest": 85, "theaters": 4500, "buzz": 1.8, "comp": 1.0, 
-        "wiki": "Avatar:_Fire_and_Ash", "yt_id": "d9MyqF3xZSo", "yt_fallback": 60000000, 
-        "rt_slug": "avatar_fire_and_ash", "source_label": "Proxy Data", "source_status": "warning",
-        "tracking_source": "Hypothetical", "competitors": "SpongeBob Movie",
-        "market_demand": "Pent-up / Starved", "popcorn_est": 96, "simple_name": "Avatar Fire and Ash",
-        "intl_multiplier": 3.5, "benchmarks": {"Avatar: Way of Water": 134.1, "Endgame": 357.0}
-    },
-    "SpongeBob Movie (Dec 19)": {
-        "type": "upcoming", "studio_type": "Major Franchise (Animation)", "release_format": "Standard 3-Day",
-        "aware": 90, "interest": 55, "theaters": 4000, "buzz": 1.3, "comp": 0.85, 
-        "wiki": "The_SpongeBob_Movie:_Search_for_SquarePants", "yt_id": "wFx7DRIKaig", "yt_fallback": 15000000,
-        "rt_slug": "the_spongebob_movie_search_for_squarepants", "source_label": "Official Trailer", "source_status": "success",
-        "tracking_source": "Real Data (Quorum Proxy)", "competitors": "Avatar 3, Sonic 3",
-        "market_demand": "Normal", "popcorn_est": 91, "simple_name": "SpongeBob Search for SquarePants",
-        "intl_multiplier": 2.3, "benchmarks": {"Sponge Out of Water": 55.3, "Kung Fu Panda 4": 57.9}
-    },
-    "Marty Supreme (Dec 25)": {
-        "type": "upcoming", "studio_type": "Cult / Indie (A24/Neon)", "release_format": "4-Day Holiday (Fri-Mon)", 
-        "aware": 30, "interest": 40, "theaters": 3200, "buzz": 1.3, "comp": 0.9, 
-        "wiki": "Marty_Supreme", "yt_id": "s9gSuKaKcqM", "yt_fallback": 17800000,
-        "rt_slug": "marty_supreme", "source_label": "Official Trailer", "source_status": "success",
-        "tracking_source": "Estimated (Uncut Gems Comps)", "competitors": "Avatar: Fire and Ash, SpongeBob",
-        "market_demand": "Normal", "popcorn_est": 82, "simple_name": "Marty Supreme",
-        "intl_multiplier": 1.8, "benchmarks": {"Uncut Gems (Wide)": 9.6, "Lady Bird (Wide)": 5.3, "Challengers": 15.0}
-    },
-    "The Housemaid (Early 2026)": {
-        "type": "upcoming", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
-        "aware": 35, "interest": 40, "theaters": 3000, "buzz": 1.2, "comp": 0.85, 
-        "wiki": "The_Housemaid_(2025_film)", "yt_id": "7rZEsxySFPw", "yt_fallback": 8000000, 
-        "rt_slug": "the_housemaid_2025", "source_label": "Teaser / Proxy", "source_status": "warning",
-        "tracking_source": "Estimated (Thriller Comps)", "competitors": "Heavy Thriller Slate",
-        "market_demand": "Normal", "popcorn_est": 75, "simple_name": "The Housemaid",
-        "intl_multiplier": 1.5, "benchmarks": {"A Simple Favor": 16.0, "Don't Worry Darling": 19.3}
-    },
-    "Pillion (2026)": {
-        "type": "upcoming", "studio_type": "Cult / Indie (A24/Neon)", "release_format": "Standard 3-Day",
-        "aware": 10, "interest": 20, "theaters": 800, "buzz": 1.0, "comp": 0.95, 
-        "wiki": "Pillion_(film)", "yt_id": "aTAacTUKK00", "yt_fallback": 500000,
-        "rt_slug": "pillion", "source_label": "Teaser / First Look", "source_status": "success",
-        "tracking_source": "Estimated (Arthouse Niche)", "competitors": "Limited Release Competition",
-        "market_demand": "Normal", "popcorn_est": 78, "simple_name": "Pillion",
-        "intl_multiplier": 1.5, "benchmarks": {"Past Lives (Wide)": 5.8, "The Whale (Wide)": 11.0, "Moonlight (Wide)": 1.5}
-    },
-    "The Moment (2026)": {
-        "type": "upcoming", "studio_type": "Cult / Indie (A24/Neon)", "release_format": "Standard 3-Day",
-        "aware": 15, "interest": 25, "theaters": 2000, "buzz": 1.1, "comp": 0.9, 
-        "wiki": "The_Moment_(2026_film)", "yt_id": "ey5YrCNH09g", "yt_fallback": 1500000,
-        "rt_slug": "the_moment_2026", "source_label": "Official Trailer", "source_status": "success",
-        "tracking_source": "Estimated (Sci-Fi Comps)", "competitors": "Project Hail Mary",
-        "market_demand": "Normal", "popcorn_est": 84, "simple_name": "The Moment A24",
-        "intl_multiplier": 2.0, "benchmarks": {"Ex Machina (Wide)": 5.4, "After Yang": 0.04, "Her (Wide)": 5.3}
-    },
-    "Elden Ring (TBD)": {
-        "type": "upcoming", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
-        "aware": 60, "interest": 45, "theaters": 4000, "buzz": 1.4, "comp": 0.8, 
-        "wiki": "Elden_Ring", "yt_id": "E3Huy2cdih0", "yt_fallback": 14000000,
-        "rt_slug": None, "source_label": "Proxy (Game Trailer)", "source_status": "warning",
-        "tracking_source": "Hypothetical (Gamer Comps)", "competitors": "Direct-to-Fan Event",
-        "market_demand": "Pent-up / Starved", "popcorn_est": 92, "simple_name": "Elden Ring Movie",
-        "intl_multiplier": 2.2, "benchmarks": {"Dune: Part One": 41.0, "Five Nights at Freddy's": 80.0, "Uncharted": 44.0}
-    }
-}
-
-historical_data = {
-    "Superman (Jul '25)": {
-        "type": "historical", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
-        "actual_opening": 115.0, "aware": 85, "interest": 65, "theaters": 4200, "buzz": 1.4, "comp": 0.9, 
-        "wiki": "Superman_(2025_film)", "yt_id": "v7s5d4pG2eM", "yt_fallback": 30000000, "frozen_views": 30000000,
-        "rt_slug": "superman_2025", "source_label": "Simulated Historical", "source_status": "neutral",
-        "tracking_source": "Estimated", "competitors": "Fantastic Four",
-        "market_demand": "Normal", "popcorn_est": 88, "simple_name": "Superman 2025",
-        "intl_multiplier": 2.2, "benchmarks": {"Actual Opening (Sim)": 115.0, "Man of Steel": 116.6}
-    },
-    # ... (Concise historical data preserved)
-    "A Minecraft Movie (Apr '25)": {
-        "type": "historical", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
-        "actual_opening": 145.0, "aware": 90, "interest": 55, "theaters": 4300, "buzz": 1.6, "comp": 0.85, 
-        "wiki": "A_Minecraft_Movie", "yt_id": "jTq91k43nDQ", "yt_fallback": 45000000, "frozen_views": 45000000,
-        "rt_slug": "a_minecraft_movie", "source_label": "Simulated Historical", "source_status": "neutral",
-        "tracking_source": "Real Data", "competitors": "Micheal", "market_demand": "Normal", "popcorn_est": 90, "simple_name": "Minecraft Movie",
-        "intl_multiplier": 2.2, "benchmarks": {"Actual Opening (Sim)": 145.0, "Super Mario Bros": 146.3}
-    },
-    "Civil War (Apr '24)": {
-        "type": "historical", "studio_type": "Cult / Indie (A24/Neon)", "release_format": "Standard 3-Day",
-        "actual_opening": 25.7, "aware": 48, "interest": 42, "theaters": 3838, "buzz": 1.3, "comp": 0.9, 
-        "wiki": "Civil_War_(film)", "yt_id": "aDyQxtgKWbs", "yt_fallback": 22000000, "frozen_views": 16000000,
-        "rt_slug": "civil_war_2024", "source_label": "Historical Data", "source_status": "neutral",
-        "tracking_source": "Historical NRG", "competitors": "Godzilla x Kong", "market_demand": "Normal", "popcorn_est": 70, "simple_name": "Civil War A24",
-        "intl_multiplier": 1.8, "benchmarks": {"Actual Opening": 25.7, "Ex Machina": 6.8}
-    },
-    "Five Nights at Freddy's (Oct '23)": {
-        "type": "historical", "release_format": "Standard 3-Day", "actual_opening": 80.0,
-        "aware": 60, "interest": 55, "theaters": 3675, "buzz": 1.6, "comp": 0.9, "studio_type": "Major Franchise",
-        "wiki": "Five_Nights_at_Freddy's_(film)", "yt_id": "0VH9WCFV6Xw", "yt_fallback": 50000000, "frozen_views": 25000000,
-        "rt_slug": "five_nights_at_freddys", "source_label": "Historical Data", "source_status": "neutral",
-        "tracking_source": "Historical NRG", "competitors": "Eras Tour",
-        "market_demand": "Pent-up / Starved", "popcorn_est": 87, "simple_name": "FNAF Movie",
-        "intl_multiplier": 1.8, "benchmarks": {"Actual Opening": 80.0, "Halloween": 76.2}
-    },
-    "Barbie (Jul '23)": {
-        "type": "historical", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
-        "actual_opening": 162.0,
-        "aware": 95, "interest": 75, "theaters": 4243, "buzz": 1.8, "comp": 0.8, 
-        "wiki": "Barbie_(film)", "yt_id": "pBk4NYhWNMM", "yt_fallback": 80000000, "frozen_views": 45000000,
-        "rt_slug": "barbie", "source_label": "Historical Data", "source_status": "neutral",
-        "tracking_source": "Historical NRG", "competitors": "Oppenheimer",
-        "market_demand": "Pent-up / Starved", "popcorn_est": 83, "simple_name": "Barbie Movie",
-        "intl_multiplier": 2.1, "benchmarks": {"Actual Opening": 162.0, "Mario Bros": 146.3}
-    }
+"""
+
+# Starting slate for the window planner; the table is editable in the app.
+PLANNER_SLATE = {
+    "title": ["Franchise Sequel", "Family Original", "Studio Horror", "Prestige Drama", "Game Adaptation", "Star Comedy"],
+    "genre": ["Action/Adventure", "Family/Animation", "Horror", "Drama", "Sci-Fi", "Comedy"],
+    "cast_score": [60, 25, 10, 30, 20, 45],
+    "budget": [200, 150, 15, 40, 120, 50],
+    "rating": ["PG-13", "PG", "R", "R", "PG-13", "PG-13"],
+    "ip_status": ["Sequel (Major Franchise)", "Original", "Original", "Adaptation (Book/Game)", "Adaptation (Book/Game)", "Original"],
 }
 
 # --- VIEW 1: LONG LEAD ---
@@ -463,6 +139,8 @@ def render_long_lead():
     prediction = calculate_long_lead(genre, cast_score, budget, rating, ip_status, season, competition)
     low_end = prediction * 0.75
     high_end = prediction * 1.25
+    comps = find_comps(genre, budget, cast_score, rating, ip_status, season)
+    comps_estimate = comps_forecast(comps["opening"], comps["distance"])
 
     col1, col2 = st.columns([1, 1.5])
     with col1:
@@ -473,6 +151,10 @@ def render_long_lead():
             <h3 style="margin: 0; color: #0F172A;">${low_end:.1f}M — ${high_end:.1f}M</h3>
         </div>
         """, unsafe_allow_html=True)
+        if comps_estimate:
+            comps_mid, comps_low, comps_high = comps_estimate
+            st.metric("Comps-Weighted Opening", f"${comps_mid:.1f}M", f"{comps_mid - prediction:+.1f}M vs model", delta_color="off")
+            st.caption(f"Middle half of the {len(comps)} nearest comps: ${comps_low:.1f}M — ${comps_high:.1f}M")
 
     with col2:
         breakdown_data = pd.DataFrame({
@@ -489,25 +171,144 @@ def render_long_lead():
 
     st.markdown("---")
     st.markdown("#### 🎞️ Historical Comps (Automatic)")
-    comps_db = [
-        {"Title": "M3GAN", "Genre": "Horror", "Budget": 12, "Opening": 30.4},
-        {"Title": "Smile", "Genre": "Horror", "Budget": 17, "Opening": 22.6},
-        {"Title": "Dune", "Genre": "Sci-Fi", "Budget": 165, "Opening": 41.0},
-        {"Title": "Air", "Genre": "Drama", "Budget": 90, "Opening": 14.4},
-        {"Title": "Challengers", "Genre": "Drama", "Budget": 55, "Opening": 15.0},
-        {"Title": "Bullet Train", "Genre": "Action/Adventure", "Budget": 90, "Opening": 30.0},
-        {"Title": "John Wick 4", "Genre": "Action/Adventure", "Budget": 100, "Opening": 73.8},
-        {"Title": "Anyone But You", "Genre": "Comedy", "Budget": 25, "Opening": 6.0},
-    ]
-    filtered_comps = [m for m in comps_db if m['Genre'] == genre and abs(m['Budget'] - budget) < 80]
-    if filtered_comps:
-        df_comps = pd.DataFrame(filtered_comps)
-        st.dataframe(df_comps, use_container_width=True)
+    if len(comps):
+        table = comps[["title", "release_date", "genre", "rating", "ip_status", "budget", "cast_score", "opening", "distance"]]
+        table.columns = ["Title", "Released", "Genre", "Rating", "IP", "Budget", "Cast", "Opening", "Distance"]
+        st.dataframe(table, use_container_width=True, hide_index=True, column_config={"Distance": st.column_config.NumberColumn(format="%.2f")})
     else:
         st.info("No direct comps found in database.")
 
+    st.markdown("---")
+    st.markdown("#### 🗓️ Slate Window Planner")
+    st.caption("Place a whole slate into weekly release windows so the films don't cannibalize each other.")
+    films = st.data_editor(pd.DataFrame(PLANNER_SLATE), num_rows="dynamic", hide_index=True, use_container_width=True, column_config={
+        "genre": st.column_config.SelectboxColumn("Genre", options=list(GENRE_BASELINES), required=True),
+        "rating": st.column_config.SelectboxColumn("Rating", options=["PG-13", "R", "PG", "G"], required=True),
+        "ip_status": st.column_config.SelectboxColumn("IP", options=list(IP_MULTS), required=True),
+        "budget": st.column_config.NumberColumn("Budget ($M)", min_value=5, max_value=300, required=True),
+        "cast_score": st.column_config.NumberColumn("Cast ($M)", min_value=0, max_value=150, required=True),
+    })
+    col_start, col_weeks = st.columns(2)
+    with col_start: start = st.date_input("First Window")
+    with col_weeks: weeks = st.slider("Weeks", 4, 52, 52)
+    if st.button("Plan Release Windows") and len(films.dropna()):
+        result = plan_windows(films.dropna().set_index("title"), start, weeks)
+        plan, marginal = result["plan"], result["marginal"]
+        # Each film's best alternative window, and what moving it there alone would cost.
+        alternatives = marginal.mask(marginal.columns.to_numpy()[None, :] == plan["date"].to_numpy()[:, None])
+        st.metric("Slate Opening", f"${result['total']:.1f}M", f"{result['total'] - plan['clear_opening'].sum():+.1f}M vs all clear weekends", delta_color="off")
+        st.dataframe(pd.DataFrame({
+            "Title": plan.index, "Window": plan["date"].dt.date, "Season": plan["season"], "Crowdedness": plan["competition_level"],
+            "Opening ($M)": plan["opening"], "Next Best Window": alternatives.idxmax(axis=1).dt.date.to_numpy(),
+            "Cost to Move ($M)": 0.0 - alternatives.max(axis=1).to_numpy(),
+        }).sort_values("Window"), hide_index=True, use_container_width=True, column_config={
+            "Opening ($M)": st.column_config.NumberColumn(format="$%.1f"), "Cost to Move ($M)": st.column_config.NumberColumn(format="$%.1f"),
+        })
+
+@st.cache_data(max_entries=16)
+def plan_windows(films, start, weeks):
+    return optimize_windows(films, weekly_windows(start, weeks))
+
 
 # --- VIEW 2: TRACKER ---
+@functools.lru_cache(maxsize=1024)
+def forecast(**model_inputs):
+    # Slider values are hashable scalars, so revisiting a setting skips the engine.
+    return calculate_box_office(**model_inputs)
+
+@functools.lru_cache(maxsize=64)
+def benchmark_spec(benchmarks, actual=None):
+    """Vega-Lite spec of the (title, $M) benchmark pairs plus a PREDICTION bar to fill in.
+
+    Built once per title: `to_dict()` is most of the chart's cost, so reruns only swap
+    the prediction into the inlined rows (see benchmark_chart).
+    """
+    chart_data = dict(benchmarks)
+    chart_data["PREDICTION"] = 0.0
+    if actual is not None: chart_data["ACTUAL"] = actual
+
+    df = pd.DataFrame({"Movie": list(chart_data.keys()), "Gross": list(chart_data.values())})
+
+    def get_color(movie):
+        if movie == 'PREDICTION': return '#18181B'
+        if movie == 'ACTUAL': return '#10B981'
+        return '#E4E4E7'
+
+    df['Color'] = df['Movie'].apply(get_color)
+
+    base = alt.Chart(df).encode(x=alt.X('Gross', title='Opening ($M)', axis=alt.Axis(grid=False)), y=alt.Y('Movie', sort='-x', title=None))
+    bars = base.mark_bar().encode(color=alt.Color('Color', scale=None))
+    text = base.mark_text(align='left', dx=3).encode(text=alt.Text('Gross', format=',.1f'))
+    return (bars + text).properties(height=300).configure_view(strokeWidth=0).to_dict()
+
+def benchmark_chart(benchmarks, prediction, actual=None):
+    spec = benchmark_spec(benchmarks, actual)
+    datasets = {name: [{**row, "Gross": prediction} if row["Movie"] == "PREDICTION" else row for row in rows]
+                for name, rows in spec["datasets"].items()}
+    return {**spec, "datasets": datasets}
+
+@st.fragment
+def render_sensitivity(inputs, base_opening):
+    st.markdown("#### 🌪️ What Moves This Forecast")
+    swings = tornado(sweep_one_at_a_time(inputs), base_opening)
+    swings["Input"] = swings["input"].map(lambda name: SWEEP_RANGES[name][0])
+    bars = pd.concat([
+        pd.DataFrame({"Input": swings["Input"], "Change": swings["down"] / 1_000_000, "Direction": "Down"}),
+        pd.DataFrame({"Input": swings["Input"], "Change": swings["up"] / 1_000_000, "Direction": "Up"}),
+    ])
+    chart = alt.Chart(bars).mark_bar().encode(
+        x=alt.X('Change', title='Opening change across slider range ($M)'),
+        y=alt.Y('Input', sort=list(swings["Input"]), title=None),
+        color=alt.Color('Direction', scale=alt.Scale(domain=['Down', 'Up'], range=['#94A3B8', '#18181B']), legend=None),
+        tooltip=['Input', alt.Tooltip('Change', format=',.1f')])
+    st.altair_chart(chart.properties(height=260).configure_view(strokeWidth=0), use_container_width=True)
+
+    names = list(SWEEP_RANGES)
+    col_x, col_y = st.columns(2)
+    with col_x: x = st.selectbox("Grid X", names, index=0, format_func=lambda name: SWEEP_RANGES[name][0])
+    with col_y: y = st.selectbox("Grid Y", [name for name in names if name != x], index=0, format_func=lambda name: SWEEP_RANGES[name][0])
+    grid = sweep_grid(inputs, x, y)
+    grid["Opening"] = grid["opening"] / 1_000_000
+    grid["Domestic"] = grid["dom_total"] / 1_000_000
+    col_open, col_dom = st.columns(2)
+    for col, metric in ((col_open, "Opening"), (col_dom, "Domestic")):
+        heatmap = alt.Chart(grid).mark_rect().encode(
+            x=alt.X(f'{x}:O', title=SWEEP_RANGES[x][0], axis=alt.Axis(labelOverlap=True, format=',.2~f')),
+            y=alt.Y(f'{y}:O', title=SWEEP_RANGES[y][0], sort='descending', axis=alt.Axis(labelOverlap=True, format=',.2~f')),
+            color=alt.Color(metric, title=f'{metric} ($M)', scale=alt.Scale(scheme='greys')),
+            tooltip=[x, y, alt.Tooltip(metric, format=',.1f')])
+        with col:
+            st.caption(f"{metric} ($M)")
+            st.altair_chart(heatmap.properties(height=300), use_container_width=True)
+
+@st.fragment
+def render_monte_carlo(inputs):
+    col_n, col_seed = st.columns(2)
+    with col_n: n = st.number_input("Samples", 10_000, 2_000_000, value=100_000, step=50_000)
+    with col_seed: seed = st.number_input("Seed", 0, 2**31 - 1, value=7)
+    sim = simulate_box_office(inputs, n=int(n), seed=int(seed))
+    opening = sim["opening"]
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1: st.metric("P10 Opening", f"${opening['p10']/1_000_000:.2f}M")
+    with col2: st.metric("P50 Opening", f"${opening['p50']/1_000_000:.2f}M")
+    with col3: st.metric("P90 Opening", f"${opening['p90']/1_000_000:.2f}M")
+    with col4: st.metric("P50 Domestic", f"${sim['dom_total']['p50']/1_000_000:.2f}M")
+
+    # Re-bin the fine histogram to ~60 bars between the 1st and 99th percentiles.
+    counts = sim["opening_counts"]
+    cdf = np.cumsum(counts) / counts.sum()
+    lo, hi = int(np.searchsorted(cdf, 0.01)), int(np.searchsorted(cdf, 0.99)) + 1
+    starts = np.arange(lo, hi, max((hi - lo) // 60, 1))
+    mids = np.sqrt(MC_BIN_EDGES[starts] * MC_BIN_EDGES[np.minimum(starts + max((hi - lo) // 60, 1), len(MC_BIN_EDGES) - 1)])
+    df = pd.DataFrame({"Opening": mids / 1_000_000, "Samples": np.add.reduceat(counts[lo:hi], starts - lo)})
+    bars = alt.Chart(df).mark_bar(color='#E4E4E7').encode(
+        x=alt.X('Opening', title='Opening ($M)', axis=alt.Axis(grid=False)), y=alt.Y('Samples', title=None))
+    marks = pd.DataFrame({"Opening": [opening[p] / 1_000_000 for p in ("p10", "p50", "p90")], "Label": ["P10", "P50", "P90"]})
+    rules = alt.Chart(marks).mark_rule(color='#18181B').encode(x='Opening', tooltip=['Label', alt.Tooltip('Opening', format=',.1f')])
+    st.altair_chart((bars + rules).properties(height=250).configure_view(strokeWidth=0), use_container_width=True)
+
+
 def render_tracker(dataset, mode_title):
     st.title(mode_title)
     st.markdown("---")
@@ -515,24 +316,35 @@ def render_tracker(dataset, mode_title):
     selected_preset = st.selectbox("Select Project:", list(dataset.keys()), index=0)
     data = dataset[selected_preset]
     
-    live_wiki, live_yt, live_rt, live_poly, live_manifold = get_live_data(
-        data['wiki'], 
-        data['yt_id'], 
-        data['yt_fallback'], 
-        data['rt_slug'],
-        data.get('simple_name', 'Movie'),
-        data.get('frozen_views'),
-        data.get('poly_slug')
-    )
-
-    # Sidebar
+    live = live_data_for(data)
+    render_signals(data, live)
+    # Historical titles keep their recorded comp; the calendar only holds the upcoming slate.
+    calendar_comp = calendar_competition(dataset).get(selected_preset) if data.get('type') == 'upcoming' else None
+    rivals = release_calendar.rivals(selected_preset) if calendar_comp is not None else []
+    render_model(data, live, calendar_comp, rivals)
+
+
+def render_signals(data, live):
+    """Sidebar signal readouts. Only full reruns (preset or page change) reach this."""
+    live_wiki, live_yt, live_rt, live_poly, live_manifold, signal_report = live
     st.sidebar.markdown("### 📡 Live Signals")
     badge_class = "status-success" if data['source_status'] == "success" else "status-neutral"
     st.sidebar.markdown(f'<span class="status-badge {badge_class}">{data["source_label"]}</span>', unsafe_allow_html=True)
     
     col_a, col_b = st.sidebar.columns(2)
-    with col_a: st.sidebar.metric("Wiki Views", f"{live_wiki:,}", help="30-Day Avg")
+    wiki_trend = wiki_features(data['wiki'])
+    wiki_delta = f"{wiki_trend['wow_growth']:+.0%} WoW" if wiki_trend['wow_growth'] is not None else None
+    with col_a: st.sidebar.metric("Wiki Views", f"{live_wiki:,}", wiki_delta, help="30-Day Avg; delta is week-over-week growth")
     with col_b: st.sidebar.metric("Trailer Views", f"{live_yt/1000000:.1f}M")
+    if wiki_trend['momentum'] is not None:
+        st.sidebar.caption(f"Wiki 7-day avg {wiki_trend['avg_7']:,.0f} · momentum {wiki_trend['momentum']:.2f}x the 30-day avg")
+
+    status_icons = {"ok": "✅", "cached": "💾", "stale": "♻️", "miss": "❔", "empty": "➖", "skipped": "⏭️", "backoff": "⏸️", "timeout": "⏱️", "error": "❌"}
+    with st.sidebar.expander("Fetch Report"):
+        for source, outcome in signal_report.items():
+            detail = f" ({outcome['error']})" if outcome['error'] else ""
+            if outcome['age']: detail += f" · {outcome['age']/60:.0f}m old"
+            st.caption(f"{status_icons[outcome['status']]} **{source}** · {outcome['status']}{detail} · {outcome['ms']:.0f}ms")
     
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 🔮 Prediction Markets")
@@ -552,12 +364,19 @@ def render_tracker(dataset, mode_title):
         st.sidebar.info(f"🧠 Manifold Crowd Forecast")
         st.sidebar.markdown(f"**{live_manifold['prob']}%** Probability")
         st.sidebar.link_button("View on Manifold", live_manifold['url'])
-        
+
+
+@st.fragment
+def render_model(data, live, calendar_comp=None, rivals=()):
+    """Inputs, forecast and chart. Widget changes rerun only this fragment, not the fetch."""
+    live_wiki, live_yt, live_rt, live_poly, live_manifold, signal_report = live
+
     # HSX & BETTING
     hsx_price = st.sidebar.number_input("HSX Price (H$)", 0.0, 500.0, value=0.0, help="Enter current Delist Price")
     
     st.sidebar.markdown("---")
     st.sidebar.caption("Model Tuning")
+    st.sidebar.caption(f"Coefficients: calibrated v{MODEL_PARAMS_VERSION}" if MODEL_PARAMS_VERSION else "Coefficients: defaults")
     studio_type = st.sidebar.selectbox("Studio / Brand Profile", ["Major Franchise", "Cult / Indie (A24/Neon)", "Major Franchise (Animation)"], index=0 if data.get("studio_type") == "Major Franchise" else 1)
     
     st.sidebar.markdown("### 🎛️ Model Inputs")
@@ -570,10 +389,14 @@ def render_tracker(dataset, mode_title):
     interest = st.sidebar.slider("Definite Interest (%)", 0, 100, value=data['interest'])
     
     st.sidebar.markdown("---")
-    if live_rt:
+    # A score of 0 is a real score; only a missing one falls back.
+    if live_rt is not None:
         rt_label = f"Rotten Tomatoes (Live)"
         rt_default = live_rt
         st.sidebar.success(f"✅ Live Score: {live_rt}%")
+    elif data.get('rt_recorded') is not None:
+        rt_label = "Rotten Tomatoes (Recorded)"
+        rt_default = data['rt_recorded']
     else:
         rt_label = "Estimated RT Score"
         rt_default = 70
@@ -585,8 +408,13 @@ def render_tracker(dataset, mode_title):
     
     st.sidebar.markdown("---")
     buzz = st.sidebar.slider("Social Buzz Multiplier", 0.5, 2.0, value=float(data['buzz']))
-    comp = st.sidebar.slider("Competition Factor", 0.5, 1.0, value=float(data['comp']))
-    st.sidebar.caption(f"**Opening Against:** {data['competitors']}")
+    if calendar_comp is None:
+        comp = st.sidebar.slider("Competition Factor", 0.5, 1.0, value=float(data['comp']))
+        st.sidebar.caption(f"**Opening Against:** {data['competitors']}")
+    else:
+        comp = st.sidebar.slider("Competition Factor (Calendar)", 0.5, 1.0, value=round(calendar_comp, 2), help=f"Hand-set preset: {data['comp']}")
+        against = ", ".join(f"{rival} ({'opening' if week == 1 else f'wk {week} holdover'})" for rival, week, _ in rivals[:3]) or "No wide releases"
+        st.sidebar.caption(f"**Opening Against:** {against}")
     
     demand_index = 1
     if data.get('market_demand') == "Pent-up / Starved": demand_index = 2
@@ -594,9 +422,11 @@ def render_tracker(dataset, mode_title):
     market_demand = st.sidebar.selectbox("Market Demand", ["Saturated / Crowded", "Normal", "Pent-up / Starved"], index=demand_index)
 
     # Calculations
-    opening, extended, dom_total, global_total = calculate_box_office(
-        interest, total_aware, theaters, rt_score, popcorn_score, buzz, comp, live_yt, data['intl_multiplier'], studio_type, market_demand, data.get('release_format', 'Standard 3-Day')
-    )
+    model_inputs = dict(
+        interest=interest, total_aware=total_aware, theaters=theaters, rt_score=rt_score, popcorn_score=popcorn_score,
+        buzz=buzz, comp=comp, trailer_views=live_yt, intl_multiplier=data['intl_multiplier'], studio_type=studio_type,
+        market_demand=market_demand, release_format=data.get('release_format', 'Standard 3-Day'))
+    opening, extended, dom_total, global_total = forecast(**model_inputs)
 
     # Output
     if data.get('type') == 'historical':
@@ -635,36 +465,159 @@ def render_tracker(dataset, mode_title):
         if live_poly and "outcome" in live_poly:
              st.info(f"🔮 **Market Validation:** Polymarket favors **{live_poly['outcome']}** ({live_poly['prob']}%)")
 
+    if st.toggle("🎲 Monte Carlo Range", help="Sample awareness, interest, RT, popcorn, buzz and competition around the slider values."):
+        render_monte_carlo(model_inputs)
+    if st.toggle("🌪️ Sensitivity Sweep", help="Sweep every input across its slider range in one batched pass."):
+        render_sensitivity(model_inputs, opening)
+
     st.markdown("---")
     
     # Chart
     col_chart, col_info = st.columns([2, 1])
     with col_chart:
         st.markdown(f"#### 📊 Benchmark Comparison")
-        chart_data = data['benchmarks'].copy()
-        chart_data["PREDICTION"] = opening / 1_000_000
-        if data.get('type') == 'historical': chart_data["ACTUAL"] = data['actual_opening']
-        
-        df = pd.DataFrame({"Movie": list(chart_data.keys()), "Gross": list(chart_data.values())})
-        
-        def get_color(movie):
-            if movie == 'PREDICTION': return '#18181B'
-            if movie == 'ACTUAL': return '#10B981'
-            return '#E4E4E7'
-        
-        df['Color'] = df['Movie'].apply(get_color)
-        
-        base = alt.Chart(df).encode(x=alt.X('Gross', title='Opening ($M)', axis=alt.Axis(grid=False)), y=alt.Y('Movie', sort='-x', title=None))
-        bars = base.mark_bar().encode(color=alt.Color('Color', scale=None))
-        text = base.mark_text(align='left', dx=3).encode(text=alt.Text('Gross', format=',.1f'))
-        st.altair_chart((bars + text).properties(height=300).configure_view(strokeWidth=0), use_container_width=True)
+        actual = data['actual_opening'] if data.get('type') == 'historical' else None
+        st.vega_lite_chart(benchmark_chart(tuple(data['benchmarks'].items()), opening / 1_000_000, actual), use_container_width=True)
+
+# --- VIEW 3: SLATE ---
+def signal_freshness(report):
+    ages = [outcome['age'] for outcome in report.values() if outcome['age'] is not None]
+    failed = [source for source, outcome in report.items() if outcome['status'] in ("error", "timeout", "backoff")]
+    stale = [source for source, outcome in report.items() if outcome['status'] == "stale"]
+    label = f"{max(ages)/60:.0f}m" if ages else "—"
+    if stale: label += f" · {len(stale)} refreshing"
+    if failed: label += f" · {', '.join(failed)} failed"
+    return label
+
+def render_slate(dataset):
+    st.title("🗂️ Slate Dashboard")
+    st.caption("Every tracked title at its preset inputs and live signals. Click a column header to sort.")
+    st.markdown("---")
+
+    started = time.perf_counter()
+    live = prefetch_live_data(dataset)
+    slate = score_slate(dataset, live)
+    runs = project_slate_runs(slate)
+    calendar_comp = calendar_competition(dataset)
+    elapsed = time.perf_counter() - started
+
+    table = pd.DataFrame({
+        "Title": slate.index,
+        "Opening ($M)": slate["opening"] / 1_000_000,
+        "Extended ($M)": slate["extended"] / 1_000_000,
+        "Domestic ($M)": slate["dom_total"] / 1_000_000,
+        "Global ($M)": slate["global_total"] / 1_000_000,
+        "Week 3 ($M)": runs[3] / 1_000_000,
+        "Calendar Comp": [calendar_comp.get(title) for title in slate.index],
+        "RT": slate["rt_score"],
+        "Trailer Views (M)": slate["trailer_views"] / 1_000_000,
+        "Signal Age": [signal_freshness(live[title][5]) for title in slate.index],
+    }).sort_values("Opening ($M)", ascending=False)
+
+    col1, col2, col3 = st.columns(3)
+    with col1: st.metric("Titles", len(table))
+    with col2: st.metric("Slate Opening", f"${table['Opening ($M)'].sum():.1f}M")
+    with col3: st.metric("Slate Domestic", f"${table['Domestic ($M)'].sum():.1f}M")
+
+    money = st.column_config.NumberColumn(format="$%.1f")
+    st.dataframe(table, hide_index=True, use_container_width=True, column_config={
+        "Opening ($M)": money, "Extended ($M)": money, "Domestic ($M)": money, "Global ($M)": money, "Week 3 ($M)": money,
+        "Trailer Views (M)": st.column_config.NumberColumn(format="%.1f"),
+        "Calendar Comp": st.column_config.NumberColumn(format="%.2f", help="Competition factor from overlapping wide releases on the release calendar"),
+    })
+    st.caption(f"Signals for {len(dataset)} titles resolved in {elapsed:.2f}s. Signal Age is the oldest cached source per title.")
+
+    st.markdown("### 📆 Release Calendar")
+    weeks = release_calendar.frame().assign(gross=lambda f: f["gross"] / 1_000_000)
+    st.bar_chart(weeks, x="week", y="gross", color="title", x_label="Week of", y_label="Projected Gross ($M)")
+    st.caption("Projected weekly runs of every dated title at its preset inputs; these set the Calendar Comp column.")
+
+# --- BACKGROUND REFRESH ---
+@st.cache_resource
+def start_background_refresh():
+    # One refresher per server process; cache_resource keeps it alive across reruns and sessions.
+    refresher = SignalRefresher(upcoming_data, market_dataset=rendered_data)
+    refresher.start()
+    return refresher
+
+def render_refresh_status():
+    status = signal_cache.refresh_status()
+    with st.sidebar.expander("🛰️ Background Refresh"):
+        if not status:
+            st.caption("No background refresh has run yet.")
+            return
+        now = time.time()
+        ago = lambda ts: f"{(now - ts)/60:.0f}m ago" if ts else "never"
+        st.dataframe(pd.DataFrame([{
+            "Source": source, "Last Run": ago(s["last_run"]), "Last Success": ago(s["last_success"]),
+            "Refreshed": s["refreshed"], "Failures": s["failures"], "Last Error": s["last_error"] or "",
+        } for source, s in status.items()]), hide_index=True, use_container_width=True)
+
+def render_ops_panel():
+    """Per-source latency, failures and cache outcomes for this server process (?ops=1)."""
+    snap = metrics.snapshot()
+    samples = lambda name: snap.get(name, {"samples": []})["samples"]
+    group = lambda name, key: {s[key]: [t for t in samples(name) if t[key] == s[key]] for s in samples(name)}
+    counts = lambda rows, label: ", ".join(f"{r[label]}×{r['value']:g}" for r in rows) or "—"
+
+    with st.sidebar.expander("🛠️ Ops", expanded=True):
+        st.caption("Since this server process started.")
+        lookups, errors = group("boxoffice_signal_lookups_total", "source"), group("boxoffice_fetch_errors_total", "source")
+        fetches = group("boxoffice_fetch_seconds", "source")
+        rows = []
+        for source in sorted(set(lookups) | set(fetches)):
+            served = {r["status"]: r["value"] for r in lookups.get(source, [])}
+            timings = fetches.get(source, [])
+            n = sum(t["count"] for t in timings)
+            rows.append({
+                "Source": source,
+                "Cache Hit": f"{(served.get('cached', 0) + served.get('stale', 0)) / max(sum(served.values()), 1):.0%}",
+                "Fetches": n,
+                "p50 ms": max((t["p50"] for t in timings), default=0) * 1000,
+                "p95 ms": max((t["p95"] for t in timings), default=0) * 1000,
+                "Outcomes": counts(lookups.get(source, []), "status"),
+                "Errors": counts(errors.get(source, []), "error"),
+            })
+        st.markdown("**Sources**")
+        st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
+        responses, http_errors, sizes = group("boxoffice_http_responses_total", "host"), group("boxoffice_http_errors_total", "host"), group("boxoffice_http_bytes_total", "host")
+        st.markdown("**Upstream HTTP**")
+        st.dataframe(pd.DataFrame([{
+            "Host": t["host"], "Requests": t["count"], "p50 ms": t["p50"] * 1000, "p95 ms": t["p95"] * 1000,
+            "Statuses": counts(responses.get(t["host"], []), "status"), "Errors": counts(http_errors.get(t["host"], []), "error"),
+            "KB": sum(r["value"] for r in sizes.get(t["host"], [])) / 1024,
+        } for t in samples("boxoffice_http_request_seconds")]), hide_index=True, use_container_width=True)
+
+        st.markdown("**Engines**")
+        st.dataframe(pd.DataFrame([{"Engine": t["engine"], "Calls": t["count"], "Mean ms": t["mean"] * 1000, "p95 ms": t["p95"] * 1000}
+                                   for t in samples("boxoffice_engine_seconds")]), hide_index=True, use_container_width=True)
+
+        col_prom, col_json = st.columns(2)
+        with col_prom: st.download_button("Prometheus", metrics.render_prometheus(), "boxoffice.prom", "text/plain")
+        with col_json: st.download_button("JSON", json.dumps(snap, indent=1), "boxoffice-metrics.json", "application/json")
 
 # --- MAIN NAVIGATION CONTROLLER ---
-view = st.sidebar.radio("Evaluation Mode", ["🔭 Long-Lead Planner", "📉 Short-Term Tracker", "🕰️ Historical Analysis"])
-
-if view == "🔭 Long-Lead Planner":
-    render_long_lead()
-elif view == "📉 Short-Term Tracker":
-    render_tracker(upcoming_data, "📉 Short-Term Tracker")
-else:
-    render_tracker(historical_data, "🕰️ Historical Analysis")
+def main():
+    st.set_page_config(page_title="Box Office Suite", page_icon="🎬", layout="wide")
+    st.markdown(THEME_CSS, unsafe_allow_html=True)
+    if os.environ.get("BOXOFFICE_BACKGROUND_REFRESH", "1") != "0":
+        start_background_refresh()
+
+    view = st.sidebar.radio("Evaluation Mode", ["🔭 Long-Lead Planner", "📉 Short-Term Tracker", "🗂️ Slate Dashboard", "🕰️ Historical Analysis"])
+
+    if view == "🔭 Long-Lead Planner":
+        render_long_lead()
+    elif view == "📉 Short-Term Tracker":
+        render_tracker(upcoming_data, "📉 Short-Term Tracker")
+    elif view == "🗂️ Slate Dashboard":
+        render_slate(upcoming_data)
+    else:
+        render_tracker(historical_data, "🕰️ Historical Analysis")
+    render_refresh_status()
+    if st.query_params.get("ops") == "1":
+        render_ops_panel()
+
+# `streamlit run app.py` executes this file as __main__.
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""Benchmark suite for the engines, the live-signal fetch pipeline and Streamlit reruns.
+
+    python -m benchmarks                       # run everything, append to benchmarks/history.jsonl
+    python -m benchmarks --quick engines       # one area, smaller N and fewer repeats
+    python -m benchmarks --compare             # latest run vs the previous one
+    python -m benchmarks --compare 1a2b3c4     # latest run vs the last run at a commit
+
+Each area runs in its own subprocess, fully offline: the fetch and page benchmarks
+replay synthetic fixtures (see fixtures.py) with per-source latency, against a
+throwaway cache directory.
+"""
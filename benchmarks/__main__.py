@@ -0,0 +1,132 @@
+"""Benchmark runner: run the areas, append results to the history, compare runs."""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from .fixtures import replay_env, write_fixtures
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_PATH = os.path.join(ROOT, "benchmarks", "history.jsonl")
+AREAS = {"engines": "benchmarks.bench_engines", "fetch": "benchmarks.bench_fetch", "pages": "benchmarks.bench_pages"}
+# A case more than this much slower (median) than its baseline is reported as a regression.
+REGRESSION_THRESHOLD = 0.10
+
+
+def _git(*args):
+    try:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_metadata(quick):
+    return {
+        "run_id": time.strftime("%Y%m%dT%H%M%S"),
+        "timestamp": time.time(),
+        "commit": _git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()} x{os.cpu_count()}",
+        "quick": quick,
+    }
+
+
+def run_area(area, quick, env):
+    completed = subprocess.run(
+        [sys.executable, "-m", AREAS[area], *(["--quick"] if quick else [])],
+        cwd=ROOT, env={**os.environ, **env, "PYTHONPATH": ROOT}, capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"{area} benchmarks failed:\n{completed.stderr[-2000:]}")
+    return [json.loads(line) for line in completed.stdout.splitlines() if line.startswith("{")]
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _case(record):
+    return record["name"], json.dumps(record.get("params", {}), sort_keys=True)
+
+
+def baseline_for(history, run_id, quick, commit=None):
+    """{case: record} from the latest other run in the same mode, optionally at `commit`."""
+    runs = [r for r in history if r["run_id"] != run_id and r["quick"] == quick
+            and (commit is None or (r["commit"] or "").startswith(commit))]
+    if not runs:
+        return {}
+    base_id = max(runs, key=lambda r: r["timestamp"])["run_id"]
+    return {_case(r): r for r in runs if r["run_id"] == base_id}
+
+
+def report(records, baseline):
+    """Print one line per case; returns the cases that regressed past the threshold."""
+    regressions = []
+    for record in records:
+        params = " ".join(f"{k}={v}" for k, v in record.get("params", {}).items())
+        line = f"{record['name']:<30} {params:<34} {record['median_ms']:>11.3f} ms"
+        if "rows_per_s" in record:
+            line += f" {record['rows_per_s']:>14,.0f} rows/s"
+        base = baseline.get(_case(record))
+        if base:
+            change = record["median_ms"] / base["median_ms"] - 1
+            line += f"  {change:+7.1%} vs {base['commit']}"
+            if change > REGRESSION_THRESHOLD:
+                line += "  REGRESSION"
+                regressions.append(record)
+        print(line)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the benchmark suite.")
+    parser.add_argument("areas", nargs="*", help=f"areas to run (default: all of {', '.join(AREAS)})")
+    parser.add_argument("--quick", action="store_true", help="smaller N and fewer repeats")
+    parser.add_argument("--history", default=HISTORY_PATH, help="JSONL file results are appended to")
+    parser.add_argument("--no-save", action="store_true", help="print results without appending them")
+    parser.add_argument("--compare", nargs="?", const="", metavar="COMMIT",
+                        help="compare the latest saved run against the previous run (or the last run at COMMIT) and exit")
+    args = parser.parse_args(argv)
+    unknown = set(args.areas) - set(AREAS)
+    if unknown:
+        parser.error(f"unknown areas: {', '.join(sorted(unknown))}")
+
+    history = load_history(args.history)
+    if args.compare is not None:
+        if not history:
+            sys.exit("no benchmark history yet")
+        latest = max(history, key=lambda r: r["timestamp"])
+        records = [r for r in history if r["run_id"] == latest["run_id"]]
+        regressions = report(records, baseline_for(history, latest["run_id"], latest["quick"], args.compare or None))
+        sys.exit(1 if regressions else 0)
+
+    meta = run_metadata(args.quick)
+    records = []
+    with tempfile.TemporaryDirectory(prefix="boxoffice-bench-") as tmp:
+        fixtures_dir = os.path.join(tmp, "fixtures")
+        write_fixtures(fixtures_dir)
+        for area in args.areas or AREAS:
+            # A cache per area, so no area starts warm from another's fetches.
+            env = replay_env(fixtures_dir, os.path.join(tmp, f"cache-{area}"))
+            for result in run_area(area, args.quick, env):
+                records.append({**meta, "area": area, **result})
+
+    report(records, baseline_for(history, meta["run_id"], args.quick))
+    if not args.no_save:
+        os.makedirs(os.path.dirname(args.history), exist_ok=True)
+        with open(args.history, "a") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        print(f"appended {len(records)} results to {args.history}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Scalar vs batched engines at growing N."""
+import numpy as np
+import pandas as pd
+
+from boxoffice.batch import calculate_box_office_batch, calculate_long_lead_batch
+from boxoffice.engines import calculate_box_office, calculate_long_lead
+from boxoffice.runs import project_runs
+from boxoffice.windows import FILM_COLUMNS, optimize_windows, weekly_windows
+
+from .harness import main, measure
+
+
+def box_office_inputs(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "interest": rng.uniform(10, 95, n),
+        "total_aware": rng.uniform(10, 98, n),
+        "theaters": rng.integers(800, 4600, n).astype(float),
+        "rt_score": rng.uniform(20, 100, n),
+        "popcorn_score": rng.uniform(50, 99, n),
+        "buzz": rng.uniform(0.8, 2.0, n),
+        "comp": rng.uniform(0.6, 1.0, n),
+        "trailer_views": rng.uniform(1e5, 2e8, n),
+        "intl_multiplier": rng.uniform(1.0, 3.5, n),
+        "studio_type": rng.choice(["Major Franchise", "Major Franchise (Animation)", "Cult / Indie (A24/Neon)"], n),
+        "market_demand": rng.choice(["Normal", "Pent-up / Starved"], n),
+        "release_format": rng.choice(["Standard 3-Day", "4-Day Holiday (Fri-Mon)", "5-Day Holiday (Wed-Sun)"], n),
+    }
+
+
+def long_lead_inputs(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "genre": rng.choice(["Action/Adventure", "Horror", "Sci-Fi", "Drama", "Comedy", "Family/Animation", "Thriller"], n),
+        "cast_score": rng.uniform(0, 150, n),
+        "budget": rng.uniform(5, 300, n),
+        "rating": rng.choice(["PG-13", "R", "PG", "G"], n),
+        "ip_status": rng.choice(["Original", "Adaptation (Book/Game)", "Sequel (Major Franchise)"], n),
+        "season": rng.choice(["Average", "Summer (May-Jul)", "Holiday (Nov-Dec)", "Dump Months (Jan/Sept)"], n),
+        "competition_level": rng.choice(["Low (Clear Weekend)", "Moderate (1 Opener)", "High (2+ Wide Releases)", "Extreme (vs Blockbuster)"], n),
+    }
+
+
+def _rows(columns):
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*(columns[name].tolist() for name in names))]
+
+
+def run(quick):
+    scalar_sizes = (1, 100, 1_000) if quick else (1, 100, 10_000)
+    batch_sizes = (100, 10_000) if quick else (100, 10_000, 1_000_000)
+    repeat = 3 if quick else 7
+
+    for n in scalar_sizes:
+        rows = _rows(box_office_inputs(n))
+        yield measure("box_office.scalar", lambda: [calculate_box_office(**row) for row in rows], repeat, rows=n, n=n)
+    for n in batch_sizes:
+        columns = box_office_inputs(n)
+        yield measure("box_office.batch", lambda: calculate_box_office_batch(columns), repeat, rows=n, n=n)
+
+    for n in scalar_sizes:
+        rows = _rows(long_lead_inputs(n))
+        yield measure("long_lead.scalar", lambda: [calculate_long_lead(**row) for row in rows], repeat, rows=n, n=n)
+    for n in batch_sizes:
+        columns = long_lead_inputs(n)
+        yield measure("long_lead.batch", lambda: calculate_long_lead_batch(columns), repeat, rows=n, n=n)
+
+    for n in batch_sizes[:2]:
+        columns = box_office_inputs(n)
+        opening, _, dom_total, _ = calculate_box_office_batch(columns)
+        yield measure("runs.project", lambda: project_runs(opening, dom_total, columns["studio_type"], columns["release_format"]), repeat, rows=n, n=n)
+
+    films, windows = long_lead_inputs(30), weekly_windows("2026-01-02", 52)
+    films = {name: films[name] for name in FILM_COLUMNS}
+    yield measure("windows.optimize", lambda: optimize_windows(pd.DataFrame(films), windows), 1 if quick else 3, rows=30, n="30x52")
+
+
+if __name__ == "__main__":
+    main(run)
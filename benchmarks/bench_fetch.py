@@ -0,0 +1,42 @@
+"""get_live_data cold and warm, one title and the whole slate, and one market poll of the
+slate, against replayed fixtures.
+
+Run by the runner with replay_env() set, so every request is served from fixtures
+with per-source latency.
+"""
+from boxoffice import markets, pageviews, signals
+from boxoffice.datasets import upcoming_data
+
+from .harness import main, measure
+
+
+def _cold():
+    signals.signal_cache.clear()
+    pageviews.pageview_store.clear()
+    signals._failed_until.clear()
+
+
+def run(quick):
+    repeat = 3 if quick else 5
+    title, data = next(iter(upcoming_data.items()))
+    args = (data["wiki"], data["yt_id"], data["yt_fallback"], data["rt_slug"], data.get("simple_name", "Movie"),
+            data.get("frozen_views"), data.get("poly_slug"))
+
+    yield measure("fetch.get_live_data.cold", lambda: signals.get_live_data(*args), repeat, setup=_cold, title=title)
+    signals.get_live_data(*args)
+    yield measure("fetch.get_live_data.warm", lambda: signals.get_live_data(*args), repeat * 4, title=title)
+
+    n = len(upcoming_data)
+    yield measure("fetch.slate.cold", lambda: signals.prefetch_live_data(upcoming_data), repeat, setup=_cold, titles=n)
+    signals.prefetch_live_data(upcoming_data)
+    yield measure("fetch.slate.warm", lambda: signals.prefetch_live_data(upcoming_data), repeat * 4, titles=n)
+
+    # Unthrottled, so the case measures requests and parsing rather than the rate limit.
+    budget = markets.TokenBucket(rate=1000.0, burst=1000)
+    yield measure("fetch.markets.poll.cold", lambda: markets.poll(upcoming_data, budget=budget), repeat,
+                  setup=markets.market_store.clear, titles=n)
+    yield measure("fetch.markets.poll.pinned", lambda: markets.poll(upcoming_data, budget=budget), repeat, titles=n)
+
+
+if __name__ == "__main__":
+    main(run)
@@ -0,0 +1,34 @@
+"""End-to-end reruns of the Streamlit views under AppTest's script runner.
+
+Run by the runner with replay_env() set, so the tracker's first visit pays replayed
+fetch latency and later reruns read the signal cache.
+"""
+import os
+
+from streamlit.testing.v1 import AppTest
+
+from .harness import main, measure
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def _check(at):
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+def run(quick):
+    repeat = 3 if quick else 10
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+
+    yield measure("page.first_run", lambda: _check(at.run()), 1)
+    yield measure("page.long_lead.rerun", lambda: _check(at.run()), repeat)
+    budgets = iter(range(20, 20 + 10 * (repeat + 1), 10))
+    yield measure("page.long_lead.input_change", lambda: _check(at.sidebar.number_input[0].set_value(next(budgets)).run()), repeat)
+
+    yield measure("page.tracker.first_visit", lambda: _check(at.sidebar.radio[0].set_value("📉 Short-Term Tracker").run()), 1)
+    yield measure("page.tracker.rerun", lambda: _check(at.run()), repeat)
+
+
+if __name__ == "__main__":
+    main(run)
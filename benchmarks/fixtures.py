@@ -0,0 +1,78 @@
+"""Synthetic replay fixtures for every upcoming title, shaped like the real upstream responses.
+
+Bodies are padded to realistic page sizes (YouTube watch pages run to ~1 MB of HTML,
+Rotten Tomatoes pages to ~400 KB) with the value the fetcher wants near the end, so
+parsing cost is representative. Each fixture's `elapsed` is that source's typical
+latency, replayed with BOXOFFICE_REPLAY_LATENCY=recorded.
+"""
+import json
+import os
+from datetime import date, timedelta
+
+from boxoffice.datasets import upcoming_data
+from boxoffice.http_client import fixture_path
+from boxoffice.markets import MANIFOLD_MARKET_URL, POLYMARKET_BATCH, manifold_search_url, polymarket_url
+from boxoffice.pageviews import API_URL, DEFAULT_WINDOW
+
+TODAY = date(2025, 11, 16)
+SOURCE_LATENCY = {"wiki": 0.15, "youtube": 0.6, "rt": 0.45, "polymarket": 0.2, "manifold": 0.25}
+PAGE_SIZES = {"youtube": 1_000_000, "rt": 400_000}
+
+
+def _padding(size):
+    chunk = '<div class="filler" data-x="0123456789abcdef">lorem ipsum dolor sit amet</div>\n'
+    return chunk * (size // len(chunk))
+
+
+def _write(fixtures_dir, url, body, content_type, latency):
+    path = fixture_path(url, fixtures_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fixture = {"url": url, "status": 200, "headers": {"Content-Type": content_type}, "encoding": "utf-8",
+               "elapsed": latency, "body": body}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(fixture, f)
+
+
+def write_fixtures(fixtures_dir, today=TODAY):
+    """Write one fixture per upstream URL the fetchers request for upcoming_data."""
+    end = today - timedelta(days=1)
+    start = end - timedelta(days=DEFAULT_WINDOW - 1)
+    days = [start + timedelta(days=i) for i in range(DEFAULT_WINDOW)]
+    for i, data in enumerate(upcoming_data.values()):
+        url = API_URL.format(article=data["wiki"], start=start.strftime("%Y%m%d"), end=end.strftime("%Y%m%d"))
+        items = [{"article": data["wiki"], "timestamp": day.strftime("%Y%m%d00"), "views": 2_000 + 150 * i + 40 * n} for n, day in enumerate(days)]
+        _write(fixtures_dir, url, json.dumps({"items": items}), "application/json", SOURCE_LATENCY["wiki"])
+
+        body = _padding(PAGE_SIZES["youtube"]) + f'<script>var ytInitialPlayerResponse = {{"videoDetails":{{"viewCount":"{(i + 1) * 3_100_000}"}}}};</script>'
+        _write(fixtures_dir, f"https://www.youtube.com/watch?v={data['yt_id']}", body, "text/html; charset=utf-8", SOURCE_LATENCY["youtube"])
+
+        if data["rt_slug"]:
+            body = _padding(PAGE_SIZES["rt"]) + f'<score-board tomatometerscore="{60 + i * 3 % 40}" audiencescore="88"></score-board>'
+            _write(fixtures_dir, f"https://www.rottentomatoes.com/m/{data['rt_slug']}", body, "text/html; charset=utf-8", SOURCE_LATENCY["rt"])
+
+        term = data.get("simple_name", "Movie")
+        market = {"id": f"m{i}", "question": f"Will {term} open above $50M?", "probability": 0.42, "isResolved": False,
+                  "url": f"https://manifold.markets/m/{i}"}
+        _write(fixtures_dir, manifold_search_url(term), json.dumps([market]), "application/json", SOURCE_LATENCY["manifold"])
+        _write(fixtures_dir, MANIFOLD_MARKET_URL.format(market_id=market["id"]), json.dumps(market), "application/json", SOURCE_LATENCY["manifold"])
+
+    # Polymarket events are polled in batches of slugs, in dataset order (markets.poll).
+    slugs = list(dict.fromkeys(data["poly_slug"] for data in upcoming_data.values() if data.get("poly_slug")))
+    for i in range(0, len(slugs), POLYMARKET_BATCH):
+        events = [{"slug": slug, "markets": [
+            {"groupItemTitle": f"${lo}-{lo + 25}M", "outcomePrices": json.dumps([str(p), str(1 - p)])}
+            for lo, p in ((75, 0.15), (100, 0.55), (125, 0.3))
+        ]} for slug in slugs[i:i + POLYMARKET_BATCH]]
+        _write(fixtures_dir, polymarket_url(slugs[i:i + POLYMARKET_BATCH]), json.dumps(events), "application/json", SOURCE_LATENCY["polymarket"])
+
+
+def replay_env(fixtures_dir, cache_dir, today=TODAY):
+    """Environment variables that point a subprocess at the fixtures, fully offline."""
+    return {
+        "BOXOFFICE_HTTP_MODE": "replay",
+        "BOXOFFICE_FIXTURES_DIR": fixtures_dir,
+        "BOXOFFICE_REPLAY_LATENCY": "recorded",
+        "BOXOFFICE_CACHE_DIR": cache_dir,
+        "BOXOFFICE_TODAY": today.isoformat(),
+        "BOXOFFICE_BACKGROUND_REFRESH": "0",
+    }
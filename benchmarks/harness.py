@@ -0,0 +1,44 @@
+"""Timing helpers shared by the benchmark areas.
+
+An area module defines `run(quick)` yielding result dicts from `measure`; running the
+module directly prints them as JSON lines for the runner in __main__.py to collect.
+"""
+import json
+import statistics
+import sys
+import time
+
+
+def measure(name, fn, repeat=5, rows=None, setup=None, **params):
+    """Time `fn()` `repeat` times (after `setup()` each time, untimed) and summarize.
+
+    `params` identify the case (N, title...) and are how runs are matched up in the
+    history; `rows` adds a throughput figure.
+    """
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    result = {
+        "name": name,
+        "params": params,
+        "repeat": repeat,
+        "min_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "max_ms": max(samples),
+    }
+    if rows:
+        result["rows_per_s"] = rows / (result["median_ms"] / 1000)
+    return result
+
+
+def emit(results):
+    for result in results:
+        print(json.dumps(result), flush=True)
+
+
+def main(run):
+    emit(run(quick="--quick" in sys.argv[1:]))
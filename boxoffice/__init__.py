@@ -0,0 +1,56 @@
+"""Headless box office forecasting core: engines, datasets, the film store and live-signal fetchers.
+
+Importing the package is cheap. Each public name is loaded from its submodule on first
+access, so a worker that only calls calculate_box_office never imports numpy, pandas,
+requests or streamlit. The Streamlit app in app.py is a thin client of this package.
+"""
+import importlib
+
+_EXPORTS = {
+    "DEFAULT_MODEL_PARAMS": "engines",
+    "MODEL_PARAMS": "engines",
+    "MODEL_PARAMS_VERSION": "engines",
+    "load_model_params": "engines",
+    "calculate_box_office": "engines",
+    "calculate_long_lead": "engines",
+    "BOX_OFFICE_COLUMNS": "batch",
+    "calculate_box_office_batch": "batch",
+    "LONG_LEAD_COLUMNS": "batch",
+    "calculate_long_lead_batch": "batch",
+    "simulate_box_office": "montecarlo",
+    "sweep_one_at_a_time": "sensitivity",
+    "sweep_grid": "sensitivity",
+    "tornado": "sensitivity",
+    "score_slate": "slate",
+    "project_runs": "runs",
+    "project_slate_runs": "runs",
+    "ReleaseCalendar": "release_calendar",
+    "calendar_competition": "release_calendar",
+    "optimize_windows": "windows",
+    "weekly_windows": "windows",
+    "upcoming_data": "datasets",
+    "historical_data": "datasets",
+    "FilmStore": "filmstore",
+    "get_film_store": "filmstore",
+    "find_comps": "comps",
+    "comps_forecast": "comps",
+    "get_live_data": "signals",
+    "live_data_for": "signals",
+    "prefetch_live_data": "signals",
+    "run_backtest": "backtest",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,121 @@
+"""Headless backtest of the short-term engine against historical actuals.
+
+Scores every title in one calculate_box_office_batch pass from frozen signals only
+(frozen_views for trailer views, rt_recorded for the RT score), so it never touches
+the network.
+
+    python -m boxoffice.backtest                     # every title in historical_data
+    python -m boxoffice.backtest films.csv --json    # an external CSV/JSON file of titles
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from .batch import calculate_box_office_batch
+from .datasets import historical_data
+
+# Same fallbacks the tracker's sliders use when a signal is missing.
+DEFAULT_RT = 70
+DEFAULT_POPCORN = 85
+REQUIRED_FIELDS = ("actual_opening", "aware", "interest", "theaters", "buzz", "comp", "intl_multiplier", "studio_type")
+
+
+def load_films(path):
+    """Load titles from a CSV (one row per title, with a `title` column) or JSON file.
+
+    JSON may be either a {title: record} mapping shaped like historical_data or a list of
+    records carrying a `title` key.
+    """
+    if path.endswith(".csv"):
+        df = pd.read_csv(path)
+        records = df.astype(object).where(df.notna(), None).to_dict("records")
+    else:
+        with open(path) as f:
+            records = json.load(f)
+        if isinstance(records, dict):
+            return records
+    return {r.pop("title"): r for r in records}
+
+
+def film_inputs(films):
+    """Build the calculate_box_office_batch input frame for {title: record}."""
+    rows = []
+    for title, film in films.items():
+        missing = [field for field in REQUIRED_FIELDS if film.get(field) is None]
+        if missing:
+            raise ValueError(f"{title}: missing {', '.join(missing)}")
+        rows.append({
+            "title": title,
+            "interest": film["interest"],
+            "total_aware": film["aware"],
+            "theaters": film["theaters"],
+            # A recorded score of 0 is a real score, not a missing one.
+            "rt_score": DEFAULT_RT if film.get("rt_recorded") is None else film["rt_recorded"],
+            "popcorn_score": DEFAULT_POPCORN if film.get("popcorn_est") is None else film["popcorn_est"],
+            "buzz": film["buzz"],
+            "comp": film["comp"],
+            "trailer_views": film.get("frozen_views") or film.get("yt_fallback") or 0,
+            "intl_multiplier": film["intl_multiplier"],
+            "studio_type": film["studio_type"],
+            "market_demand": film.get("market_demand") or "Normal",
+            "release_format": film.get("release_format") or "Standard 3-Day",
+            "actual_opening": film["actual_opening"],
+        })
+    return pd.DataFrame(rows).set_index("title")
+
+
+def run_backtest(films=None, params=None):
+    """Score `films` (default: historical_data) against their actual openings.
+
+    Returns (per_title, summary): a DataFrame of predicted/actual opening ($M) and
+    percent error per title, and a dict with MAPE, bias, median APE and hit rate.
+    `params` overrides the engine's loaded MODEL_PARAMS.
+    """
+    inputs = film_inputs(historical_data if films is None else films)
+    opening, _, _, _ = calculate_box_office_batch(inputs, params=params)
+    predicted = opening / 1_000_000
+    actual = inputs["actual_opening"].to_numpy(dtype=float)
+    pct_error = (predicted - actual) / actual * 100
+
+    per_title = pd.DataFrame({
+        "predicted": predicted.round(2),
+        "actual": actual,
+        "pct_error": pct_error.round(1),
+    }, index=inputs.index)
+    summary = {
+        "titles": len(per_title),
+        "mape": float(np.mean(np.abs(pct_error))),
+        "bias": float(np.mean(pct_error)),
+        "median_ape": float(np.median(np.abs(pct_error))),
+        # The tracker calls a prediction "Accurate" inside ±15%.
+        "hit_rate": float(np.mean(np.abs(pct_error) < 15)),
+    }
+    return per_title, summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backtest the short-term engine against historical openings.")
+    parser.add_argument("path", nargs="?", help="CSV or JSON file of titles (default: built-in historical_data)")
+    parser.add_argument("--json", action="store_true", help="emit JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    if args.path and not os.path.exists(args.path):
+        parser.error(f"no such file: {args.path}")
+    per_title, summary = run_backtest(load_films(args.path) if args.path else None)
+
+    if args.json:
+        json.dump({"summary": summary, "titles": per_title.reset_index().to_dict("records")}, sys.stdout, indent=2)
+        print()
+    else:
+        print(per_title.to_string())
+        print()
+        print(f"titles {summary['titles']}  MAPE {summary['mape']:.1f}%  bias {summary['bias']:+.1f}%  "
+              f"median APE {summary['median_ape']:.1f}%  within ±15% {summary['hit_rate']:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Vectorized short-term engine: calculate_box_office over many scenarios in one NumPy pass."""
+import numpy as np
+import pandas as pd
+
+from . import engines, metrics
+from .engines import ENGINE_SECONDS
+
+BOX_OFFICE_COLUMNS = ("interest", "total_aware", "theaters", "rt_score", "popcorn_score", "buzz", "comp", "trailer_views", "intl_multiplier", "studio_type", "market_demand", "release_format")
+
+@metrics.timed(ENGINE_SECONDS, engine="box_office_batch")
+def calculate_box_office_batch(inputs=None, params=None, **columns):
+    """Vectorized calculate_box_office over many scenarios at once.
+
+    Takes a DataFrame (or any mapping) with the scalar function's argument names as
+    columns, and/or the same names as keyword arrays; scalars broadcast against arrays.
+    Returns (opening, extended, dom_total, global_total) as float arrays that match the
+    scalar function element for element; extended is NaN where the scalar returns None.
+    `params` overrides MODEL_PARAMS, as for the scalar function.
+    """
+    p = params or engines.MODEL_PARAMS
+    if inputs is not None:
+        columns = {**{name: inputs[name] for name in BOX_OFFICE_COLUMNS if name in inputs}, **columns}
+    missing = [name for name in BOX_OFFICE_COLUMNS if name not in columns]
+    if missing:
+        raise ValueError(f"calculate_box_office_batch missing inputs: {', '.join(missing)}")
+    # Categorical inputs are reduced to masks before broadcasting, so a single studio/format
+    # string shared by every scenario is compared once rather than once per row.
+    studio_type = np.asarray(columns["studio_type"]).astype(str)
+    market_demand = np.asarray(columns["market_demand"])
+    release_format = np.asarray(columns["release_format"])
+    (interest, total_aware, theaters, rt_score, popcorn_score, buzz, comp, trailer_views, intl_multiplier,
+     is_indie, is_family, is_pent_up, is_saturated, is_5_day, is_4_day) = np.broadcast_arrays(
+        *(np.asarray(columns[name]) for name in BOX_OFFICE_COLUMNS[:9]),
+        studio_type == "Cult / Indie (A24/Neon)",
+        (np.char.find(studio_type, "Family") >= 0) | (np.char.find(studio_type, "Animation") >= 0),
+        market_demand == "Pent-up / Starved",
+        market_demand == "Saturated / Crowded",
+        release_format == "5-Day Holiday (Wed-Sun)",
+        release_format == "4-Day Holiday (Fri-Mon)")
+
+    # Each step mirrors the scalar ladder; untaken branches multiply by 1.0 or add 0.0, which is exact.
+    base_gross = (interest * p["interest_weight"]) * (total_aware * p["aware_weight"]) * 1_000_000
+
+    view_efficiency = np.where(is_indie, 0.6, 1.0)
+    effective_views = trailer_views * view_efficiency
+    trailer_multiplier = np.select(
+        [effective_views > p["trailer_break_high"], effective_views > p["trailer_break_mid"], effective_views > p["trailer_break_low"]],
+        [p["trailer_mult_high"], p["trailer_mult_mid"], p["trailer_mult_low"]], 1.0)
+    base_gross = base_gross * trailer_multiplier
+
+    blockbuster_mult = np.where(theaters > p["blockbuster_theaters"], np.select(
+        [total_aware > p["blockbuster_aware_high"], total_aware > p["blockbuster_aware_mid"], total_aware > p["blockbuster_aware_low"]],
+        [p["blockbuster_mult_high"], p["blockbuster_mult_mid"], p["blockbuster_mult_low"]], p["blockbuster_mult_base"]), 1.0)
+    base_gross = base_gross * blockbuster_mult
+
+    demand_mult = np.select([is_pent_up, is_saturated], [1.2, 0.85], 1.0)
+    base_gross = base_gross * demand_mult
+
+    cap = np.where(theaters > 3000, 5000, 3500)
+    weighted_gross = (base_gross * p["tracking_blend"]) + ((theaters * cap) * p["capacity_blend"])
+    qual_mult = np.where(rt_score > 80, 1.15, np.where(rt_score < 50, 0.85, 1.0))
+    raw_opening = weighted_gross * qual_mult * buzz * comp
+
+    over_cap = raw_opening > 150_000_000
+    soft_capped = 150_000_000 + (np.sqrt(np.where(over_cap, raw_opening - 150_000_000, 0.0)) * p["soft_cap_factor"])
+    final_opening = np.where(over_cap, soft_capped, raw_opening)
+
+    extended_opening = np.select(
+        [is_5_day, is_4_day],
+        [final_opening * 1.45, final_opening * 1.25], np.nan)
+
+    legs = 2.7 + np.select([popcorn_score >= 95, popcorn_score >= 90, popcorn_score >= 80, popcorn_score < 60], [1.2, 0.8, 0.3, -0.5], 0.0)
+    legs = legs + np.where(rt_score > 90, 0.2, 0.0)
+    legs = legs + np.where(theaters < 2000, 0.4, 0.0)
+    legs = legs - np.where(final_opening > 120_000_000, np.where(is_family | is_pent_up, 0.1, 0.5), 0.0)
+
+    dom_total = final_opening * legs
+    global_total = dom_total * intl_multiplier
+
+    return final_opening, extended_opening, dom_total, global_total
+
+LONG_LEAD_COLUMNS = ("genre", "cast_score", "budget", "rating", "ip_status", "season", "competition_level")
+
+def _lookup(values, table, default):
+    # Map each distinct label once, then scatter back to every row. factorize hashes the
+    # labels rather than sorting them as np.unique does; missing labels (code -1) get the default.
+    values = np.asarray(values)
+    codes, labels = pd.factorize(values.ravel())
+    return np.append([table.get(label, default) for label in labels], default)[codes].reshape(values.shape)
+
+@metrics.timed(ENGINE_SECONDS, engine="long_lead_batch")
+def calculate_long_lead_batch(inputs=None, **columns):
+    """Vectorized calculate_long_lead; same input conventions as calculate_box_office_batch."""
+    if inputs is not None:
+        columns = {**{name: inputs[name] for name in LONG_LEAD_COLUMNS if name in inputs}, **columns}
+    missing = [name for name in LONG_LEAD_COLUMNS if name not in columns]
+    if missing:
+        raise ValueError(f"calculate_long_lead_batch missing inputs: {', '.join(missing)}")
+    # Labels are looked up at their own shape and broadcast by the arithmetic, so a label
+    # shared by every row (or a per-window season against per-film genres) is mapped once.
+    column = lambda name: np.asarray(columns[name])
+
+    base = _lookup(column("genre"), engines.GENRE_BASELINES, engines.DEFAULT_GENRE_BASELINE)
+    star_power_add = np.sqrt(column("cast_score")) * 2.5
+    production_add = column("budget") * 0.08
+    return ((base + star_power_add + production_add)
+            * _lookup(column("ip_status"), engines.IP_MULTS, 1.0)
+            * _lookup(column("season"), engines.SEASON_MULTS, 1.0)
+            * _lookup(column("rating"), engines.RATING_MULTS, 1.0)
+            * _lookup(column("competition_level"), engines.COMPETITION_MULTS, 1.0))
@@ -0,0 +1,196 @@
+"""Fit the short-term engine's constants against historical actual openings.
+
+The constants in DEFAULT_MODEL_PARAMS are treated as a parameter vector and fitted by
+Nelder-Mead on a train split, minimising mean absolute log error of the opening. Each
+loss evaluation is one calculate_box_office_batch pass over every training film. The
+fitted set is saved as the next params/short_term_vN.json, which the app loads at startup,
+but only when it beats the base set on the holdout titles (or with --force).
+
+    python -m boxoffice.calibrate                               # fit on historical_data
+    python -m boxoffice.calibrate films.json --holdout 0.2 --seed 7
+    python -m boxoffice.calibrate --fit interest_weight soft_cap_factor --dry-run
+    python -m boxoffice.calibrate --holdout 0 --force            # fit on every title, save anyway
+"""
+import argparse
+import json
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+
+from .backtest import film_inputs, load_films
+from .batch import BOX_OFFICE_COLUMNS, calculate_box_office_batch
+from .datasets import historical_data
+from .engines import DEFAULT_MODEL_PARAMS, MODEL_PARAMS, MODEL_PARAMS_VERSION, PARAMS_DIR
+
+# (low, high) search bounds for every fittable constant.
+PARAM_BOUNDS = {
+    "interest_weight": (0.02, 0.6), "aware_weight": (0.01, 0.2),
+    "trailer_break_high": (20_000_000, 200_000_000), "trailer_break_mid": (5_000_000, 60_000_000), "trailer_break_low": (500_000, 15_000_000),
+    "trailer_mult_high": (1.0, 2.5), "trailer_mult_mid": (1.0, 2.0), "trailer_mult_low": (0.8, 1.5),
+    "blockbuster_theaters": (1000, 4000),
+    "blockbuster_aware_high": (40, 95), "blockbuster_aware_mid": (20, 80), "blockbuster_aware_low": (5, 60),
+    "blockbuster_mult_high": (1.0, 5.0), "blockbuster_mult_mid": (1.0, 4.0), "blockbuster_mult_low": (0.8, 3.0), "blockbuster_mult_base": (0.5, 2.0),
+    "tracking_blend": (0.1, 1.0), "capacity_blend": (0.0, 0.9),
+    "soft_cap_factor": (500, 20_000),
+}
+# Breakpoints are fittable but off by default: the loss is flat between them, and
+# interest_weight * aware_weight only matters as a product, so one of them is enough.
+DEFAULT_FIT = (
+    "interest_weight",
+    "trailer_mult_high", "trailer_mult_mid", "trailer_mult_low",
+    "blockbuster_mult_high", "blockbuster_mult_mid", "blockbuster_mult_low", "blockbuster_mult_base",
+    "tracking_blend", "capacity_blend", "soft_cap_factor",
+)
+
+
+def make_loss(inputs, names, base_params):
+    """Return loss(vector) -> mean |log(predicted / actual)| over `inputs`."""
+    columns = {name: inputs[name].to_numpy() for name in BOX_OFFICE_COLUMNS}
+    actual = inputs["actual_opening"].to_numpy(dtype=float) * 1_000_000
+
+    def loss(vector):
+        params = {**base_params, **dict(zip(names, vector))}
+        opening = calculate_box_office_batch(params=params, **columns)[0]
+        return float(np.mean(np.abs(np.log(np.maximum(opening, 1.0) / actual))))
+    return loss
+
+
+def mape(inputs, params):
+    if len(inputs) == 0:
+        return None
+    opening = calculate_box_office_batch(inputs, params=params)[0] / 1_000_000
+    actual = inputs["actual_opening"].to_numpy(dtype=float)
+    return float(np.mean(np.abs(opening - actual) / actual) * 100)
+
+
+def nelder_mead(f, x0, lower, upper, max_evals=4000, tol=1e-7):
+    """Bounded Nelder-Mead. Works in coordinates scaled to [0, 1] by the bounds."""
+    span = upper - lower
+    g = lambda u: f(lower + np.clip(u, 0.0, 1.0) * span)
+    n = len(x0)
+    simplex = np.vstack([(x0 - lower) / span] * (n + 1))
+    for i in range(n):
+        simplex[i + 1, i] += 0.1 if simplex[i + 1, i] <= 0.9 else -0.1
+    values = np.array([g(u) for u in simplex])
+    evals = n + 1
+    while evals < max_evals:
+        order = np.argsort(values)
+        simplex, values = simplex[order], values[order]
+        if values[-1] - values[0] < tol:
+            break
+        centroid = simplex[:-1].mean(axis=0)
+        reflected = centroid + (centroid - simplex[-1])
+        fr = g(reflected); evals += 1
+        if fr < values[0]:
+            expanded = centroid + 2.0 * (centroid - simplex[-1])
+            fe = g(expanded); evals += 1
+            simplex[-1], values[-1] = (expanded, fe) if fe < fr else (reflected, fr)
+        elif fr < values[-2]:
+            simplex[-1], values[-1] = reflected, fr
+        else:
+            contracted = centroid + 0.5 * (simplex[-1] - centroid)
+            fc = g(contracted); evals += 1
+            if fc < values[-1]:
+                simplex[-1], values[-1] = contracted, fc
+            else:
+                simplex[1:] = simplex[0] + 0.5 * (simplex[1:] - simplex[0])
+                values[1:] = [g(u) for u in simplex[1:]]
+                evals += n
+    best = int(np.argmin(values))
+    return lower + np.clip(simplex[best], 0.0, 1.0) * span, float(values[best]), evals
+
+
+def fit(films=None, names=DEFAULT_FIT, holdout=0.2, seed=0, base_params=None):
+    """Fit `names` on a train split of `films` (default: historical_data).
+
+    Returns a dict with the fitted params and train/holdout MAPE before and after.
+    """
+    base_params = dict(base_params or MODEL_PARAMS)
+    inputs = film_inputs(historical_data if films is None else films)
+    order = np.random.default_rng(seed).permutation(len(inputs))
+    n_holdout = int(round(len(inputs) * holdout))
+    if holdout > 0 and len(inputs) > 1:
+        n_holdout = max(n_holdout, 1)
+    test, train = inputs.iloc[order[:n_holdout]], inputs.iloc[order[n_holdout:]]
+
+    lower = np.array([PARAM_BOUNDS[name][0] for name in names], dtype=float)
+    upper = np.array([PARAM_BOUNDS[name][1] for name in names], dtype=float)
+    x0 = np.clip([float(base_params[name]) for name in names], lower, upper)
+    vector, train_loss, evals = nelder_mead(make_loss(train, names, base_params), x0, lower, upper)
+    params = {**base_params, **{name: float(value) for name, value in zip(names, vector)}}
+
+    return {
+        "params": params,
+        "fitted": list(names),
+        "evaluations": evals,
+        "train_loss": train_loss,
+        "n_train": len(train),
+        "n_holdout": len(test),
+        "train_mape": {"before": mape(train, base_params), "after": mape(train, params)},
+        "holdout_mape": {"before": mape(test, base_params), "after": mape(test, params)},
+    }
+
+
+def save_refusal(result):
+    """Why `result` should not be saved, or None: it must improve holdout MAPE."""
+    holdout = result["holdout_mape"]
+    if not result["n_holdout"] or holdout["after"] is None:
+        return "no holdout titles to evaluate the fit on"
+    if holdout["after"] >= holdout["before"]:
+        return f"holdout MAPE did not improve ({holdout['before']:.1f}% -> {holdout['after']:.1f}%)"
+    return None
+
+
+def save_params(result, seed, params_dir=None, force=False):
+    """Write `result` as the next params/short_term_vN.json and return its path.
+
+    Raises ValueError if save_refusal objects, unless `force` is set.
+    """
+    reason = None if force else save_refusal(result)
+    if reason:
+        raise ValueError(reason)
+    params_dir = params_dir or PARAMS_DIR
+    os.makedirs(params_dir, exist_ok=True)
+    existing = [int(name[len("short_term_v"):-len(".json")]) for name in os.listdir(params_dir)
+                if name.startswith("short_term_v") and name.endswith(".json")]
+    version = max(existing, default=0) + 1
+    path = os.path.join(params_dir, f"short_term_v{version}.json")
+    payload = {
+        "version": version,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "base_version": MODEL_PARAMS_VERSION,
+        "seed": seed,
+        **{key: value for key, value in result.items() if key != "params"},
+        "params": {name: result["params"][name] for name in DEFAULT_MODEL_PARAMS},
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calibrate the short-term engine against historical openings.")
+    parser.add_argument("path", nargs="?", help="CSV or JSON file of titles (default: built-in historical_data)")
+    parser.add_argument("--fit", nargs="+", default=list(DEFAULT_FIT), choices=sorted(PARAM_BOUNDS), metavar="PARAM",
+                        help="constants to fit (default: the continuous multipliers and weights)")
+    parser.add_argument("--holdout", type=float, default=0.2, help="fraction of titles held out for evaluation")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dry-run", action="store_true", help="report without saving a parameter set")
+    parser.add_argument("--force", action="store_true", help="save even if holdout MAPE did not improve or there is no holdout")
+    args = parser.parse_args(argv)
+
+    result = fit(load_films(args.path) if args.path else None, names=args.fit, holdout=args.holdout, seed=args.seed)
+    fmt = lambda v: "n/a" if v is None else f"{v:.1f}%"
+    print(f"fitted {len(args.fit)} params on {result['n_train']} titles ({result['evaluations']} loss evaluations)")
+    print(f"train MAPE   {fmt(result['train_mape']['before'])} -> {fmt(result['train_mape']['after'])}")
+    print(f"holdout MAPE {fmt(result['holdout_mape']['before'])} -> {fmt(result['holdout_mape']['after'])} ({result['n_holdout']} titles)")
+    if not args.dry_run:
+        try:
+            print(f"saved {save_params(result, args.seed, force=args.force)}")
+        except ValueError as e:
+            parser.exit(1, f"not saved: {e} (--force to save anyway)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Nearest-neighbour comps over the film store, and a comps-weighted opening forecast.
+
+Distance between two films of the same genre combines doubling of budget, the square
+root of cast score (the scale the long-lead engine uses for star power) and a fixed
+penalty for each mismatched rating, IP status and season. The index keeps contiguous
+feature arrays per genre, so a query is a few vector ops over its own genre only. Films from other genres are
+searched, with GENRE_PENALTY added, only when the genre has fewer than k films.
+"""
+import threading
+
+import numpy as np
+
+from .filmstore import get_film_store
+
+BUDGET_SCALE = np.log(2.0)  # one unit of distance per doubling of budget
+CAST_SCALE = 3.0            # one unit per 3 points of sqrt(cast score)
+CATEGORY_PENALTIES = {"rating": 0.75, "ip_status": 1.0, "season": 0.5}
+GENRE_PENALTY = 2.0
+DEFAULT_K = 8
+
+
+class CompsIndex:
+    def __init__(self, store):
+        self.store = store
+        cols = store.columns
+        budget_x = np.log(np.maximum(cols["budget"], 1.0)) / BUDGET_SCALE
+        cast_x = np.sqrt(np.maximum(cols["cast_score"], 0.0)) / CAST_SCALE
+        # Rating, IP status and season are folded into one mixed-radix code per film, so a
+        # query prices every combination once and looks the penalty up per film.
+        self._vocab = {}
+        self._radix = []
+        combo = np.zeros(len(store), dtype=np.intp)
+        for name in CATEGORY_PENALTIES:
+            values, inverse = np.unique(cols[name].astype(str), return_inverse=True)
+            self._vocab[name] = {value: i for i, value in enumerate(values.tolist())}
+            self._radix.append(len(values))
+            combo = combo * len(values) + inverse
+        self._all = (np.arange(len(store)), budget_x, cast_x, combo)
+        self._partitions = {}
+        for genre in store.genres:
+            rows = store.genre_rows(genre)
+            self._partitions[genre] = (rows, budget_x[rows], cast_x[rows], combo[rows])
+
+    def _penalty_table(self, categories):
+        """Squared category penalty for every combination code, given the query's categories."""
+        table = np.zeros(1)
+        for (name, penalty), size in zip(CATEGORY_PENALTIES.items(), self._radix):
+            # A category the store has never seen matches no film.
+            mismatch = np.arange(size) != self._vocab[name].get(categories[name], -1)
+            table = (table[:, None] + mismatch * penalty ** 2).ravel()
+        return table
+
+    @staticmethod
+    def _squared_distances(partition, budget_q, cast_q, penalties):
+        _, budget_x, cast_x, combo = partition
+        return (budget_x - budget_q) ** 2 + (cast_x - cast_q) ** 2 + penalties[combo]
+
+    def nearest(self, genre, budget, cast_score, rating, ip_status, season, k=DEFAULT_K):
+        """The k most similar films as (rows, distances), nearest first."""
+        budget_q = np.log(max(budget, 1.0)) / BUDGET_SCALE
+        cast_q = np.sqrt(max(cast_score, 0.0)) / CAST_SCALE
+        penalties = self._penalty_table({"rating": rating, "ip_status": ip_status, "season": season})
+        partition = self._partitions.get(genre)
+        if partition is not None and len(partition[0]) >= k:
+            rows = partition[0]
+            d2 = self._squared_distances(partition, budget_q, cast_q, penalties)
+        else:
+            rows = self._all[0]
+            d2 = self._squared_distances(self._all, budget_q, cast_q, penalties) + GENRE_PENALTY ** 2
+            if partition is not None:
+                d2[partition[0]] -= GENRE_PENALTY ** 2
+        if len(rows) > k:
+            top = np.argpartition(d2, k - 1)[:k]
+            rows, d2 = rows[top], d2[top]
+        order = np.argsort(d2, kind="stable")
+        return rows[order], np.sqrt(d2[order])
+
+
+def comps_forecast(openings, distances):
+    """Similarity-weighted geometric mean of comp openings, with a weighted 25-75% band.
+
+    Returns (forecast, low, high), or None without comps. Weights fall off as
+    1 / (1 + distance), so an exact match counts about three times a comp two units away.
+    """
+    openings = np.asarray(openings, dtype=float)
+    keep = openings > 0
+    if not keep.any():
+        return None
+    logs = np.log(openings[keep])
+    weights = 1.0 / (1.0 + np.asarray(distances, dtype=float)[keep])
+    weights /= weights.sum()
+    order = np.argsort(logs)
+    cumulative = np.cumsum(weights[order]) - weights[order] / 2
+    low, high = np.interp([0.25, 0.75], cumulative, logs[order])
+    return float(np.exp(weights @ logs)), float(np.exp(low)), float(np.exp(high))
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_comps_index():
+    """The process-wide CompsIndex over get_film_store(), built on first use."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = CompsIndex(get_film_store())
+    return _index
+
+
+def find_comps(genre, budget, cast_score, rating, ip_status, season, k=DEFAULT_K):
+    """The k nearest films as a DataFrame with a `distance` column, nearest first."""
+    index = get_comps_index()
+    rows, distances = index.nearest(genre, budget, cast_score, rating, ip_status, season, k=k)
+    comps = index.store.frame(rows)
+    comps["distance"] = distances
+    return comps
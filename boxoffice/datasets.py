@@ -0,0 +1,187 @@
+"""Tracked upcoming titles and historical titles with their actual openings.
+
+These are per-title tracking configs (signal sources, tracking inputs, benchmarks). The
+wider catalogue of released films used for comps lives in the film store (filmstore.py).
+"""
+
+upcoming_data = {
+    "Wicked: Part Two (Nov 21)": {
+        "type": "upcoming", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
+        "release_date": "2025-11-21", "genre": "Family/Animation",
+        "aware": 92, "interest": 62, "theaters": 4200, "buzz": 1.6, "comp": 0.8, 
+        "wiki": "Wicked_(2024_film)", "yt_id": "vt98AlBDI9Y", "yt_fallback": 113000000,
+        "rt_slug": "wicked_part_two", "source_label": "Official Trailer", "source_status": "success",
+        "tracking_source": "Real Data (The Quorum)", "competitors": "Rental Family, Gladiator II",
+        "market_demand": "Normal", "popcorn_est": 97, "simple_name": "Wicked Part Two",
+        "intl_multiplier": 1.6, "benchmarks": {"Wicked: Part One": 114.0, "Frozen II": 130.0, "Barbie": 162.0},
+        "poly_slug": "wicked-for-good-opening-weekend-box-office"
+    },
+    "Eternity (Nov 26)": {
+        "type": "upcoming", "studio_type": "Cult / Indie (A24/Neon)", "release_format": "5-Day Holiday (Wed-Sun)",
+        "release_date": "2025-11-26", "genre": "Comedy",
+        "aware": 21, "interest": 34, "theaters": 2400, "buzz": 1.2, "comp": 0.85, 
+        "wiki": "Eternity_(2025_film)", "yt_id": "irXTps1REHU", "yt_fallback": 9300000,
+        "rt_slug": "eternity_2025", "source_label": "Official Trailer", "source_status": "success",
+        "tracking_source": "Real Data (The Quorum)", "competitors": "Zootopia 2 (Direct)",
+        "market_demand": "Normal", "popcorn_est": 88, "simple_name": "Eternity A24",
+        "intl_multiplier": 1.8, "benchmarks": {"Priscilla": 5.0, "Age of Adaline": 13.2, "Me Before You": 18.7}
+    },
+    "Zootopia 2 (Nov 26)": {
+        "type": "upcoming", "studio_type": "Major Franchise (Animation)", "release_format": "5-Day Holiday (Wed-Sun)",
+        "release_date": "2025-11-26", "genre": "Family/Animation",
+        "aware": 68, "interest": 53, "theaters": 4300, "buzz": 1.3, "comp": 0.8, 
+        "wiki": "Zootopia_2", "yt_id": "xo4rkcC7kFc", "yt_fallback": 25000000,
+        "rt_slug": "zootopia_2", "source_label": "Official Trailer", "source_status": "success",
+        "tracking_source": "Real Data (The Quorum)", "competitors": "Eternity",
+        "market_demand": "Pent-up / Starved", "popcorn_est": 94, "simple_name": "Zootopia 2",
+        "intl_multiplier": 2.8, "benchmarks": {"Inside Out 2": 154.0, "Super Mario Bros": 146.0, "Moana": 56.6},
+        "poly_slug": "zootopia-2-5-day-opening-box-office"
+    },
+    "Rental Family (Nov 21)": {
+        "type": "upcoming", "studio_type": "Cult / Indie (A24/Neon)", "release_format": "Standard 3-Day",
+        "release_date": "2025-11-21", "genre": "Drama",
+        "aware": 15, "interest": 25, "theaters": 1500, "buzz": 1.1, "comp": 0.7, 
+        "wiki": "Rental_Family", "yt_id": "sZT37sM2VgE", "yt_fallback": 5000000, 
+        "rt_slug": "rental_family", "source_label": "Official Trailer", "source_status": "success",
+        "tracking_source": "Estimated (Searchlight Comps)", "competitors": "Wicked: Part Two (Direct)",
+        "market_demand": "Normal", "popcorn_est": 85, "simple_name": "Rental Family",
+        "intl_multiplier": 1.4, "benchmarks": {"The Menu": 9.0, "Next Goal Wins": 2.5}
+    },
+    "Five Nights at Freddy's 2 (Dec 5)": {
+        "type": "upcoming", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
+        "release_date": "2025-12-05", "genre": "Horror",
+        "aware": 85, "interest": 60, "theaters": 3800, "buzz": 1.6, "comp": 0.9, 
+        "wiki": "Five_Nights_at_Freddy's_2_(film)", "yt_id": "0VH9WCFV6Xw", "yt_fallback": 45000000,
+        "rt_slug": "five_nights_at_freddys_2", "source_label": "Proxy (FNAF 1 Data)", "source_status": "warning",
+        "tracking_source": "Estimated (Fan Event)", "competitors": "Wicked Part 2 (Holdover)",
+        "market_demand": "Normal", "popcorn_est": 89, "simple_name": "Five Nights at Freddy's 2",
+        "intl_multiplier": 1.7, "benchmarks": {"FNAF 1": 80.0, "Halloween": 76.2, "M3GAN": 30.4}
+    },
+    "Avatar: Fire and Ash (Dec 19)": {
+        "type": "upcoming", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
+        "release_date": "2025-12-19", "genre": "Sci-Fi",
+        "aware": 95, "interest": 85, "theaters": 4500, "buzz": 1.8, "comp": 1.0, 
+        "wiki": "Avatar:_Fire_and_Ash", "yt_id": "d9MyqF3xZSo", "yt_fallback": 60000000, 
+        "rt_slug": "avatar_fire_and_ash", "source_label": "Proxy Data", "source_status": "warning",
+        "tracking_source": "Hypothetical", "competitors": "SpongeBob Movie",
+        "market_demand": "Pent-up / Starved", "popcorn_est": 96, "simple_name": "Avatar Fire and Ash",
+        "intl_multiplier": 3.5, "benchmarks": {"Avatar: Way of Water": 134.1, "Endgame": 357.0}
+    },
+    "SpongeBob Movie (Dec 19)": {
+        "type": "upcoming", "studio_type": "Major Franchise (Animation)", "release_format": "Standard 3-Day",
+        "release_date": "2025-12-19", "genre": "Family/Animation",
+        "aware": 90, "interest": 55, "theaters": 4000, "buzz": 1.3, "comp": 0.85, 
+        "wiki": "The_SpongeBob_Movie:_Search_for_SquarePants", "yt_id": "wFx7DRIKaig", "yt_fallback": 15000000,
+        "rt_slug": "the_spongebob_movie_search_for_squarepants", "source_label": "Official Trailer", "source_status": "success",
+        "tracking_source": "Real Data (Quorum Proxy)", "competitors": "Avatar 3, Sonic 3",
+        "market_demand": "Normal", "popcorn_est": 91, "simple_name": "SpongeBob Search for SquarePants",
+        "intl_multiplier": 2.3, "benchmarks": {"Sponge Out of Water": 55.3, "Kung Fu Panda 4": 57.9}
+    },
+    "Marty Supreme (Dec 25)": {
+        "type": "upcoming", "studio_type": "Cult / Indie (A24/Neon)", "release_format": "4-Day Holiday (Fri-Mon)", 
+        "release_date": "2025-12-25", "genre": "Drama",
+        "aware": 30, "interest": 40, "theaters": 3200, "buzz": 1.3, "comp": 0.9, 
+        "wiki": "Marty_Supreme", "yt_id": "s9gSuKaKcqM", "yt_fallback": 17800000,
+        "rt_slug": "marty_supreme", "source_label": "Official Trailer", "source_status": "success",
+        "tracking_source": "Estimated (Uncut Gems Comps)", "competitors": "Avatar: Fire and Ash, SpongeBob",
+        "market_demand": "Normal", "popcorn_est": 82, "simple_name": "Marty Supreme",
+        "intl_multiplier": 1.8, "benchmarks": {"Uncut Gems (Wide)": 9.6, "Lady Bird (Wide)": 5.3, "Challengers": 15.0}
+    },
+    "The Housemaid (Early 2026)": {
+        "type": "upcoming", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
+        "release_date": None, "genre": "Thriller",
+        "aware": 35, "interest": 40, "theaters": 3000, "buzz": 1.2, "comp": 0.85, 
+        "wiki": "The_Housemaid_(2025_film)", "yt_id": "7rZEsxySFPw", "yt_fallback": 8000000, 
+        "rt_slug": "the_housemaid_2025", "source_label": "Teaser / Proxy", "source_status": "warning",
+        "tracking_source": "Estimated (Thriller Comps)", "competitors": "Heavy Thriller Slate",
+        "market_demand": "Normal", "popcorn_est": 75, "simple_name": "The Housemaid",
+        "intl_multiplier": 1.5, "benchmarks": {"A Simple Favor": 16.0, "Don't Worry Darling": 19.3}
+    },
+    "Pillion (2026)": {
+        "type": "upcoming", "studio_type": "Cult / Indie (A24/Neon)", "release_format": "Standard 3-Day",
+        "release_date": None, "genre": "Drama",
+        "aware": 10, "interest": 20, "theaters": 800, "buzz": 1.0, "comp": 0.95, 
+        "wiki": "Pillion_(film)", "yt_id": "aTAacTUKK00", "yt_fallback": 500000,
+        "rt_slug": "pillion", "source_label": "Teaser / First Look", "source_status": "success",
+        "tracking_source": "Estimated (Arthouse Niche)", "competitors": "Limited Release Competition",
+        "market_demand": "Normal", "popcorn_est": 78, "simple_name": "Pillion",
+        "intl_multiplier": 1.5, "benchmarks": {"Past Lives (Wide)": 5.8, "The Whale (Wide)": 11.0, "Moonlight (Wide)": 1.5}
+    },
+    "The Moment (2026)": {
+        "type": "upcoming", "studio_type": "Cult / Indie (A24/Neon)", "release_format": "Standard 3-Day",
+        "release_date": None, "genre": "Sci-Fi",
+        "aware": 15, "interest": 25, "theaters": 2000, "buzz": 1.1, "comp": 0.9, 
+        "wiki": "The_Moment_(2026_film)", "yt_id": "ey5YrCNH09g", "yt_fallback": 1500000,
+        "rt_slug": "the_moment_2026", "source_label": "Official Trailer", "source_status": "success",
+        "tracking_source": "Estimated (Sci-Fi Comps)", "competitors": "Project Hail Mary",
+        "market_demand": "Normal", "popcorn_est": 84, "simple_name": "The Moment A24",
+        "intl_multiplier": 2.0, "benchmarks": {"Ex Machina (Wide)": 5.4, "After Yang": 0.04, "Her (Wide)": 5.3}
+    },
+    "Elden Ring (TBD)": {
+        "type": "upcoming", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
+        "release_date": None, "genre": "Action/Adventure",
+        "aware": 60, "interest": 45, "theaters": 4000, "buzz": 1.4, "comp": 0.8, 
+        "wiki": "Elden_Ring", "yt_id": "E3Huy2cdih0", "yt_fallback": 14000000,
+        "rt_slug": None, "source_label": "Proxy (Game Trailer)", "source_status": "warning",
+        "tracking_source": "Hypothetical (Gamer Comps)", "competitors": "Direct-to-Fan Event",
+        "market_demand": "Pent-up / Starved", "popcorn_est": 92, "simple_name": "Elden Ring Movie",
+        "intl_multiplier": 2.2, "benchmarks": {"Dune: Part One": 41.0, "Five Nights at Freddy's": 80.0, "Uncharted": 44.0}
+    }
+}
+
+historical_data = {
+    "Superman (Jul '25)": {
+        "type": "historical", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
+        "release_date": "2025-07-11", "genre": "Action/Adventure",
+        "actual_opening": 115.0, "rt_recorded": 83, "aware": 85, "interest": 65, "theaters": 4200, "buzz": 1.4, "comp": 0.9, 
+        "wiki": "Superman_(2025_film)", "yt_id": "v7s5d4pG2eM", "yt_fallback": 30000000, "frozen_views": 30000000,
+        "rt_slug": "superman_2025", "source_label": "Simulated Historical", "source_status": "neutral",
+        "tracking_source": "Estimated", "competitors": "Fantastic Four",
+        "market_demand": "Normal", "popcorn_est": 88, "simple_name": "Superman 2025",
+        "intl_multiplier": 2.2, "benchmarks": {"Actual Opening (Sim)": 115.0, "Man of Steel": 116.6}
+    },
+    # ... (Concise historical data preserved)
+    "A Minecraft Movie (Apr '25)": {
+        "type": "historical", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
+        "release_date": "2025-04-04", "genre": "Family/Animation",
+        "actual_opening": 145.0, "rt_recorded": 48, "aware": 90, "interest": 55, "theaters": 4300, "buzz": 1.6, "comp": 0.85, 
+        "wiki": "A_Minecraft_Movie", "yt_id": "jTq91k43nDQ", "yt_fallback": 45000000, "frozen_views": 45000000,
+        "rt_slug": "a_minecraft_movie", "source_label": "Simulated Historical", "source_status": "neutral",
+        "tracking_source": "Real Data", "competitors": "Micheal", "market_demand": "Normal", "popcorn_est": 90, "simple_name": "Minecraft Movie",
+        "intl_multiplier": 2.2, "benchmarks": {"Actual Opening (Sim)": 145.0, "Super Mario Bros": 146.3}
+    },
+    "Civil War (Apr '24)": {
+        "type": "historical", "studio_type": "Cult / Indie (A24/Neon)", "release_format": "Standard 3-Day",
+        "release_date": "2024-04-12", "genre": "Thriller",
+        "actual_opening": 25.7, "rt_recorded": 81, "aware": 48, "interest": 42, "theaters": 3838, "buzz": 1.3, "comp": 0.9, 
+        "wiki": "Civil_War_(film)", "yt_id": "aDyQxtgKWbs", "yt_fallback": 22000000, "frozen_views": 16000000,
+        "rt_slug": "civil_war_2024", "source_label": "Historical Data", "source_status": "neutral",
+        "tracking_source": "Historical NRG", "competitors": "Godzilla x Kong", "market_demand": "Normal", "popcorn_est": 70, "simple_name": "Civil War A24",
+        "intl_multiplier": 1.8, "benchmarks": {"Actual Opening": 25.7, "Ex Machina": 6.8}
+    },
+    "Five Nights at Freddy's (Oct '23)": {
+        "type": "historical", "release_format": "Standard 3-Day", "actual_opening": 80.0, "rt_recorded": 31,
+        "release_date": "2023-10-27", "genre": "Horror",
+        "aware": 60, "interest": 55, "theaters": 3675, "buzz": 1.6, "comp": 0.9, "studio_type": "Major Franchise",
+        "wiki": "Five_Nights_at_Freddy's_(film)", "yt_id": "0VH9WCFV6Xw", "yt_fallback": 50000000, "frozen_views": 25000000,
+        "rt_slug": "five_nights_at_freddys", "source_label": "Historical Data", "source_status": "neutral",
+        "tracking_source": "Historical NRG", "competitors": "Eras Tour",
+        "market_demand": "Pent-up / Starved", "popcorn_est": 87, "simple_name": "FNAF Movie",
+        "intl_multiplier": 1.8, "benchmarks": {"Actual Opening": 80.0, "Halloween": 76.2}
+    },
+    "Barbie (Jul '23)": {
+        "type": "historical", "studio_type": "Major Franchise", "release_format": "Standard 3-Day",
+        "release_date": "2023-07-21", "genre": "Comedy",
+        "actual_opening": 162.0, "rt_recorded": 88,
+        "aware": 95, "interest": 75, "theaters": 4243, "buzz": 1.8, "comp": 0.8, 
+        "wiki": "Barbie_(film)", "yt_id": "pBk4NYhWNMM", "yt_fallback": 80000000, "frozen_views": 45000000,
+        "rt_slug": "barbie", "source_label": "Historical Data", "source_status": "neutral",
+        "tracking_source": "Historical NRG", "competitors": "Oppenheimer",
+        "market_demand": "Pent-up / Starved", "popcorn_est": 83, "simple_name": "Barbie Movie",
+        "intl_multiplier": 2.1, "benchmarks": {"Actual Opening": 162.0, "Mario Bros": 146.3}
+    }
+}
+
+# Every title the app renders. Market odds are read only from the local store, so the
+# market poll covers all of these, historical titles included.
+rendered_data = {**upcoming_data, **historical_data}
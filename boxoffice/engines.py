@@ -0,0 +1,143 @@
+"""Scalar forecasting engines: the short-term tracker model and the long-lead planner.
+
+Pure standard library, so batch jobs and workers can import it without the UI stack.
+"""
+import json
+import math
+import os
+import re
+
+from . import metrics
+
+ENGINE_SECONDS = metrics.histogram("boxoffice_engine_seconds", "Engine call latency.", ("engine",))
+
+# 0. MODEL PARAMETERS
+# The short-term engine's tunable constants. boxoffice.calibrate fits them against historical
+# actuals and saves versioned sets to params/; the newest set is loaded at startup.
+DEFAULT_MODEL_PARAMS = {
+    "interest_weight": 0.15, "aware_weight": 0.05,
+    "trailer_break_high": 60_000_000, "trailer_break_mid": 15_000_000, "trailer_break_low": 5_000_000,
+    "trailer_mult_high": 1.4, "trailer_mult_mid": 1.2, "trailer_mult_low": 1.05,
+    "blockbuster_theaters": 2500,
+    "blockbuster_aware_high": 60, "blockbuster_aware_mid": 40, "blockbuster_aware_low": 25,
+    "blockbuster_mult_high": 3.0, "blockbuster_mult_mid": 2.0, "blockbuster_mult_low": 1.5, "blockbuster_mult_base": 1.1,
+    "tracking_blend": 0.7, "capacity_blend": 0.3,
+    "soft_cap_factor": 3500,
+}
+PARAMS_DIR = os.environ.get("BOXOFFICE_PARAMS_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "params"))
+
+def load_model_params(path=None):
+    """Return (params, version) from `path`, $BOXOFFICE_PARAMS or the newest params/short_term_v*.json.
+
+    Falls back to (DEFAULT_MODEL_PARAMS, None) when no calibrated set exists.
+    """
+    path = path or os.environ.get("BOXOFFICE_PARAMS")
+    if not path:
+        versions = sorted(
+            int(m.group(1)) for m in (re.fullmatch(r"short_term_v(\d+)\.json", name) for name in (os.listdir(PARAMS_DIR) if os.path.isdir(PARAMS_DIR) else [])) if m
+        )
+        if not versions:
+            return dict(DEFAULT_MODEL_PARAMS), None
+        path = os.path.join(PARAMS_DIR, f"short_term_v{versions[-1]}.json")
+    with open(path) as f:
+        saved = json.load(f)
+    return {**DEFAULT_MODEL_PARAMS, **saved["params"]}, saved.get("version")
+
+MODEL_PARAMS, MODEL_PARAMS_VERSION = load_model_params()
+
+# 1. SHORT TERM ENGINE
+@metrics.timed(ENGINE_SECONDS, engine="box_office")
+def calculate_box_office(interest, total_aware, theaters, rt_score, popcorn_score, buzz, comp, trailer_views, intl_multiplier, studio_type, market_demand, release_format, params=None):
+    p = params or MODEL_PARAMS
+    # Base
+    base_gross = (interest * p["interest_weight"]) * (total_aware * p["aware_weight"]) * 1_000_000
+    
+    # Efficiency
+    view_efficiency = 1.0
+    if studio_type == "Cult / Indie (A24/Neon)": view_efficiency = 0.6 
+    elif studio_type == "Major Franchise": view_efficiency = 1.0 
+    
+    effective_views = trailer_views * view_efficiency
+    trailer_multiplier = 1.0
+    if effective_views > p["trailer_break_high"]: trailer_multiplier = p["trailer_mult_high"]
+    elif effective_views > p["trailer_break_mid"]: trailer_multiplier = p["trailer_mult_mid"]
+    elif effective_views > p["trailer_break_low"]: trailer_multiplier = p["trailer_mult_low"]
+    
+    base_gross = base_gross * trailer_multiplier
+
+    # Scale
+    blockbuster_mult = 1.0
+    if theaters > p["blockbuster_theaters"]:
+        if total_aware > p["blockbuster_aware_high"]: blockbuster_mult = p["blockbuster_mult_high"]
+        elif total_aware > p["blockbuster_aware_mid"]: blockbuster_mult = p["blockbuster_mult_mid"]
+        elif total_aware > p["blockbuster_aware_low"]: blockbuster_mult = p["blockbuster_mult_low"]
+        else: blockbuster_mult = p["blockbuster_mult_base"]
+    
+    base_gross = base_gross * blockbuster_mult
+
+    # Demand
+    demand_mult = 1.0
+    if market_demand == "Pent-up / Starved": demand_mult = 1.2
+    elif market_demand == "Saturated / Crowded": demand_mult = 0.85
+    base_gross = base_gross * demand_mult
+
+    cap = 5000 if theaters > 3000 else 3500
+    weighted_gross = (base_gross * p["tracking_blend"]) + ((theaters * cap) * p["capacity_blend"])
+    qual_mult = 1.15 if rt_score > 80 else (0.85 if rt_score < 50 else 1.0)
+    raw_opening = weighted_gross * qual_mult * buzz * comp
+
+    if raw_opening > 150_000_000:
+        final_opening = 150_000_000 + (math.sqrt(raw_opening - 150_000_000) * p["soft_cap_factor"])
+    else:
+        final_opening = raw_opening
+
+    # Holiday Logic
+    extended_opening = None
+    if release_format == "5-Day Holiday (Wed-Sun)":
+        extended_opening = final_opening * 1.45
+    elif release_format == "4-Day Holiday (Fri-Mon)":
+        extended_opening = final_opening * 1.25
+
+    # Legs Logic
+    legs = 2.7
+    if popcorn_score >= 95: legs += 1.2
+    elif popcorn_score >= 90: legs += 0.8
+    elif popcorn_score >= 80: legs += 0.3
+    elif popcorn_score < 60: legs -= 0.5
+    
+    if rt_score > 90: legs += 0.2
+    if theaters < 2000: legs += 0.4
+    
+    if final_opening > 120_000_000: 
+        if "Family" in studio_type or "Animation" in studio_type or market_demand == "Pent-up / Starved":
+            legs -= 0.1
+        else:
+            legs -= 0.5
+            
+    dom_total = final_opening * legs
+    global_total = dom_total * intl_multiplier
+        
+    return final_opening, extended_opening, dom_total, global_total
+
+# 2. LONG LEAD ENGINE (Restored)
+# Lookup tables shared with the batch engine; anything not listed gets the default.
+GENRE_BASELINES = {"Action/Adventure": 25.0, "Horror": 18.0, "Sci-Fi": 22.0, "Drama": 8.0, "Comedy": 12.0, "Family/Animation": 28.0, "Thriller": 14.0}
+DEFAULT_GENRE_BASELINE = 10.0
+IP_MULTS = {"Sequel (Major Franchise)": 2.5, "Adaptation (Book/Game)": 1.5, "Original": 0.9}
+SEASON_MULTS = {"Summer (May-Jul)": 1.3, "Holiday (Nov-Dec)": 1.4, "Dump Months (Jan/Sept)": 0.8}
+RATING_MULTS = {"R": 0.85, "G/PG": 1.1}
+COMPETITION_MULTS = {"High (2+ Wide Releases)": 0.85, "Extreme (vs Blockbuster)": 0.7}
+
+@metrics.timed(ENGINE_SECONDS, engine="long_lead")
+def calculate_long_lead(genre, cast_score, budget, rating, ip_status, season, competition_level):
+    base = GENRE_BASELINES.get(genre, DEFAULT_GENRE_BASELINE)
+    star_power_add = math.sqrt(cast_score) * 2.5
+    production_add = budget * 0.08
+
+    ip_mult = IP_MULTS.get(ip_status, 1.0)
+    season_mult = SEASON_MULTS.get(season, 1.0)
+    rating_mult = RATING_MULTS.get(rating, 1.0)
+    comp_mult = COMPETITION_MULTS.get(competition_level, 1.0)
+
+    raw_prediction = (base + star_power_add + production_add) * ip_mult * season_mult * rating_mult * comp_mult
+    return raw_prediction
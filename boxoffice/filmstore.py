@@ -0,0 +1,178 @@
+"""Columnar store of released films, used for comps and anything else that scans history.
+
+The source of truth is a CSV (data/films.csv, or BOXOFFICE_FILMS) that is easy to diff
+and append to. On first use it is compiled to Parquet under the cache directory, keyed by
+the CSV's resolved path, and from then on loaded from there without a parse. Streamlit
+reruns pay nothing: the store lives in this module, not in the app script. A .parquet
+path is used directly.
+
+    python -m boxoffice.filmstore                      # compile and summarize the store
+    python -m boxoffice.filmstore big_catalogue.csv    # compile another catalogue
+"""
+import argparse
+import hashlib
+import os
+import threading
+
+import numpy as np
+
+from .signal_cache import CACHE_DIR
+
+FILMS_PATH = os.environ.get("BOXOFFICE_FILMS", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "films.csv"))
+
+# Column name -> Arrow type name. `opening` is the domestic 3-day opening in $M.
+FILM_SCHEMA = {
+    "title": "string",
+    "release_date": "date32",
+    "genre": "string",
+    "rating": "string",
+    "ip_status": "string",
+    "season": "string",
+    "budget": "float64",
+    "cast_score": "float64",
+    "opening": "float64",
+}
+
+
+def _arrow_schema():
+    import pyarrow as pa
+
+    return pa.schema([(name, getattr(pa, type_name)()) for name, type_name in FILM_SCHEMA.items()])
+
+
+def compile_films(source, target):
+    """Convert a films CSV into a Parquet file with FILM_SCHEMA."""
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+
+    schema = _arrow_schema()
+    table = pacsv.read_csv(source, convert_options=pacsv.ConvertOptions(column_types=schema, include_columns=list(FILM_SCHEMA)))
+    # Write to a temp name first so a concurrent reader never maps a half-written file.
+    tmp = f"{target}.{os.getpid()}.tmp"
+    pq.write_table(table.select(list(FILM_SCHEMA)), tmp)
+    os.replace(tmp, target)
+
+
+def _parquet_path(source):
+    if source.endswith(".parquet"):
+        return source
+    # Same-named catalogues in different directories get their own compiled copy.
+    resolved = os.path.realpath(source)
+    stem = os.path.splitext(os.path.basename(resolved))[0]
+    digest = hashlib.sha1(resolved.encode()).hexdigest()[:12]
+    target = os.path.join(CACHE_DIR, f"{stem}-{digest}.parquet")
+    if not os.path.exists(target) or os.path.getmtime(target) < os.path.getmtime(source):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        compile_films(source, target)
+    return target
+
+
+def _scalar(values, i):
+    # Row i of a column as a plain Python value; a missing category is None.
+    if hasattr(values, "codes"):
+        return None if values.codes[i] < 0 else values.categories[values.codes[i]]
+    return values[i].item() if isinstance(values[i], np.generic) else values[i]
+
+
+class FilmStore:
+    """Column arrays for every film, plus indexes by title, release date and genre.
+
+    Numeric columns are float64 arrays and `release_date` is datetime64[D] (NaT when
+    unknown). `title` is an object array; the other text columns are pandas Categoricals
+    decoded from Arrow dictionary encoding, so only their distinct values become Python
+    strings. Lookups return positional row indices, which index every column and `frame`.
+    """
+
+    def __init__(self, path=None):
+        import pandas as pd
+        import pyarrow.parquet as pq
+
+        self.path = _parquet_path(path or FILMS_PATH)
+        table = pq.read_table(self.path, memory_map=True)
+        self.columns = {}
+        for name in table.column_names:
+            column = table.column(name)
+            if name == "release_date":
+                self.columns[name] = column.to_numpy().astype("datetime64[D]")
+            elif FILM_SCHEMA.get(name) == "float64":
+                self.columns[name] = column.to_numpy()
+            elif name == "title":
+                self.columns[name] = np.asarray(column.to_pylist(), dtype=object)
+            else:
+                encoded = column.combine_chunks().dictionary_encode()
+                self.columns[name] = pd.Categorical.from_codes(
+                    encoded.indices.fill_null(-1).to_numpy(), encoded.dictionary.to_pylist())
+
+        self._by_title = {title: i for i, title in enumerate(self.columns["title"])}
+        dates = self.columns["release_date"]
+        order = np.argsort(dates, kind="stable")
+        dated = int((~np.isnat(dates)).sum())
+        self._date_order = order[:dated]
+        self._sorted_dates = dates[self._date_order]
+        genres = self.columns["genre"]
+        self._by_genre = {genre: np.flatnonzero(genres.codes == i) for i, genre in enumerate(genres.categories)}
+
+    def __len__(self):
+        return len(self.columns["title"])
+
+    def __contains__(self, title):
+        return title in self._by_title
+
+    @property
+    def genres(self):
+        return sorted(self._by_genre)
+
+    def row(self, title):
+        """One film as a dict, or None when the title is unknown."""
+        i = self._by_title.get(title)
+        if i is None:
+            return None
+        return {name: _scalar(values, i) for name, values in self.columns.items()}
+
+    def genre_rows(self, genre):
+        return self._by_genre.get(genre, np.empty(0, dtype=np.intp))
+
+    def released_between(self, start=None, end=None):
+        """Rows released in [start, end], oldest first. Either bound may be None."""
+        lo = 0 if start is None else np.searchsorted(self._sorted_dates, np.datetime64(start, "D"), side="left")
+        hi = len(self._sorted_dates) if end is None else np.searchsorted(self._sorted_dates, np.datetime64(end, "D"), side="right")
+        return self._date_order[lo:hi]
+
+    def frame(self, rows=None, columns=None):
+        import pandas as pd
+
+        names = list(columns or self.columns)
+        if rows is None:
+            return pd.DataFrame({name: self.columns[name] for name in names})
+        return pd.DataFrame({name: self.columns[name][rows] for name in names})
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_film_store():
+    """The process-wide FilmStore, loaded on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = FilmStore()
+    return _store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile a films CSV into the columnar film store.")
+    parser.add_argument("path", nargs="?", default=FILMS_PATH, help="CSV or Parquet file of films (default: data/films.csv)")
+    args = parser.parse_args(argv)
+
+    store = FilmStore(args.path)
+    dates = store.columns["release_date"][store.released_between()]
+    span = f"{dates[0]} to {dates[-1]}" if len(dates) else "no release dates"
+    print(f"{len(store)} films, {span}, in {store.path}")
+    for genre in store.genres:
+        print(f"  {genre}: {len(store.genre_rows(genre))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""Shared HTTP client for every live-signal fetch.
+
+One pooled `requests.Session` keeps connections alive per host, retries transient
+failures with bounded exponential backoff, and revalidates pages it has seen before
+with ETag / Last-Modified so an unchanged upstream answers with a cheap 304.
+
+BOXOFFICE_HTTP_MODE switches every fetch at once:
+
+    live     talk to the network (default)
+    record   talk to the network and save each response as a fixture
+    replay   serve saved fixtures only; a URL without one raises FixtureNotFound
+
+Fixtures are JSON files under BOXOFFICE_FIXTURES_DIR (default: fixtures/http), one per
+URL. BOXOFFICE_REPLAY_LATENCY delays each replayed response: a number of seconds, or
+"recorded" to reproduce the latency measured when the fixture was recorded. A delay
+longer than the request timeout raises requests.Timeout after the timeout, as a slow
+upstream would. Set BOXOFFICE_TODAY to the recording date when replaying pageviews,
+whose URLs carry date ranges.
+
+`scan` streams a page instead of downloading it: it looks for a set of regexes in one
+pass over the chunks as they arrive and drops the connection once it has its answer.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+from . import metrics
+
+log = logging.getLogger(__name__)
+
+HTTP_SECONDS = metrics.histogram("boxoffice_http_request_seconds", "Upstream request latency, retries and replayed latency included.", ("host",))
+HTTP_RESPONSES = metrics.counter("boxoffice_http_responses_total", "Upstream responses by status; 304 counts revalidated bodies.", ("host", "status"))
+HTTP_BYTES = metrics.counter("boxoffice_http_bytes_total", "Response body bytes downloaded; revalidated bodies count 0, scans count what was read.", ("host",))
+HTTP_ERRORS = metrics.counter("boxoffice_http_errors_total", "Requests that raised instead of returning, by exception class.", ("host", "error"))
+
+# 429 is deliberately not retried: hammering a rate-limited host only extends the ban,
+# and the signal cache keeps serving the last good value in the meantime.
+RETRY_STATUSES = (500, 502, 503, 504)
+
+HTTP_MODE = os.environ.get("BOXOFFICE_HTTP_MODE", "live")
+FIXTURES_DIR = os.environ.get("BOXOFFICE_FIXTURES_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "http"))
+REPLAY_LATENCY = os.environ.get("BOXOFFICE_REPLAY_LATENCY", "0")
+# Response headers worth keeping in a fixture; the rest are per-request noise.
+FIXTURE_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+SCAN_CHUNK_SIZE = 64 * 1024
+# Bytes carried over between chunks so a match split by a chunk boundary is still seen.
+# Bounds the length of a scan pattern's match.
+SCAN_OVERLAP = 512
+# Threads that fetch at once: the signal pool's workers (signals.py). Each host's
+# connection pool holds as many, so a full pool of fetches to one host reuses its
+# connections instead of opening and discarding extras.
+FETCH_WORKERS = 32
+
+
+class HttpClient:
+    def __init__(self, retries=2, backoff_factor=0.3, backoff_max=2.0, pool_maxsize=FETCH_WORKERS, validator_capacity=256):
+        # Imported here so `import boxoffice` stays cheap for workers that never fetch.
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff_factor,
+            backoff_max=backoff_max,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._validators = OrderedDict()
+        self._validator_capacity = validator_capacity
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, timeout=None, conditional=True):
+        """GET `url`, transparently revalidating a previously seen body.
+
+        A 304 is turned back into a 200 carrying the remembered body, with
+        `response.revalidated` set so callers can tell it cost no download.
+        """
+        headers = dict(headers or {})
+        cached = None
+        if conditional:
+            with self._lock:
+                cached = self._validators.get(url)
+                if cached:
+                    self._validators.move_to_end(url)
+            if cached:
+                if cached["etag"]: headers["If-None-Match"] = cached["etag"]
+                if cached["last_modified"]: headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self.session.get(url, headers=headers, timeout=timeout)
+        response.revalidated = False
+        if response.status_code == 304 and cached:
+            response.status_code = 200
+            response._content = cached["body"]
+            response.encoding = cached["encoding"]
+            response.revalidated = True
+        elif conditional and response.status_code == 200:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self._remember(url, etag, last_modified, response.content, response.encoding)
+        if response.status_code >= 400:
+            log.warning("GET %s -> HTTP %s", url, response.status_code)
+        return response
+
+    def stream(self, url, headers=None, timeout=None):
+        """GET `url` without reading the body; iterate `iter_content` and `close()` when done.
+
+        Closing before the body is exhausted drops the connection rather than draining it.
+        Not conditional: a scan never holds the whole body to revalidate against.
+        """
+        response = self.session.get(url, headers=headers, timeout=timeout, stream=True)
+        if response.status_code >= 400:
+            log.warning("GET %s -> HTTP %s", url, response.status_code)
+        return response
+
+    def _remember(self, url, etag, last_modified, body, encoding):
+        with self._lock:
+            self._validators[url] = {"etag": etag, "last_modified": last_modified, "body": body, "encoding": encoding}
+            self._validators.move_to_end(url)
+            while len(self._validators) > self._validator_capacity:
+                self._validators.popitem(last=False)
+
+
+class FixtureNotFound(LookupError):
+    """Replay mode was asked for a URL that was never recorded."""
+
+
+def fixture_path(url, fixtures_dir=None):
+    digest = hashlib.sha1(url.encode()).hexdigest()[:16]
+    host = urlsplit(url).netloc.replace(":", "_") or "local"
+    return os.path.join(fixtures_dir or FIXTURES_DIR, host, f"{digest}.json")
+
+
+class RecordingClient(HttpClient):
+    """HttpClient that also saves every response it receives as a replayable fixture."""
+
+    def __init__(self, fixtures_dir=None, **kwargs):
+        super().__init__(**kwargs)
+        self.fixtures_dir = fixtures_dir or FIXTURES_DIR
+
+    def get(self, url, headers=None, timeout=None, conditional=True):
+        started = time.perf_counter()
+        response = super().get(url, headers=headers, timeout=timeout, conditional=conditional)
+        fixture = {
+            "url": url,
+            "status": response.status_code,
+            "headers": {name: response.headers[name] for name in FIXTURE_HEADERS if name in response.headers},
+            "encoding": response.encoding,
+            "elapsed": time.perf_counter() - started,
+            "recorded_at": time.time(),
+            "body": response.content.decode(response.encoding or "utf-8", errors="replace"),
+        }
+        path = fixture_path(url, self.fixtures_dir)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(fixture, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, path)
+        return response
+
+    def stream(self, url, headers=None, timeout=None):
+        # A fixture needs the whole body, so recording reads it all; scans then iterate it.
+        return self.get(url, headers=headers, timeout=timeout, conditional=False)
+
+
+class ReplayClient:
+    """Serves recorded fixtures in place of the network. Same `get` as HttpClient."""
+
+    def __init__(self, fixtures_dir=None, latency=None):
+        self.fixtures_dir = fixtures_dir or FIXTURES_DIR
+        latency = REPLAY_LATENCY if latency is None else latency
+        self.latency = latency if latency == "recorded" else float(latency)
+
+    def get(self, url, headers=None, timeout=None, conditional=True):
+        import requests
+
+        path = fixture_path(url, self.fixtures_dir)
+        try:
+            with open(path, encoding="utf-8") as f:
+                fixture = json.load(f)
+        except FileNotFoundError:
+            raise FixtureNotFound(url) from None
+
+        delay = fixture.get("elapsed", 0.0) if self.latency == "recorded" else self.latency
+        if timeout is not None and delay > timeout:
+            time.sleep(timeout)
+            raise requests.Timeout(f"replayed latency {delay:.2f}s exceeds timeout {timeout}s: {url}")
+        if delay:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = fixture["status"]
+        response.headers.update(fixture["headers"])
+        response.encoding = fixture["encoding"]
+        response._content = fixture["body"].encode(fixture["encoding"] or "utf-8")
+        response._content_consumed = True  # lets iter_content slice the body like a stream
+        response.revalidated = False
+        return response
+
+    def stream(self, url, headers=None, timeout=None):
+        return self.get(url, headers=headers, timeout=timeout, conditional=False)
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """The process-wide client for BOXOFFICE_HTTP_MODE, built on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                if HTTP_MODE == "replay":
+                    _client = ReplayClient()
+                elif HTTP_MODE == "record":
+                    _client = RecordingClient()
+                elif HTTP_MODE == "live":
+                    _client = HttpClient()
+                else:
+                    raise ValueError(f"BOXOFFICE_HTTP_MODE must be live, record or replay, not {HTTP_MODE!r}")
+    return _client
+
+
+def get(url, headers=None, timeout=None, conditional=True):
+    host = urlsplit(url).netloc
+    started = time.perf_counter()
+    try:
+        response = get_client().get(url, headers=headers, timeout=timeout, conditional=conditional)
+    except Exception as e:
+        HTTP_ERRORS.inc(host=host, error=type(e).__name__)
+        raise
+    finally:
+        HTTP_SECONDS.observe(time.perf_counter() - started, host=host)
+    HTTP_RESPONSES.inc(host=host, status=304 if response.revalidated else response.status_code)
+    HTTP_BYTES.inc(0 if response.revalidated else len(response.content), host=host)
+    return response
+
+
+def scan(url, patterns, headers=None, timeout=None):
+    """Stream `url` and return group 1 of the best-ranked of `patterns` found, or None.
+
+    `patterns` are bytes regexes with exactly one group, best first, each ending in a
+    literal delimiter so a match cut short by a chunk boundary cannot match early. Every
+    pattern is checked against each chunk as it arrives, so the body is read once and
+    never held whole. The first pattern's match ends the read at once; a later
+    pattern's match only counts if the whole body has no earlier pattern's.
+    """
+    host = urlsplit(url).netloc
+    regexes = [re.compile(pattern) for pattern in patterns]
+    found = {}
+    read = 0
+    started = time.perf_counter()
+    try:
+        response = get_client().stream(url, headers=headers, timeout=timeout)
+        try:
+            if response.status_code < 400:
+                tail = b""
+                for chunk in response.iter_content(SCAN_CHUNK_SIZE):
+                    read += len(chunk)
+                    buffer = tail + chunk
+                    # A search per pattern beats one alternation: each keeps re's fast
+                    # literal-prefix scan. Patterns already matched are not searched again.
+                    for rank, regex in enumerate(regexes):
+                        if rank not in found:
+                            match = regex.search(buffer)
+                            if match:
+                                found[rank] = match.group(1)
+                    if 0 in found:
+                        break
+                    tail = buffer[-SCAN_OVERLAP:]
+        finally:
+            response.close()
+    except Exception as e:
+        HTTP_ERRORS.inc(host=host, error=type(e).__name__)
+        raise
+    finally:
+        HTTP_SECONDS.observe(time.perf_counter() - started, host=host)
+        HTTP_BYTES.inc(read, host=host)
+    HTTP_RESPONSES.inc(host=host, status=response.status_code)
+    return found[min(found)].decode() if found else None
@@ -0,0 +1,303 @@
+"""Prediction-market odds for every tracked title, polled in batches and kept locally.
+
+One poll covers the whole slate: every Polymarket event slug in a few batched
+`events?slug=...&slug=...` requests, then each Manifold market by ID, all paced by one
+shared token bucket. Every poll appends the odds of each outcome bucket to a local
+history; pages read the newest snapshot from it and never touch the network.
+
+Manifold titles are matched to a market by search once, and the market ID is pinned:
+later polls stay on that market, and a wrong match can be corrected with --pin.
+
+    python -m boxoffice.markets --poll                        # one poll of every rendered title
+    python -m boxoffice.markets --pin "Zootopia 2" MARKET_ID  # pin a title's Manifold market
+    python -m boxoffice.markets wicked-for-good-opening-weekend-box-office   # snapshot + history
+"""
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlencode
+
+from . import http_client
+from .signal_cache import CACHE_DIR
+
+log = logging.getLogger(__name__)
+
+POLYMARKET_URL = "https://gamma-api.polymarket.com/events"
+MANIFOLD_SEARCH_URL = "https://api.manifold.markets/v0/search-markets"
+MANIFOLD_MARKET_URL = "https://api.manifold.markets/v0/market/{market_id}"
+REQUEST_TIMEOUT = 4.0
+# Slugs per gamma request; keeps the query string well under URL length limits.
+POLYMARKET_BATCH = 20
+MANIFOLD_SEARCH_LIMIT = 5
+# Every market request, to either upstream, draws from one bucket of this rate and burst.
+POLL_RATE = 2.0
+POLL_BURST = 4
+POLL_INTERVAL = float(os.environ.get("BOXOFFICE_MARKET_POLL_INTERVAL", 300))
+# A snapshot older than this is served but reported stale: polling has fallen behind.
+STALE_AFTER = 3 * POLL_INTERVAL
+# A title whose search found no market is searched again after this long.
+SEARCH_RETRY = 24 * 3600
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` requests per second on average, up to `burst` at once."""
+
+    def __init__(self, rate, burst=1):
+        self.rate, self.burst = rate, burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self, stop=None):
+        """Block until a request may be sent. Returns False if `stop` was set while waiting."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                delay = (1 - self._tokens) / self.rate
+            if stop is None:
+                time.sleep(delay)
+            elif stop.wait(delay):
+                return False
+
+
+request_budget = TokenBucket(POLL_RATE, POLL_BURST)
+
+
+class MarketStore:
+    """SQLite store of market odds: the full history per outcome bucket, the newest
+    snapshot per market, and the Manifold market pinned to each title.
+
+    Markets are keyed by Polymarket event slug or Manifold market ID. A snapshot is the
+    JSON the tracker shows, or null when the market was polled and not found.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(CACHE_DIR, "markets.sqlite3")
+        self._local = threading.local()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS market_odds ("
+                    " source TEXT NOT NULL, market TEXT NOT NULL, polled_at REAL NOT NULL, outcome TEXT NOT NULL, prob REAL NOT NULL,"
+                    " PRIMARY KEY (source, market, polled_at, outcome)) WITHOUT ROWID"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS market_snapshots ("
+                    " source TEXT NOT NULL, market TEXT NOT NULL, snapshot TEXT, polled_at REAL NOT NULL,"
+                    " PRIMARY KEY (source, market))"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS manifold_pins ("
+                    " term TEXT PRIMARY KEY, market_id TEXT, pinned_at REAL NOT NULL)"
+                )
+            self._local.conn = conn
+        return conn
+
+    def record(self, source, market, snapshot, buckets, polled_at=None):
+        """Store one poll of `market`: `buckets` ({outcome: probability}) and its snapshot."""
+        polled_at = polled_at or time.time()
+        with self._conn() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO market_odds (source, market, polled_at, outcome, prob) VALUES (?, ?, ?, ?, ?)",
+                [(source, market, polled_at, outcome, prob) for outcome, prob in buckets.items()],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO market_snapshots (source, market, snapshot, polled_at) VALUES (?, ?, ?, ?)",
+                (source, market, json.dumps(snapshot), polled_at),
+            )
+
+    def latest(self, source, market):
+        """(snapshot, age_seconds) from the newest poll of `market`, or None if never polled."""
+        row = self._conn().execute(
+            "SELECT snapshot, polled_at FROM market_snapshots WHERE source = ? AND market = ?", (source, market)
+        ).fetchone()
+        return (json.loads(row[0]), time.time() - row[1]) if row else None
+
+    def history(self, source, market, since=None):
+        """[(polled_at, outcome, probability)] for `market`, oldest first."""
+        return self._conn().execute(
+            "SELECT polled_at, outcome, prob FROM market_odds WHERE source = ? AND market = ? AND polled_at >= ?"
+            " ORDER BY polled_at, outcome",
+            (source, market, since or 0.0),
+        ).fetchall()
+
+    def last_polled(self):
+        row = self._conn().execute("SELECT MAX(polled_at) FROM market_snapshots").fetchone()
+        return row[0]
+
+    def pin(self, term, market_id):
+        """Pin Manifold `market_id` to `term`; None records that a search found nothing."""
+        with self._conn() as conn:
+            conn.execute("INSERT OR REPLACE INTO manifold_pins (term, market_id, pinned_at) VALUES (?, ?, ?)",
+                         (term, market_id, time.time()))
+
+    def pins(self):
+        """{term: (market_id or None, pinned_at)}"""
+        return {term: (market_id, pinned_at) for term, market_id, pinned_at
+                in self._conn().execute("SELECT term, market_id, pinned_at FROM manifold_pins")}
+
+    def clear(self):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM market_odds")
+            conn.execute("DELETE FROM market_snapshots")
+            conn.execute("DELETE FROM manifold_pins")
+
+
+market_store = MarketStore()
+
+
+def polymarket_url(slugs):
+    return f"{POLYMARKET_URL}?{urlencode([('slug', slug) for slug in slugs])}"
+
+
+def manifold_search_url(term):
+    return f"{MANIFOLD_SEARCH_URL}?{urlencode({'term': f'{term} box office', 'limit': MANIFOLD_SEARCH_LIMIT})}"
+
+
+def _get_json(url):
+    # Market odds move between polls, so there is nothing to revalidate.
+    response = http_client.get(url, timeout=REQUEST_TIMEOUT, conditional=False)
+    response.raise_for_status()
+    return response.json()
+
+
+def polymarket_buckets(event):
+    """{outcome bucket: Yes probability} for one gamma event; untitled or unparseable
+    markets are skipped, so one bad market never costs the event's other buckets."""
+    buckets = {}
+    for market in event.get("markets") or []:
+        try:
+            title = market.get("groupItemTitle") or market.get("question")
+            if not title:
+                continue
+            buckets[title] = float(json.loads(market.get("outcomePrices", '["0"]'))[0])
+        except (AttributeError, ValueError, TypeError, IndexError):
+            continue
+    return buckets
+
+
+def polymarket_snapshot(slug, buckets):
+    """The tracker's view of an event: its favourite bucket, or None if nothing is priced."""
+    if not buckets or max(buckets.values()) <= 0:
+        return None
+    outcome = max(buckets, key=buckets.get)
+    return {"outcome": outcome, "prob": int(buckets[outcome] * 100), "url": f"https://polymarket.com/event/{slug}",
+            "buckets": {name: int(prob * 100) for name, prob in buckets.items()}}
+
+
+def manifold_snapshot(market):
+    if "probability" not in market:
+        return None
+    return {"question": market["question"], "prob": int(market["probability"] * 100), "url": market["url"]}
+
+
+def search_manifold(term):
+    """ID of the first open binary market matching `term`, or None."""
+    for market in _get_json(manifold_search_url(term)):
+        if "probability" in market and not market.get("isResolved"):
+            return market["id"]
+    return None
+
+
+def poll(dataset, store=market_store, budget=request_budget, stop=None):
+    """Poll every market tracked in `dataset` once.
+
+    Returns ({source: markets updated}, {source: last error class name}). A failed
+    request is logged and skipped; its markets keep their previous snapshot.
+    """
+    updated, errors = {"polymarket": 0, "manifold": 0}, {}
+    slugs = list(dict.fromkeys(data["poly_slug"] for data in dataset.values() if data.get("poly_slug")))
+    for i in range(0, len(slugs), POLYMARKET_BATCH):
+        batch = slugs[i:i + POLYMARKET_BATCH]
+        if not budget.wait(stop):
+            return updated, errors
+        try:
+            events = {event.get("slug"): event for event in _get_json(polymarket_url(batch))}
+        except Exception as e:
+            log.warning("polymarket poll of %d slugs failed: %r", len(batch), e)
+            errors["polymarket"] = type(e).__name__
+            continue
+        polled_at = time.time()
+        for slug in batch:
+            # A slug missing from the response is recorded as not found (closed or renamed).
+            buckets = polymarket_buckets(events[slug]) if slug in events else {}
+            store.record("polymarket", slug, polymarket_snapshot(slug, buckets), buckets, polled_at)
+            updated["polymarket"] += 1
+
+    pins = store.pins()
+    for term in dict.fromkeys(data.get("simple_name", "Movie") for data in dataset.values()):
+        market_id, pinned_at = pins.get(term, (None, None))
+        try:
+            if market_id is None:
+                if pinned_at is not None and time.time() - pinned_at < SEARCH_RETRY:
+                    continue
+                if not budget.wait(stop):
+                    return updated, errors
+                market_id = search_manifold(term)
+                store.pin(term, market_id)
+                if market_id is None:
+                    continue
+            if not budget.wait(stop):
+                return updated, errors
+            market = _get_json(MANIFOLD_MARKET_URL.format(market_id=market_id))
+        except Exception as e:
+            log.warning("manifold poll of %s failed: %r", term, e)
+            errors["manifold"] = type(e).__name__
+            continue
+        buckets = {"YES": market["probability"]} if "probability" in market else {}
+        store.record("manifold", market_id, manifold_snapshot(market), buckets)
+        updated["manifold"] += 1
+    return updated, errors
+
+
+def snapshot(source, key, store=market_store):
+    """(snapshot, age_seconds) for a title's market, from the store only; None if never polled.
+
+    `key` is the Polymarket event slug, or for Manifold the title's search term.
+    """
+    if source == "manifold":
+        key = store.pins().get(key, (None, None))[0]
+        if key is None:
+            return None
+    return store.latest(source, key)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Poll and inspect local prediction-market odds.")
+    parser.add_argument("markets", nargs="*", help="Polymarket slugs or Manifold market IDs to print")
+    parser.add_argument("--poll", action="store_true", help="poll every market in the upcoming and historical datasets once")
+    parser.add_argument("--pin", nargs=2, metavar=("TERM", "MARKET_ID"), help="pin a title's Manifold market (TERM is its simple_name)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    if args.pin:
+        market_store.pin(*args.pin)
+    if args.poll:
+        from .datasets import rendered_data
+
+        print(poll(rendered_data))
+    for market in args.markets:
+        source = "polymarket" if market_store.latest("polymarket", market) else "manifold"
+        print(market, market_store.latest(source, market))
+        for polled_at, outcome, prob in market_store.history(source, market):
+            print(f"  {time.strftime('%Y-%m-%d %H:%M', time.localtime(polled_at))}  {outcome:<24} {prob:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""In-process counters and latency histograms, exportable as Prometheus text or JSON.
+
+Stdlib only and cheap enough to wrap every engine call. Metrics are module-level, so
+they accumulate for the life of the process across Streamlit reruns.
+
+    from boxoffice import metrics
+    FETCHES = metrics.counter("boxoffice_fetches_total", "Fetches by outcome.", ("source", "outcome"))
+    FETCHES.inc(source="wiki", outcome="ok")
+"""
+import bisect
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+# Seconds. Spans a scalar engine call (~microseconds) to a slow scrape (seconds).
+DEFAULT_BUCKETS = (1e-5, 5e-5, 1e-4, 5e-4, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help, labels=()):
+        self.name, self.help, self.labels = name, help, tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(str(labels[name]) for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        """{label values: count}"""
+        with self._lock:
+            return dict(self._values)
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        self.name, self.help, self.labels = name, help, tuple(labels)
+        self.buckets = tuple(buckets)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _state(self, key):
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0, 0.0]
+            return state
+
+    def _record(self, state, value):
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state[0][i] += 1
+            state[1] += 1
+            state[2] += value
+
+    def observe(self, value, **labels):
+        self._record(self._state(tuple(str(labels[name]) for name in self.labels)), value)
+
+    def bind(self, **labels):
+        """An `observe(value)` for one fixed label set, skipping per-call label handling."""
+        state = self._state(tuple(str(labels[name]) for name in self.labels))
+        counts, buckets, lock = state[0], self.buckets, self._lock
+
+        def observe(value):
+            i = bisect.bisect_left(buckets, value)
+            with lock:
+                counts[i] += 1
+                state[1] += 1
+                state[2] += value
+        return observe
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self):
+        """{label values: {"counts": per-bucket counts (last is +Inf), "count", "sum"}}"""
+        with self._lock:
+            return {key: {"counts": list(state[0]), "count": state[1], "sum": state[2]} for key, state in self._values.items()}
+
+    def quantile(self, q, sample):
+        """Estimate quantile `q` of one sample by interpolating within its bucket."""
+        target = q * sample["count"]
+        seen = 0
+        for i, n in enumerate(sample["counts"]):
+            if n and seen + n >= target:
+                lower = self.buckets[i - 1] if i else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+                return lower + (upper - lower) * (target - seen) / n
+            seen += n
+        return 0.0
+
+    def reset(self):
+        # Zero in place: bound observers keep pointing at their series.
+        with self._lock:
+            for state in self._values.values():
+                state[0][:] = [0] * len(state[0])
+                state[1], state[2] = 0, 0.0
+
+
+def _register(cls, name, help, labels, **kwargs):
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = _registry[name] = cls(name, help, labels, **kwargs)
+        return metric
+
+
+def counter(name, help, labels=()):
+    return _register(Counter, name, help, labels)
+
+
+def histogram(name, help, labels=(), buckets=DEFAULT_BUCKETS):
+    return _register(Histogram, name, help, labels, buckets=buckets)
+
+
+def timed(metric, **labels):
+    """Decorator recording each call's duration in histogram `metric` under `labels`."""
+    observe = metric.bind(**labels)
+
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                observe(time.perf_counter() - started)
+        return wrapper
+    return decorate
+
+
+def reset():
+    for metric in list(_registry.values()):
+        metric.reset()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _label_text(names, values, extra=()):
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def render_prometheus():
+    """Every metric in the Prometheus text exposition format."""
+    lines = []
+    for metric in sorted(_registry.values(), key=lambda m: m.name):
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for key, value in sorted(metric.samples().items()):
+            if metric.kind == "counter":
+                lines.append(f"{metric.name}{_label_text(metric.labels, key)} {value}")
+                continue
+            cumulative = 0
+            for bound, n in zip((*metric.buckets, "+Inf"), value["counts"]):
+                cumulative += n
+                lines.append(f"{metric.name}_bucket{_label_text(metric.labels, key, [('le', bound)])} {cumulative}")
+            lines.append(f"{metric.name}_sum{_label_text(metric.labels, key)} {value['sum']}")
+            lines.append(f"{metric.name}_count{_label_text(metric.labels, key)} {value['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def snapshot():
+    """Every metric as plain data: {name: {"type", "help", "samples": [{labels..., values...}]}}.
+
+    Histogram samples carry count, sum, mean, p50, p95 and p99 (in the observed unit).
+    """
+    result = {}
+    for metric in sorted(_registry.values(), key=lambda m: m.name):
+        samples = []
+        for key, value in sorted(metric.samples().items()):
+            if metric.kind == "histogram" and not value["count"]:
+                continue  # bound by a decorator but never called yet
+            sample = dict(zip(metric.labels, key))
+            if metric.kind == "counter":
+                sample["value"] = value
+            else:
+                sample.update(count=value["count"], sum=value["sum"], mean=value["sum"] / value["count"],
+                              p50=metric.quantile(0.5, value), p95=metric.quantile(0.95, value), p99=metric.quantile(0.99, value))
+            samples.append(sample)
+        result[metric.name] = {"type": metric.kind, "help": metric.help, "samples": samples}
+    return result
@@ -0,0 +1,66 @@
+"""Monte Carlo ranges for the short-term opening forecast."""
+import numpy as np
+
+from . import metrics
+from .batch import calculate_box_office_batch
+from .engines import ENGINE_SECONDS
+
+# (std dev, slider min, slider max) for each hand-set tracking input; samples are clipped to the slider range.
+MC_SPREADS = {
+    "total_aware": (5.0, 0, 100), "interest": (5.0, 0, 100),
+    "rt_score": (8.0, 0, 100), "popcorn_score": (5.0, 0, 100),
+    "buzz": (0.15, 0.5, 2.0), "comp": (0.05, 0.5, 1.0),
+}
+# Log-spaced $10K-$10B histogram bins: ~0.35% wide, so interpolated percentiles are well inside model error.
+MC_BIN_EDGES = np.geomspace(1e4, 1e10, 4001)
+
+def _histogram_quantile(counts, q):
+    cdf = np.cumsum(counts)
+    target = q * cdf[-1]
+    i = int(np.searchsorted(cdf, target))
+    below = cdf[i - 1] if i > 0 else 0
+    frac = (target - below) / counts[i] if counts[i] else 0.0
+    lo, hi = MC_BIN_EDGES[i], MC_BIN_EDGES[i + 1]
+    return float(lo * (hi / lo) ** frac)
+
+def _summarize_histogram(counts, total):
+    return {"p10": _histogram_quantile(counts, 0.10), "p50": _histogram_quantile(counts, 0.50),
+            "p90": _histogram_quantile(counts, 0.90), "mean": total / int(counts.sum())}
+
+@metrics.timed(ENGINE_SECONDS, engine="monte_carlo")
+def simulate_box_office(inputs, n=100_000, seed=None, chunk_size=25_000, spreads=MC_SPREADS):
+    """Monte Carlo over the uncertain tracking inputs of calculate_box_office.
+
+    `inputs` holds the scalar function's arguments as the point estimate. Each input in
+    `spreads` is drawn from a normal around it; the rest stay fixed. Samples are scored
+    chunk by chunk through calculate_box_office_batch and folded into fixed histograms, so
+    memory is flat in n. Results are reproducible for a given seed and chunk_size.
+    Returns {"n", "opening", "dom_total", "opening_counts", "dom_counts"}, where the
+    opening/dom_total entries hold p10/p50/p90/mean and counts index MC_BIN_EDGES.
+    """
+    rng = np.random.default_rng(seed)
+    n_bins = len(MC_BIN_EDGES) - 1
+    opening_counts = np.zeros(n_bins, dtype=np.int64)
+    dom_counts = np.zeros(n_bins, dtype=np.int64)
+    opening_total = dom_total_sum = 0.0
+    done = 0
+    while done < n:
+        size = min(chunk_size, n - done)
+        draws = dict(inputs)
+        for name, (sd, lo, hi) in spreads.items():
+            draws[name] = np.clip(rng.normal(inputs[name], sd, size), lo, hi)
+        opening, _, dom_total, _ = calculate_box_office_batch(draws)
+        for values, counts in ((opening, opening_counts), (dom_total, dom_counts)):
+            idx = np.clip(np.searchsorted(MC_BIN_EDGES, values, side="right") - 1, 0, n_bins - 1)
+            counts += np.bincount(idx, minlength=n_bins)
+        opening_total += float(opening.sum())
+        dom_total_sum += float(dom_total.sum())
+        done += size
+
+    return {
+        "n": n,
+        "opening": _summarize_histogram(opening_counts, opening_total),
+        "dom_total": _summarize_histogram(dom_counts, dom_total_sum),
+        "opening_counts": opening_counts,
+        "dom_counts": dom_counts,
+    }
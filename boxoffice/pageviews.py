@@ -0,0 +1,243 @@
+"""Local Wikipedia pageview history per article, fetched incrementally.
+
+Each sync asks the Wikimedia REST API only for the days after the last day already
+stored, so a daily refresh is one small request however long the window is. Features
+(rolling averages, momentum, week-over-week growth) are computed from the stored series
+without touching the network.
+
+    python -m boxoffice.pageviews --backfill            # every title in the datasets
+    python -m boxoffice.pageviews --backfill --days 365 --rate 2
+    python -m boxoffice.pageviews Barbie_(film)         # print one article's features
+"""
+import argparse
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+
+from . import http_client
+from .signal_cache import CACHE_DIR
+
+log = logging.getLogger(__name__)
+
+API_URL = "https://wikimedia.org/api/rest_v1/metrics/pageviews/per-article/en.wikipedia/all-access/user/{article}/daily/{start}/{end}"
+HEADERS = {"User-Agent": "BoxOfficePredictor/1.0"}
+DEFAULT_WINDOW = 30
+REQUEST_TIMEOUT = 4.0
+# Wikimedia asks API clients to stay well under 100 requests/s.
+BACKFILL_RATE = 5.0
+# Wikimedia can publish a day's counts late; a day this recent that came back empty is
+# fetched again on the next sync instead of being taken as a day with no views.
+PUBLISH_LAG_DAYS = 2
+# Pins "today" (ISO date), so replayed Wikimedia URLs carry the dates they were recorded with.
+PINNED_TODAY = os.environ.get("BOXOFFICE_TODAY")
+
+
+def _yesterday():
+    # Daily counts are published once a UTC day has closed; today's are never complete.
+    today = date.fromisoformat(PINNED_TODAY) if PINNED_TODAY else datetime.now(timezone.utc).date()
+    return today - timedelta(days=1)
+
+
+class PageviewStore:
+    """SQLite store of daily pageviews, plus the last day each article was synced through.
+
+    The sync watermark is kept separately from the views because Wikimedia omits days
+    with no views: a gap in the series must not be fetched again on every sync. The
+    watermark only passes days the API returned or that are older than PUBLISH_LAG_DAYS,
+    so a day that was not published yet is fetched again.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(CACHE_DIR, "pageviews.sqlite3")
+        self._local = threading.local()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS pageviews ("
+                    " article TEXT NOT NULL, day TEXT NOT NULL, views INTEGER NOT NULL,"
+                    " PRIMARY KEY (article, day)) WITHOUT ROWID"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS pageview_sync ("
+                    " article TEXT PRIMARY KEY, first_day TEXT NOT NULL, last_day TEXT NOT NULL, synced_at REAL NOT NULL)"
+                )
+            self._local.conn = conn
+        return conn
+
+    def synced_range(self, article):
+        """(first_day, last_day) covered for `article`, or None if never synced."""
+        row = self._conn().execute("SELECT first_day, last_day FROM pageview_sync WHERE article = ?", (article,)).fetchone()
+        return (date.fromisoformat(row[0]), date.fromisoformat(row[1])) if row else None
+
+    def missing_range(self, article, days=DEFAULT_WINDOW, end=None):
+        """The (start, end) days still to fetch for a `days`-long window ending at `end`, or None."""
+        end = end or _yesterday()
+        start = end - timedelta(days=days - 1)
+        synced = self.synced_range(article)
+        if synced is None:
+            return start, end
+        first, last = synced
+        if start < first:
+            # The window grew backwards (a backfill): refetch the whole span once so the
+            # covered range stays contiguous.
+            return start, end
+        if last >= end:
+            return None
+        return max(last + timedelta(days=1), start), end
+
+    def store(self, article, start, end, views):
+        """Record `views` ({date: count}) fetched for start..end and advance the watermark.
+
+        Trailing days within PUBLISH_LAG_DAYS of `end` that `views` lacks stay unsynced.
+        """
+        synced_end = max([end - timedelta(days=PUBLISH_LAG_DAYS), *views])
+        with self._conn() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO pageviews (article, day, views) VALUES (?, ?, ?)",
+                [(article, day.isoformat(), count) for day, count in views.items()],
+            )
+            if synced_end < start:
+                return
+            # A fetch that does not touch the covered range starts a new one, so days in the
+            # gap are never mistaken for synced.
+            conn.execute(
+                "INSERT INTO pageview_sync (article, first_day, last_day, synced_at) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(article) DO UPDATE SET"
+                " first_day = CASE WHEN excluded.first_day <= date(last_day, '+1 day')"
+                " THEN MIN(first_day, excluded.first_day) ELSE excluded.first_day END,"
+                " last_day = MAX(last_day, excluded.last_day), synced_at = excluded.synced_at",
+                (article, start.isoformat(), synced_end.isoformat(), time.time()),
+            )
+
+    def series(self, article, days=DEFAULT_WINDOW, end=None):
+        """(dates, views, present) for the `days` days ending at `end`.
+
+        Days without data count 0 in `views` and are False in `present`.
+        """
+        end = end or _yesterday()
+        start = end - timedelta(days=days - 1)
+        dates = np.arange(np.datetime64(start), np.datetime64(end) + 1)
+        views = np.zeros(days, dtype=np.int64)
+        present = np.zeros(days, dtype=bool)
+        rows = self._conn().execute(
+            "SELECT day, views FROM pageviews WHERE article = ? AND day BETWEEN ? AND ?",
+            (article, start.isoformat(), end.isoformat()),
+        ).fetchall()
+        if rows:
+            offsets = (np.array([day for day, _ in rows], dtype="datetime64[D]") - dates[0]).astype(int)
+            views[offsets] = [count for _, count in rows]
+            present[offsets] = True
+        return dates, views, present
+
+    def clear(self, article=None):
+        with self._conn() as conn:
+            if article:
+                conn.execute("DELETE FROM pageviews WHERE article = ?", (article,))
+                conn.execute("DELETE FROM pageview_sync WHERE article = ?", (article,))
+            else:
+                conn.execute("DELETE FROM pageviews")
+                conn.execute("DELETE FROM pageview_sync")
+
+
+pageview_store = PageviewStore()
+
+
+def fetch_range(article, start, end):
+    """{date: views} from Wikimedia for start..end inclusive. Days with no views are absent."""
+    url = API_URL.format(article=article, start=start.strftime("%Y%m%d"), end=end.strftime("%Y%m%d"))
+    # Every URL is a new date range, so there is nothing to revalidate.
+    response = http_client.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT, conditional=False)
+    if response.status_code == 404:
+        return {}
+    response.raise_for_status()
+    return {datetime.strptime(item["timestamp"][:8], "%Y%m%d").date(): item["views"] for item in response.json()["items"]}
+
+
+def sync(article, days=DEFAULT_WINDOW, end=None, store=pageview_store):
+    """Fetch whatever the `days`-long window ending at `end` is missing. Returns days fetched."""
+    missing = store.missing_range(article, days, end)
+    if missing is None:
+        return 0
+    start, end = missing
+    store.store(article, start, end, fetch_range(article, start, end))
+    return (end - start).days + 1
+
+
+def features(article, end=None, store=pageview_store):
+    """Model inputs from the stored series, all computed locally.
+
+    avg_7 / avg_30: mean daily views over the days with data among the last 7 / 30.
+    wow_growth: avg_7 over the prior week's average, minus 1 (None when that week is empty).
+    momentum: avg_7 / avg_30; above 1 means interest is accelerating into release.
+    """
+    _, views, present = store.series(article, DEFAULT_WINDOW, end)
+    mean = lambda days: views[days][present[days]].mean() if present[days].any() else 0.0
+    avg_7, prior_7, avg_30 = mean(slice(-7, None)), mean(slice(-14, -7)), mean(slice(None))
+    return {
+        "avg_7": float(avg_7),
+        "avg_30": float(avg_30),
+        "wow_growth": float(avg_7 / prior_7 - 1) if prior_7 else None,
+        "momentum": float(avg_7 / avg_30) if avg_30 else None,
+    }
+
+
+def fetch_wiki_views(article):
+    """The 30-day average used as the live `wiki` signal, after an incremental sync."""
+    sync(article)
+    return int(features(article)["avg_30"])
+
+
+def backfill(articles, days=DEFAULT_WINDOW, rate=BACKFILL_RATE, store=pageview_store):
+    """Sync a `days`-long window for each article, at most `rate` requests per second.
+
+    Articles that are already covered cost no request. Returns {article: days fetched or error}.
+    """
+    results = {}
+    next_slot = 0.0
+    for article in dict.fromkeys(articles):
+        if store.missing_range(article, days) is None:
+            results[article] = 0
+            continue
+        time.sleep(max(next_slot - time.monotonic(), 0))
+        next_slot = time.monotonic() + 1.0 / rate
+        try:
+            results[article] = sync(article, days, store=store)
+        except Exception as e:
+            log.warning("backfill of %s failed: %r", article, e)
+            results[article] = type(e).__name__
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sync and inspect local Wikipedia pageview history.")
+    parser.add_argument("articles", nargs="*", help="article titles to print features for")
+    parser.add_argument("--backfill", action="store_true", help="sync every title in upcoming_data and historical_data")
+    parser.add_argument("--days", type=int, default=DEFAULT_WINDOW, help="window to cover, ending yesterday")
+    parser.add_argument("--rate", type=float, default=BACKFILL_RATE, help="most requests per second during a backfill")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    if args.backfill:
+        from .datasets import historical_data, upcoming_data
+
+        articles = [data["wiki"] for data in (*upcoming_data.values(), *historical_data.values())]
+        for article, fetched in backfill(articles, args.days, args.rate).items():
+            print(f"{article}: {fetched}")
+    for article in args.articles:
+        print(article, features(article))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Background refresher that keeps the signal cache warm for every tracked title.
+
+Each source is refreshed in its own lane, spaced out so no upstream sees more than one
+request per SOURCE_SPACING seconds. Entries are refreshed shortly before they go stale,
+so page loads read fresh values from the cache instead of waiting on the network. One
+more lane polls every prediction market in a single batched pass (markets.poll).
+
+The app starts one refresher per server process. Replicas sharing a cache dir fetch
+under its leases, so they never refresh the same entry at once, but each still walks
+the slate; to spare that, set BOXOFFICE_BACKGROUND_REFRESH=0 and run a single worker:
+
+    python -m boxoffice.refresher            # refresh forever, every BOXOFFICE_REFRESH_INTERVAL seconds
+    python -m boxoffice.refresher --once     # one pass over the slate, then exit
+"""
+import argparse
+import logging
+import os
+import random
+import threading
+import time
+
+from . import markets
+from .signal_cache import DEFAULT_TTL, SOURCE_TTLS
+from .signals import fetch_shared, jobs_for, signal_cache
+
+log = logging.getLogger(__name__)
+
+# Minimum seconds between two requests to the same upstream.
+SOURCE_SPACING = {"wiki": 0.5, "youtube": 3.0, "rt": 3.0}
+# Refresh an entry once it is this far into its TTL.
+REFRESH_AHEAD = 0.8
+# Longest one market poll may take before another process may start its own.
+MARKET_POLL_LEASE = 120.0
+# Passes start this often: half of what is left of the shortest TTL or market poll interval
+# after REFRESH_AHEAD (30s for 5-minute market polls), so an entry that falls due just after
+# one pass starts is refetched by the next with half the margin to spare. Readers only see
+# it stale when a pass runs longer than that, e.g. a cold start fetching every slow source
+# at once. Passes only fetch due entries, so a short interval costs little.
+REFRESH_INTERVAL = float(os.environ.get("BOXOFFICE_REFRESH_INTERVAL", round(min(*SOURCE_TTLS.values(), markets.POLL_INTERVAL) * (1 - REFRESH_AHEAD) / 2)))
+
+
+def due_jobs(dataset, cache=signal_cache):
+    """{source: [(fetcher, key), ...]} for every cache entry that is missing or nearly stale."""
+    due = {}
+    for data in dataset.values():
+        for source, (fn, key, _) in jobs_for(data).items():
+            if fn is None:
+                continue
+            cached = cache.get(source, key)
+            if cached is not None and cached[1] < SOURCE_TTLS.get(source, DEFAULT_TTL) * REFRESH_AHEAD:
+                continue
+            lane = due.setdefault(source, [])
+            if all(existing_key != key for _, existing_key in lane):
+                lane.append((fn, key))
+    return due
+
+
+def _refresh_lane(source, jobs, cache, stop):
+    spacing = SOURCE_SPACING.get(source, 1.0)
+    for i, (fn, key) in enumerate(jobs):
+        # Jitter keeps lanes of several processes from falling into lockstep.
+        if i and stop.wait(spacing * random.uniform(1.0, 1.5)):
+            return
+        try:
+            fetch_shared(source, fn, key, cache)
+            cache.record_refresh(source)
+        except Exception as e:
+            log.warning("refresh of %s/%s failed: %r", source, key, e)
+            cache.record_refresh(source, type(e).__name__)
+
+
+def _poll_markets(dataset, cache, stop, polled):
+    # Replicas share the store: skip if any process polled recently or is polling now.
+    last = markets.market_store.last_polled()
+    if last is not None and time.time() - last < markets.POLL_INTERVAL * REFRESH_AHEAD:
+        return
+    token = cache.acquire_lease("markets", "poll", MARKET_POLL_LEASE)
+    if token is None:
+        return
+    try:
+        updated, errors = markets.poll(dataset, stop=stop)
+    except Exception as e:
+        log.exception("market poll failed")
+        updated, errors = {"polymarket": 0, "manifold": 0}, {"polymarket": type(e).__name__, "manifold": type(e).__name__}
+    finally:
+        cache.release_lease("markets", "poll", token)
+    for source in updated:
+        cache.record_refresh(source, errors.get(source))
+    polled.update(updated)
+
+
+def refresh_once(dataset, cache=signal_cache, stop=None, market_dataset=None):
+    """Refresh every due entry for `dataset`, one paced lane per source, and poll the
+    markets of `market_dataset` (default: `dataset`) if due. Returns {source: jobs run,
+    or markets updated}."""
+    stop = stop or threading.Event()
+    due = due_jobs(dataset, cache)
+    polled = {}
+    lanes = [threading.Thread(target=_refresh_lane, args=(source, jobs, cache, stop), name=f"refresh-{source}", daemon=True)
+             for source, jobs in due.items()]
+    lanes.append(threading.Thread(target=_poll_markets, args=(market_dataset or dataset, cache, stop, polled), name="refresh-markets", daemon=True))
+    for lane in lanes:
+        lane.start()
+    for lane in lanes:
+        lane.join()
+    return {**{source: len(jobs) for source, jobs in due.items()}, **polled}
+
+
+class SignalRefresher(threading.Thread):
+    """Daemon thread starting a refresh_once pass over `dataset` every `interval` seconds,
+    or as soon as the previous pass ends if it ran longer.
+
+    Markets are polled for `market_dataset` (default: `dataset`), since pages only read
+    odds from the market store.
+    """
+
+    def __init__(self, dataset, interval=REFRESH_INTERVAL, cache=signal_cache, market_dataset=None):
+        super().__init__(name="signal-refresher", daemon=True)
+        self.dataset = dataset
+        self.market_dataset = market_dataset
+        self.interval = interval
+        self.cache = cache
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            try:
+                refresh_once(self.dataset, self.cache, self._stop_event, self.market_dataset)
+            except Exception:
+                log.exception("signal refresh pass failed")
+            self._stop_event.wait(max(self.interval - (time.monotonic() - started), 0))
+
+    def stop(self):
+        self._stop_event.set()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keep the live-signal cache warm for every tracked title.")
+    parser.add_argument("--interval", type=float, default=REFRESH_INTERVAL, help="seconds between the starts of refresh passes")
+    parser.add_argument("--once", action="store_true", help="run a single pass and exit")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    from .datasets import rendered_data, upcoming_data
+    if args.once:
+        log.info("refreshed %s", refresh_once(upcoming_data, market_dataset=rendered_data))
+        return
+    refresher = SignalRefresher(upcoming_data, interval=args.interval, market_dataset=rendered_data)
+    refresher.start()
+    try:
+        refresher.join()
+    except KeyboardInterrupt:
+        refresher.stop()
+
+
+if __name__ == "__main__":
+    main()
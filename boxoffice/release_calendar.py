@@ -0,0 +1,204 @@
+"""Release calendar: competition factors from overlapping wide releases.
+
+Every dated title sits on the calendar with its projected weekly run (runs.py). A title's
+competition factor comes from the grosses its wide-release rivals are projected to take
+in the title's own opening weeks, whether they open alongside it or are holding over.
+It replaces the hand-set `comp` where a release date is known.
+
+Titles are kept sorted by release day, so the rivals of any title are one searchsorted
+slice: runs all last the same number of weeks, and only a fixed window of release days
+can overlap. Moving one date only marks the titles in its old and new windows for
+recomputation; every other factor is kept.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .runs import RUN_WEEKS, project_slate_runs
+from .slate import score_slate
+
+# Weeks of a title's own run in which rivals' grosses count against it.
+COMP_WEEKS = 2
+# Theater count from which a title counts as a wide release and competes.
+WIDE_THEATERS = 600
+# Factor at a 100% rival share; matches the floor of the tracker's Competition Factor slider.
+COMP_FLOOR = 0.5
+
+
+def release_day(release_date):
+    """Days since 1970-01-01 for an ISO date string (or anything numpy can parse)."""
+    return int(np.datetime64(release_date, "D").astype(np.int64))
+
+
+class ReleaseCalendar:
+    """Titles with their release day and projected weekly run, sorted by release day.
+
+    `set` and `remove` keep the sorted index current and mark affected titles dirty;
+    `factors` recomputes only the dirty ones, all in one vectorized pass. Thread-safe, so
+    one calendar can be shared by every session of the app.
+    """
+
+    def __init__(self, weeks=RUN_WEEKS, comp_weeks=COMP_WEEKS):
+        self.weeks, self.comp_weeks = weeks, comp_weeks
+        # A rival opening `d` days before a title overlaps its opening weeks when the
+        # rounded week offset falls in (-comp_weeks, weeks), i.e. -after <= d <= before.
+        self._before = 7 * (weeks - 1) + 3
+        self._after = 7 * (comp_weeks - 1) + 3
+        self._titles = []
+        self._days = np.empty(0, dtype=np.int64)
+        self._runs = np.empty((0, weeks))
+        self._wide = np.empty(0, dtype=bool)
+        self._factors = {}
+        self._dirty = set()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._titles)
+
+    def __contains__(self, title):
+        return title in self._factors
+
+    @property
+    def titles(self):
+        with self._lock:
+            return list(self._titles)
+
+    def _mark(self, day):
+        # Titles whose opening weeks a release on `day` overlaps.
+        lo, hi = np.searchsorted(self._days, [day - self._after, day + self._before + 1])
+        self._dirty.update(self._titles[lo:hi])
+
+    def set(self, title, release_date, run, wide=True):
+        """Add `title` or update its date, run or wide flag. Unchanged entries are a no-op."""
+        day, run = release_day(release_date), np.asarray(run, dtype=float)
+        with self._lock:
+            if title in self._factors:
+                i = self._titles.index(title)
+                if self._days[i] == day and self._wide[i] == wide and np.array_equal(self._runs[i], run):
+                    return
+                self.remove(title)
+            i = int(np.searchsorted(self._days, day, side="right"))
+            self._titles.insert(i, title)
+            self._days = np.insert(self._days, i, day)
+            self._runs = np.insert(self._runs, i, run, axis=0)
+            self._wide = np.insert(self._wide, i, wide)
+            self._factors[title] = None
+            self._mark(day)
+
+    def remove(self, title):
+        with self._lock:
+            i = self._titles.index(title)
+            day = self._days[i]
+            del self._titles[i], self._factors[title]
+            self._dirty.discard(title)
+            self._days = np.delete(self._days, i)
+            self._runs = np.delete(self._runs, i, axis=0)
+            self._wide = np.delete(self._wide, i)
+            self._mark(day)
+
+    def overlapping(self, start, end):
+        """Titles whose projected run overlaps release days [start, end), by release day."""
+        with self._lock:
+            lo, hi = np.searchsorted(self._days, [release_day(start) - 7 * self.weeks + 1, release_day(end)])
+            return self._titles[lo:hi]
+
+    def _pairs(self, rows):
+        # Every (title, rival) pair within each title's window, as flat index arrays.
+        lo = np.searchsorted(self._days, self._days[rows] - self._before)
+        hi = np.searchsorted(self._days, self._days[rows] + self._after, side="right")
+        counts = hi - lo
+        title = np.repeat(np.arange(len(rows)), counts)
+        rival = np.repeat(lo, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        keep = rival != rows[title]
+        title, rival = title[keep], rival[keep]
+        offset = np.rint((self._days[rows[title]] - self._days[rival]) / 7).astype(int)
+        return title, rival, offset
+
+    def _rival_grosses(self, rows, title, rival, offset):
+        # Rivals' grosses in each of the titles' first comp_weeks weeks: (len(rows), comp_weeks).
+        grosses = np.zeros((len(rows), self.comp_weeks))
+        pressure = self._runs * self._wide[:, None]
+        for k in range(self.comp_weeks):
+            week = offset + k
+            valid = (week >= 0) & (week < self.weeks)
+            grosses[:, k] = np.bincount(title[valid], pressure[rival[valid], week[valid]], minlength=len(rows))
+        return grosses
+
+    def factors(self):
+        """{title: competition factor in [COMP_FLOOR, 1.0]}, recomputing only dirty titles.
+
+        The factor falls linearly with the rivals' share of the grosses in the title's
+        opening weeks: 1.0 with no wide rivals, COMP_FLOOR if rivals take it all.
+        """
+        with self._lock:
+            if self._dirty:
+                index = {title: i for i, title in enumerate(self._titles)}
+                rows = np.array([index[title] for title in self._dirty], dtype=int)
+                rivals = self._rival_grosses(rows, *self._pairs(rows)).sum(axis=1)
+                own = self._runs[rows, :self.comp_weeks].sum(axis=1)
+                share = np.divide(rivals, rivals + own, out=np.zeros_like(rivals), where=rivals + own > 0)
+                for i, factor in zip(rows, 1.0 - (1.0 - COMP_FLOOR) * share):
+                    self._factors[self._titles[i]] = float(factor)
+                self._dirty.clear()
+            return dict(self._factors)
+
+    def rivals(self, title):
+        """[(rival, its week of release, gross in the title's opening weeks)], largest first."""
+        with self._lock:
+            rows = np.array([self._titles.index(title)])
+            _, rival, offset = self._pairs(rows)
+            pressure = self._runs * self._wide[:, None]
+            found = []
+            for j, off in zip(rival, offset):
+                weeks = np.arange(off, off + self.comp_weeks)
+                weeks = weeks[(weeks >= 0) & (weeks < self.weeks)]
+                if len(weeks) and pressure[j, weeks].sum() > 0:
+                    found.append((self._titles[j], int(weeks[0]) + 1, float(pressure[j, weeks].sum())))
+        return sorted(found, key=lambda r: -r[2])
+
+    def frame(self):
+        """Projected weekly grosses of every title, one row per run week, dated by its Monday."""
+        factors = self.factors()
+        rows = []
+        with self._lock:
+            for title, day, run in zip(self._titles, self._days, self._runs):
+                monday = int(day) - (int(day) + 3) % 7  # 1970-01-01 was a Thursday
+                rows += [{"title": title, "week": pd.Timestamp(np.datetime64(monday + 7 * k, "D")), "gross": gross, "comp": factors[title]}
+                         for k, gross in enumerate(run)]
+        return pd.DataFrame(rows, columns=["title", "week", "gross", "comp"])
+
+
+def preset_live(dataset):
+    """Live-data tuples built from each title's presets, for scoring without the network."""
+    return {title: (0, data.get('yt_fallback', 0), None, None, None, {}) for title, data in dataset.items()}
+
+
+def sync_calendar(calendar, dataset, slate, runs):
+    """Put every dated title of `dataset` on `calendar` with its projected run.
+
+    `slate` and `runs` are score_slate and project_slate_runs output for the dataset.
+    Titles that lost their date are removed; unchanged titles cost nothing.
+    """
+    dated = {title for title, data in dataset.items() if data.get('release_date') and title in runs.index}
+    for title in [title for title in calendar.titles if title not in dated]:
+        calendar.remove(title)
+    for title in dated:
+        calendar.set(title, dataset[title]['release_date'], runs.loc[title].to_numpy(),
+                     wide=dataset[title]['theaters'] >= WIDE_THEATERS)
+    return calendar
+
+
+release_calendar = ReleaseCalendar()
+
+
+def calendar_competition(dataset, calendar=release_calendar):
+    """{title: competition factor} for the dated titles of `dataset`, via `calendar`.
+
+    Runs are projected from each title's presets, so the factors don't move with live
+    signals. Undated titles are absent and keep their hand-set comp.
+    """
+    slate = score_slate(dataset, preset_live(dataset))
+    sync_calendar(calendar, dataset, slate, project_slate_runs(slate))
+    return {title: factor for title, factor in calendar.factors().items() if title in dataset}
+
@@ -0,0 +1,100 @@
+"""Week-by-week run projections: each film's opening spread into a weekly gross curve.
+
+The engines reduce a run to one `legs` multiplier (dom_total = opening * legs). Here that
+total is laid out week by week, so week-N grosses and holdovers can be read off directly.
+Week 1 is the opening weekend's frame and is anchored at the opening; later weeks fall off
+along a decay template for the film's studio profile, with the template's speed solved
+per film so that the weeks sum to dom_total.
+"""
+import functools
+
+import numpy as np
+import pandas as pd
+
+from . import metrics
+from .engines import ENGINE_SECONDS
+
+RUN_WEEKS = 16
+# Extra decay on each week-to-week drop, fading over the first weeks of the run: franchise
+# openings are front-loaded, family and indie titles hold on word of mouth.
+PROFILE_FRONTLOADING = {"franchise": 0.6, "family": -0.2, "indie": -0.4}
+# Extended holiday openings pull weekdays forward, so the first weekend after them drops harder.
+HOLIDAY_HANGOVER = {"5-Day Holiday (Wed-Sun)": 0.3, "4-Day Holiday (Fri-Mon)": 0.15}
+NEWTON_STEPS = 50
+NEWTON_TOLERANCE = 1e-9
+
+
+def studio_profile(studio_type):
+    """Decay profile for a studio_type, matched the way calculate_box_office matches it."""
+    if studio_type == "Cult / Indie (A24/Neon)":
+        return "indie"
+    if "Family" in studio_type or "Animation" in studio_type:
+        return "family"
+    return "franchise"
+
+
+@functools.lru_cache(maxsize=None)
+def decay_template(profile, release_format, weeks=RUN_WEEKS):
+    """Cumulative decay exponents for weeks 1..`weeks` (read-only; 0.0 for week 1).
+
+    A film's curve is opening * exp(-rate * template); only the rate varies per film.
+    """
+    drops = 1.0 + PROFILE_FRONTLOADING[profile] * np.exp(-np.arange(weeks - 1) / 2.0)
+    if weeks > 1:
+        drops[0] += HOLIDAY_HANGOVER.get(release_format, 0.0)
+    template = np.concatenate([[0.0], np.cumsum(drops)])
+    template.flags.writeable = False
+    return template
+
+
+def _templates(studio_type, release_format, weeks):
+    # One template per distinct profile, stacked and scattered back to every film.
+    index = {}
+    codes = [index.setdefault((studio_profile(s), f), len(index)) for s, f in zip(studio_type, release_format)]
+    stacked = np.stack([decay_template(profile, release_format, weeks) for profile, release_format in index]) if index else np.empty((0, weeks))
+    return stacked[np.asarray(codes, dtype=int)]
+
+
+@metrics.timed(ENGINE_SECONDS, engine="run_projection")
+def project_runs(opening, dom_total, studio_type, release_format, weeks=RUN_WEEKS):
+    """Weekly gross curves for many films at once, as an (n, weeks) float array.
+
+    Takes the engines' opening and dom_total with each film's studio_type and
+    release_format (arrays or scalars that broadcast). Each row starts at the opening
+    and sums to dom_total. Legs beyond what `weeks` can hold keep every week at the opening
+    and put the rest of the total in the last week, which then stands for the remainder of
+    the run; legs of 1 or less (including no opening) put the whole total in week 1.
+    """
+    opening, dom_total, studio_type, release_format = np.broadcast_arrays(
+        np.asarray(opening, dtype=float), np.asarray(dom_total, dtype=float),
+        np.asarray(studio_type, dtype=object), np.asarray(release_format, dtype=object))
+    opening, dom_total = opening.ravel(), dom_total.ravel()
+    template = _templates(studio_type.ravel(), release_format.ravel(), weeks)
+    legs = np.divide(dom_total, opening, out=np.zeros_like(opening), where=opening > 0)
+
+    # sum(exp(-rate * template)) falls convexly from `weeks` at rate 0, so Newton's method
+    # started at 0 climbs to the root without overshooting. Legs of 1 have no finite root.
+    solvable = legs > 1
+    rate = np.zeros_like(legs)
+    for _ in range(NEWTON_STEPS):
+        shape = np.exp(-rate[:, None] * template)
+        excess = np.where(solvable, shape.sum(axis=1) - legs, 0.0)
+        if not (excess > NEWTON_TOLERANCE).any():
+            break
+        slope = (template * shape).sum(axis=1)
+        rate = rate + np.divide(np.maximum(excess, 0.0), slope, out=np.zeros_like(rate), where=slope > 0)
+    shape = np.where(solvable[:, None], np.exp(-rate[:, None] * template), template == 0)
+    # Rescale away the last of the Newton residual (and legs below 1).
+    curves = shape * (dom_total / shape.sum(axis=1))[:, None]
+    # A flat run at the opening is all `weeks` can hold; the rest goes in the tail.
+    over = legs > weeks
+    curves[over] = opening[over, None]
+    curves[over, -1] += dom_total[over] - opening[over] * weeks
+    return curves
+
+
+def project_slate_runs(slate, weeks=RUN_WEEKS):
+    """Weekly curves for a scored slate (score_slate's frame): titles by week 1..`weeks`."""
+    curves = project_runs(slate["opening"].to_numpy(), slate["dom_total"].to_numpy(),
+                          slate["studio_type"].to_numpy(), slate["release_format"].to_numpy(), weeks)
+    return pd.DataFrame(curves, index=slate.index, columns=pd.RangeIndex(1, weeks + 1, name="week"))
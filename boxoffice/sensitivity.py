@@ -0,0 +1,54 @@
+"""Sensitivity sweeps of the short-term engine across the tracker's slider ranges."""
+import numpy as np
+import pandas as pd
+
+from .batch import BOX_OFFICE_COLUMNS, calculate_box_office_batch
+
+# Tracker slider range for each numeric input: (label, min, max, integer-valued).
+SWEEP_RANGES = {
+    "total_aware": ("Total Awareness (%)", 0, 100, True),
+    "interest": ("Definite Interest (%)", 0, 100, True),
+    "theaters": ("Theater Count", 100, 5000, True),
+    "rt_score": ("RT Score", 0, 100, True),
+    "popcorn_score": ("Popcornmeter", 0, 100, True),
+    "buzz": ("Social Buzz", 0.5, 2.0, False),
+    "comp": ("Competition Factor", 0.5, 1.0, False),
+}
+
+def _sweep_values(name, steps):
+    _, lo, hi, integer = SWEEP_RANGES[name]
+    values = np.linspace(lo, hi, steps)
+    return np.unique(np.round(values)) if integer else values
+
+def sweep_one_at_a_time(inputs, names=tuple(SWEEP_RANGES), steps=21, params=None):
+    """Vary each input alone across its slider range, all points in one batched pass.
+
+    Returns a long DataFrame with columns input, value, opening, dom_total.
+    """
+    blocks = [(name, _sweep_values(name, steps)) for name in names]
+    columns = {name: np.full(sum(len(v) for _, v in blocks), inputs[name], dtype=object if isinstance(inputs[name], str) else float)
+               for name in BOX_OFFICE_COLUMNS}
+    row = 0
+    for name, values in blocks:
+        columns[name][row:row + len(values)] = values
+        row += len(values)
+    opening, _, dom_total, _ = calculate_box_office_batch(columns, params=params)
+    return pd.DataFrame({
+        "input": np.concatenate([[name] * len(values) for name, values in blocks]),
+        "value": np.concatenate([values for _, values in blocks]),
+        "opening": opening, "dom_total": dom_total,
+    })
+
+def tornado(sweep, base_opening):
+    """Collapse a one-at-a-time sweep to the opening swing each input can cause, widest first."""
+    swings = sweep.groupby("input")["opening"].agg(low="min", high="max")
+    swings["swing"] = swings["high"] - swings["low"]
+    swings["down"] = swings["low"] - base_opening
+    swings["up"] = swings["high"] - base_opening
+    return swings.sort_values("swing", ascending=False).reset_index()
+
+def sweep_grid(inputs, x, y, steps=25, params=None):
+    """Score the full x-by-y grid over both inputs' slider ranges in one batched pass."""
+    xv, yv = np.meshgrid(_sweep_values(x, steps), _sweep_values(y, steps))
+    opening, _, dom_total, _ = calculate_box_office_batch({**inputs, x: xv.ravel(), y: yv.ravel()}, params=params)
+    return pd.DataFrame({x: xv.ravel(), y: yv.ravel(), "opening": opening, "dom_total": dom_total})
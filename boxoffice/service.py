@@ -0,0 +1,293 @@
+"""Local HTTP prediction service over the core engines.
+
+Single-prediction requests from concurrent clients are coalesced by a MicroBatcher into
+one vectorized engine call per batch, all on one asyncio event loop. Live signals are
+served from the shared signal cache without touching the network.
+
+    python -m boxoffice.service --port 8765
+
+Endpoints (JSON in, JSON out):
+    POST /v1/box-office            one calculate_box_office input object
+    POST /v1/box-office/batch      {"scenarios": [input object, ...]}
+    POST /v1/long-lead             one calculate_long_lead input object
+    POST /v1/long-lead/batch       {"scenarios": [input object, ...]}
+    GET  /v1/signals?title=...     cached live signals for a dataset title
+    GET  /metrics                  process metrics, Prometheus text format
+    GET  /healthz
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import socket
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from . import metrics
+from .batch import BOX_OFFICE_COLUMNS, LONG_LEAD_COLUMNS, calculate_box_office_batch, calculate_long_lead_batch
+
+log = logging.getLogger(__name__)
+
+BOX_OFFICE_TEXT_FIELDS = {"studio_type", "market_demand", "release_format"}
+LONG_LEAD_NUMERIC_FIELDS = {"cast_score", "budget"}
+# Extra seconds a request may wait for company before its batch is scored. At 0 a batch
+# is whatever arrived during one event-loop iteration, which under load is plenty.
+MAX_BATCH_WAIT = 0.0
+MAX_BATCH_SIZE = 1024
+# Largest request body read, in bytes; a batch this size holds tens of thousands of scenarios.
+MAX_BODY_BYTES = 8 * 1024 * 1024
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def _validate(obj, columns, numeric):
+    if not isinstance(obj, dict):
+        raise BadRequest("expected a JSON object of model inputs")
+    missing = [name for name in columns if name not in obj]
+    if missing:
+        raise BadRequest(f"missing inputs: {', '.join(missing)}")
+    row = {}
+    for name in columns:
+        if name in numeric:
+            try:
+                value = float(obj[name])
+            except (TypeError, ValueError):
+                raise BadRequest(f"{name} must be a number") from None
+            # Every numeric input is a count, score or multiplier. NaN, infinities and
+            # negatives (a negative cast_score under sqrt) would come back as a NaN
+            # prediction, which is not valid JSON.
+            if not math.isfinite(value) or value < 0:
+                raise BadRequest(f"{name} must be a finite, non-negative number")
+            row[name] = value
+        else:
+            row[name] = str(obj[name])
+    return row
+
+
+def validate_box_office(obj):
+    return _validate(obj, BOX_OFFICE_COLUMNS, set(BOX_OFFICE_COLUMNS) - BOX_OFFICE_TEXT_FIELDS)
+
+
+def validate_long_lead(obj):
+    return _validate(obj, LONG_LEAD_COLUMNS, LONG_LEAD_NUMERIC_FIELDS)
+
+
+def _columns(rows, names):
+    return {name: np.array([row[name] for row in rows]) for name in names}
+
+
+def score_box_office(rows):
+    opening, extended, dom_total, global_total = calculate_box_office_batch(_columns(rows, BOX_OFFICE_COLUMNS))
+    return [
+        {"opening": o, "extended": None if math.isnan(e) else e, "dom_total": d, "global_total": g}
+        for o, e, d, g in zip(opening.tolist(), extended.tolist(), dom_total.tolist(), global_total.tolist())
+    ]
+
+
+def score_long_lead(rows):
+    return [{"opening": value} for value in calculate_long_lead_batch(_columns(rows, LONG_LEAD_COLUMNS)).tolist()]
+
+
+class MicroBatcher:
+    """Coalesce concurrent single submissions into batched calls of `score(rows)`.
+
+    Runs on the server's event loop. Everything submitted before the flush fires, which
+    by default is the end of the current loop iteration, is scored in one vectorized
+    call; `max_wait` trades a little latency for larger batches. A full batch flushes at once.
+    """
+
+    def __init__(self, score, max_batch=MAX_BATCH_SIZE, max_wait=MAX_BATCH_WAIT):
+        self.score = score
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending = []
+        self._flush_handle = None
+        self.batches = 0
+        self.rows = 0
+
+    def submit(self, row):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((row, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush) if self.max_wait else loop.call_soon(self._flush)
+        return future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        try:
+            results = self.score([row for row, _ in batch])
+        except Exception as e:
+            log.exception("batch of %d failed", len(batch))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        self.batches += 1
+        self.rows += len(batch)
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self):
+        return {"batches": self.batches, "rows": self.rows, "mean_batch": self.rows / self.batches if self.batches else 0.0}
+
+
+def cached_signals(title):
+    """Live signals for a dataset title, read from the shared cache only."""
+    from .datasets import historical_data, upcoming_data
+    from .signals import live_data_for
+
+    data = upcoming_data.get(title) or historical_data.get(title)
+    if data is None:
+        return None
+    wiki, yt, rt, poly, manifold, report = live_data_for(data, fetch_misses=False)
+    return {"title": title, "wiki_views": wiki, "trailer_views": yt, "rt_score": rt,
+            "polymarket": poly, "manifold": manifold, "sources": report}
+
+
+class PredictionService:
+    """Minimal keep-alive HTTP/1.1 JSON server on asyncio.
+
+    One event loop owns parsing, batching and scoring, so there is no per-connection
+    thread contending for the GIL and tail latency stays flat as clients are added.
+    """
+
+    def __init__(self, max_batch=MAX_BATCH_SIZE, max_wait=MAX_BATCH_WAIT):
+        self.batchers = {
+            "/v1/box-office": (validate_box_office, MicroBatcher(score_box_office, max_batch, max_wait), score_box_office),
+            "/v1/long-lead": (validate_long_lead, MicroBatcher(score_long_lead, max_batch, max_wait), score_long_lead),
+        }
+
+    def stats(self):
+        return {path.rsplit("/", 1)[-1].replace("-", "_"): batcher.stats() for path, (_, batcher, _) in self.batchers.items()}
+
+    async def dispatch(self, method, target, body):
+        url = urlparse(target)
+        if method == "GET" and url.path == "/healthz":
+            return 200, {"status": "ok", **self.stats()}
+        if method == "GET" and url.path == "/metrics":
+            return 200, metrics.render_prometheus()
+        if method == "GET" and url.path == "/v1/signals":
+            title = parse_qs(url.query).get("title", [None])[0]
+            # SQLite reads stay off the event loop.
+            signals = await asyncio.get_running_loop().run_in_executor(None, cached_signals, title) if title else None
+            return (200, signals) if signals else (404, {"error": f"unknown title: {title}"})
+        if method != "POST":
+            return 404, {"error": f"no route for {method} {url.path}"}
+
+        is_batch = url.path.endswith("/batch")
+        route = self.batchers.get(url.path[: -len("/batch")] if is_batch else url.path)
+        if route is None:
+            return 404, {"error": f"no route for POST {url.path}"}
+        validate, batcher, score = route
+        try:
+            payload = json.loads(body or b"null")
+        except json.JSONDecodeError as e:
+            return 400, {"error": f"invalid JSON: {e}"}
+        try:
+            if not is_batch:
+                return 200, await batcher.submit(validate(payload))
+            scenarios = payload.get("scenarios") if isinstance(payload, dict) else None
+            if not isinstance(scenarios, list):
+                raise BadRequest('expected {"scenarios": [...]}')
+            # Already a batch: score it directly rather than through the coalescing queue.
+            return 200, {"predictions": score([validate(s) for s in scenarios]) if scenarios else []}
+        except BadRequest as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            log.exception("prediction failed")
+            return 500, {"error": type(e).__name__}
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        if isinstance(payload, str):
+            data, content_type = payload.encode(), b"text/plain; version=0.0.4"
+        else:
+            data, content_type = json.dumps(payload).encode(), b"application/json"
+        writer.write(
+            b"HTTP/1.1 %d %s\r\nContent-Type: %s\r\nContent-Length: %d\r\nConnection: %s\r\n\r\n"
+            % (status, HTTPStatus(status).phrase.encode(), content_type, len(data), b"keep-alive" if keep_alive else b"close")
+            + data
+        )
+        await writer.drain()
+
+    async def handle(self, reader, writer):
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = headers.get("content-length", "0").strip()
+                # The body of a rejected request is never read, so the connection can't be reused.
+                if not (length.isascii() and length.isdigit()):
+                    await self._respond(writer, 400, {"error": "invalid Content-Length"}, keep_alive=False)
+                    break
+                if int(length) > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": f"body over {MAX_BODY_BYTES} bytes"}, keep_alive=False)
+                    break
+                body = await reader.readexactly(int(length))
+
+                status, payload = await self.dispatch(method, target, body)
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host, port, ready=None):
+        server = await asyncio.start_server(self.handle, host, port, backlog=1024)
+        self.port = server.sockets[0].getsockname()[1]
+        log.info("serving on http://%s:%d", host, self.port)
+        if ready is not None:
+            ready.set()
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve box office predictions over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH_SIZE, help="most requests coalesced into one engine call")
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_BATCH_WAIT * 1000, help="extra time a request may wait for its batch to fill")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    try:
+        asyncio.run(PredictionService(args.max_batch, args.max_wait_ms / 1000).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
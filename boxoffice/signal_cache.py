@@ -0,0 +1,147 @@
+"""Persistent on-disk cache for live signals, keyed per source and per title.
+
+The SQLite file is shared by every process pointed at the same BOXOFFICE_CACHE_DIR
+(Streamlit replicas, the refresher worker), and so are its fetch leases: a process
+fetching a (source, key) holds the lease, and the others wait for its answer instead
+of fetching the same page again.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+CACHE_DIR = os.environ.get("BOXOFFICE_CACHE_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache"))
+
+# Seconds before a cached value is considered stale. Stale values are still served,
+# but trigger a background refresh.
+SOURCE_TTLS = {
+    "wiki": 6 * 3600,
+    "youtube": 12 * 3600,
+    "rt": 12 * 3600,
+}
+DEFAULT_TTL = 3600
+
+
+class SignalCache:
+    """SQLite store of the last good value fetched for each (source, key).
+
+    Values are stored as JSON, so `None` ("source had nothing for this title") is a
+    cacheable answer. `get` returns None only when nothing has ever been stored.
+    The database is opened on first use, not at construction.
+
+    Leases coordinate fetches across processes. A lease is held until released or until
+    it expires, so a process that dies mid-fetch only blocks the others for its ttl.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(CACHE_DIR, "signals.sqlite3")
+        self._local = threading.local()
+
+    def _create_tables(self, conn):
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS signals ("
+                " source TEXT NOT NULL, key TEXT NOT NULL, value TEXT, fetched_at REAL NOT NULL,"
+                " PRIMARY KEY (source, key))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS refresh_status ("
+                " source TEXT PRIMARY KEY, last_run REAL, last_success REAL, refreshed INTEGER NOT NULL DEFAULT 0,"
+                " failures INTEGER NOT NULL DEFAULT 0, last_error TEXT)"
+            )
+            # owner is NULL once a failed fetch has released its lease: the row then
+            # records the error until expires_at, so nobody retries before that.
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS leases ("
+                " source TEXT NOT NULL, key TEXT NOT NULL, owner TEXT, expires_at REAL NOT NULL, error TEXT,"
+                " PRIMARY KEY (source, key))"
+            )
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_tables(conn)
+            self._local.conn = conn
+        return conn
+
+    def get(self, source, key):
+        """Return (value, age_seconds, is_stale) or None on a miss."""
+        row = self._conn().execute(
+            "SELECT value, fetched_at FROM signals WHERE source = ? AND key = ?", (source, str(key))
+        ).fetchone()
+        if row is None:
+            return None
+        age = time.time() - row[1]
+        return json.loads(row[0]), age, age > SOURCE_TTLS.get(source, DEFAULT_TTL)
+
+    def put(self, source, key, value, fetched_at=None):
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO signals (source, key, value, fetched_at) VALUES (?, ?, ?, ?)",
+                (source, str(key), json.dumps(value), fetched_at or time.time()),
+            )
+
+    def acquire_lease(self, source, key, ttl):
+        """Claim the fetch of (source, key) for `ttl` seconds; returns a token, or None if held."""
+        token = uuid.uuid4().hex
+        now = time.time()
+        with self._conn() as conn:
+            # One statement, so two processes can never both see the lease as free.
+            claimed = conn.execute(
+                "INSERT INTO leases (source, key, owner, expires_at, error) VALUES (?, ?, ?, ?, NULL)"
+                " ON CONFLICT (source, key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at, error = NULL"
+                " WHERE leases.expires_at <= ?",
+                (source, str(key), token, now + ttl, now),
+            ).rowcount
+        return token if claimed else None
+
+    def release_lease(self, source, key, token, error=None, hold=0.0):
+        """Release a lease. With `error`, keep it blocking for `hold` more seconds, recording why."""
+        with self._conn() as conn:
+            if error is None:
+                conn.execute("DELETE FROM leases WHERE source = ? AND key = ? AND owner = ?", (source, str(key), token))
+            else:
+                conn.execute("UPDATE leases SET owner = NULL, error = ?, expires_at = ? WHERE source = ? AND key = ? AND owner = ?",
+                             (error, time.time() + hold, source, str(key), token))
+
+    def lease_error(self, source, key):
+        """The error a recent failed fetch of (source, key) left on its lease, if it still holds."""
+        row = self._conn().execute(
+            "SELECT error FROM leases WHERE source = ? AND key = ? AND owner IS NULL AND expires_at > ?",
+            (source, str(key), time.time()),
+        ).fetchone()
+        return row[0] if row else None
+
+    def record_refresh(self, source, error=None):
+        """Record one background refresh attempt for `source`; `error` is None on success."""
+        now = time.time()
+        with self._conn() as conn:
+            conn.execute("INSERT OR IGNORE INTO refresh_status (source) VALUES (?)", (source,))
+            if error is None:
+                conn.execute("UPDATE refresh_status SET last_run = ?, last_success = ?, refreshed = refreshed + 1 WHERE source = ?",
+                             (now, now, source))
+            else:
+                conn.execute("UPDATE refresh_status SET last_run = ?, failures = failures + 1, last_error = ? WHERE source = ?",
+                             (now, error, source))
+
+    def refresh_status(self):
+        """{source: {last_run, last_success, refreshed, failures, last_error}} from the background refresher."""
+        rows = self._conn().execute(
+            "SELECT source, last_run, last_success, refreshed, failures, last_error FROM refresh_status ORDER BY source"
+        ).fetchall()
+        return {row[0]: dict(zip(("last_run", "last_success", "refreshed", "failures", "last_error"), row[1:])) for row in rows}
+
+    def clear(self, source=None):
+        with self._conn() as conn:
+            if source:
+                conn.execute("DELETE FROM signals WHERE source = ?", (source,))
+                conn.execute("DELETE FROM leases WHERE source = ?", (source,))
+            else:
+                conn.execute("DELETE FROM signals")
+                conn.execute("DELETE FROM leases")
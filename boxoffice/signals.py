@@ -0,0 +1,258 @@
+"""Live signal fetchers: Wikipedia, YouTube and Rotten Tomatoes, plus the locally stored
+Polymarket and Manifold odds (see markets.py, which polls them in the background).
+
+Module-level state (thread pools, failure backoff, the in-flight refresh set) lives here rather
+than in app.py because Streamlit re-executes the app script on every rerun.
+"""
+import time
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+
+from . import http_client, markets, metrics
+from .pageviews import fetch_wiki_views
+from .signal_cache import SignalCache
+
+log = logging.getLogger(__name__)
+
+# Per-source deadlines (seconds). A source that misses its deadline falls back to its default.
+SOURCE_DEADLINES = {"wiki": 4.0, "youtube": 6.0, "rt": 6.0}
+# Sized for a whole slate's cold fetches at once: jobs queued behind busy workers would burn their deadline waiting.
+_signal_pool = ThreadPoolExecutor(max_workers=http_client.FETCH_WORKERS, thread_name_prefix="signals")
+_slate_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="slate")
+signal_cache = SignalCache()
+
+FETCH_SECONDS = metrics.histogram("boxoffice_fetch_seconds", "Fetcher latency per source, parsing included.", ("source", "result"))
+FETCH_ERRORS = metrics.counter("boxoffice_fetch_errors_total", "Fetcher failures by exception class.", ("source", "error"))
+COALESCED = metrics.counter("boxoffice_fetch_coalesced_total", "Fetches answered by another caller's in-flight fetch, in this process (thread) or another (process).", ("source", "via"))
+SIGNAL_LOOKUPS = metrics.counter("boxoffice_signal_lookups_total", "Signal reads by outcome: ok, cached, stale, miss, empty, backoff, timeout, error, skipped.", ("source", "status"))
+
+# Scraped pages are streamed through these and the connection dropped at the first hit.
+YOUTUBE_PATTERNS = (rb'"viewCount":"(\d+)"',)
+# Best first: the score-board attribute, then the JSON-LD rating, then the legacy markup.
+RT_PATTERNS = (rb'tomatometerscore="(\d+)"', rb'"ratingValue":\s*"(\d+)"', rb'class="percentage">\s*(\d+)%')
+
+def fetch_youtube_views(yt_id):
+    url = f"https://www.youtube.com/watch?v={yt_id}"
+    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
+    views = http_client.scan(url, YOUTUBE_PATTERNS, headers=headers, timeout=SOURCE_DEADLINES["youtube"])
+    return int(views) if views else None
+
+def fetch_rt_score(rt_slug):
+    url = f"https://www.rottentomatoes.com/m/{rt_slug}"
+    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36'}
+    score = http_client.scan(url, RT_PATTERNS, headers=headers, timeout=SOURCE_DEADLINES["rt"])
+    return int(score) if score else None
+
+def run_fetcher(source, fn, key):
+    """Call fetcher `fn(key)` for `source`, recording its latency and any failure."""
+    started = time.perf_counter()
+    try:
+        result = fn(key)
+    except Exception as e:
+        FETCH_SECONDS.observe(time.perf_counter() - started, source=source, result="error")
+        FETCH_ERRORS.inc(source=source, error=type(e).__name__)
+        raise
+    FETCH_SECONDS.observe(time.perf_counter() - started, source=source, result="empty" if result is None else "ok")
+    return result
+
+# After a miss fails, reruns skip that (source, key) for this long instead of paying its deadline again.
+# A failure is also left on the fetch lease for this long, so other processes skip it too.
+FAILURE_BACKOFF = 60.0
+# {(source, key): monotonic time its backoff ends}; expired entries are dropped as they are
+# checked and on every new failure, so the map only holds keys still backing off.
+_failed_until = {}
+_failed_lock = threading.Lock()
+# Longest a fetch may hold its lease; past this a crashed holder's lease is taken over.
+LEASE_SECONDS = 30.0
+# How often a process waiting on another's fetch checks whether it has finished.
+LEASE_POLL = 0.05
+
+def _backing_off(source, key, now):
+    """True if (source, key) failed less than FAILURE_BACKOFF ago; forgets it once expired."""
+    with _failed_lock:
+        until = _failed_until.get((source, key))
+        if until is not None and until <= now:
+            del _failed_until[(source, key)]
+        return until is not None and until > now
+
+def _back_off(source, key):
+    now = time.monotonic()
+    with _failed_lock:
+        for expired in [k for k, until in _failed_until.items() if until <= now]:
+            del _failed_until[expired]
+        _failed_until[(source, key)] = now + FAILURE_BACKOFF
+
+class FetchFailedElsewhere(Exception):
+    """Another process's fetch of this (source, key) failed within FAILURE_BACKOFF."""
+
+def fetch_shared(source, fn, key, cache=None):
+    """Fetch (source, key) into the cache unless another process already is; return the value.
+
+    The fetch runs under the cache's lease, so across processes exactly one is in flight.
+    A caller that finds the lease held waits for it, then takes the holder's answer from
+    the cache rather than fetching again.
+    """
+    cache = cache or signal_cache
+    while True:
+        token = cache.acquire_lease(source, key, LEASE_SECONDS)
+        if token is not None:
+            break
+        error = cache.lease_error(source, key)
+        if error:
+            raise FetchFailedElsewhere(f"{source}/{key}: {error}")
+        time.sleep(LEASE_POLL)
+    try:
+        # Double-checked: a value stored this recently came from a fetch that overlapped
+        # this one (usually the lease holder we just waited on), so it is the answer.
+        cached = cache.get(source, key)
+        if cached is not None and cached[1] < LEASE_SECONDS:
+            cache.release_lease(source, key, token)
+            COALESCED.inc(source=source, via="process")
+            return cached[0]
+        result = run_fetcher(source, fn, key)
+    except Exception as e:
+        cache.release_lease(source, key, token, error=type(e).__name__, hold=FAILURE_BACKOFF)
+        raise
+    cache.put(source, key, result)
+    cache.release_lease(source, key, token)
+    return result
+
+def _timed_call(source, fn, key):
+    started = time.perf_counter()
+    result = fetch_shared(source, fn, key)
+    return result, (time.perf_counter() - started) * 1000
+
+# One future per (source, key) being fetched by this process; every caller shares it.
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+def _shared_future(source, fn, key):
+    """(future, started) for the in-flight fetch of (source, key), starting one if needed."""
+    with _inflight_lock:
+        future = _inflight.get((source, key))
+        if future is not None:
+            COALESCED.inc(source=source, via="thread")
+            return future, False
+        future = _inflight[(source, key)] = _signal_pool.submit(_timed_call, source, fn, key)
+
+    def forget(done):
+        with _inflight_lock:
+            if _inflight.get((source, key)) is done:
+                del _inflight[(source, key)]
+    future.add_done_callback(forget)
+    return future, True
+
+def _refresh_in_background(source, fn, key):
+    future, started = _shared_future(source, fn, key)
+
+    def report_failure(done):
+        if done.exception() is not None:
+            # Keep serving the stale value; the next read retries.
+            log.warning("background refresh of %s/%s failed: %r", source, key, done.exception())
+    if started:
+        future.add_done_callback(report_failure)
+
+def fetch_signals(jobs, fetch_misses=True):
+    """Resolve {source: (fn, key, default)} jobs through the signal cache.
+
+    Fresh cache hits are returned as-is and stale hits are returned immediately while a
+    background refresh runs. Misses are fetched concurrently, each under its own deadline,
+    and coalesced: callers missing the same (source, key) share one fetch (fetch_shared);
+    a miss that errors, times out or finds nothing gets its default, and a failed miss is
+    not retried for FAILURE_BACKOFF seconds. With fetch_misses=False nothing blocks on the
+    network: misses get their default and a "miss" report.
+    Returns ({source: value}, {source: report}).
+    """
+    started = time.monotonic()
+    values, report, futures = {}, {}, {}
+    for source, (fn, key, default) in jobs.items():
+        values[source] = default
+        if fn is None:
+            report[source] = {"status": "skipped", "ms": 0.0, "error": None, "age": None}
+            continue
+        cached = signal_cache.get(source, key)
+        if cached is None:
+            if not fetch_misses:
+                report[source] = {"status": "miss", "ms": 0.0, "error": None, "age": None}
+            elif _backing_off(source, key, started):
+                report[source] = {"status": "backoff", "ms": 0.0, "error": None, "age": None}
+            else:
+                futures[source] = _shared_future(source, fn, key)[0]
+            continue
+        value, age, is_stale = cached
+        if value is not None:
+            values[source] = value
+        if is_stale:
+            _refresh_in_background(source, fn, key)
+        report[source] = {"status": "stale" if is_stale else "cached", "ms": 0.0, "error": None, "age": age}
+
+    for source, future in futures.items():
+        fn, key, default = jobs[source]
+        remaining = SOURCE_DEADLINES[source] - (time.monotonic() - started)
+        try:
+            result, elapsed = future.result(timeout=max(remaining, 0))
+        except FuturesTimeout:
+            # Not cancelled: other callers may share the future, and a late result still
+            # lands in the cache for the next read.
+            _back_off(source, key)
+            report[source] = {"status": "timeout", "ms": SOURCE_DEADLINES[source] * 1000, "error": None, "age": None}
+            continue
+        except Exception as e:
+            _back_off(source, key)
+            report[source] = {"status": "error", "ms": (time.monotonic() - started) * 1000, "error": type(e).__name__, "age": None}
+            continue
+        if result is None:
+            report[source] = {"status": "empty", "ms": elapsed, "error": None, "age": 0.0}
+        else:
+            values[source] = result
+            report[source] = {"status": "ok", "ms": elapsed, "error": None, "age": 0.0}
+    for source, outcome in report.items():
+        SIGNAL_LOOKUPS.inc(source=source, status=outcome["status"])
+    return values, report
+
+def live_signal_jobs(wiki_title, yt_id, yt_fallback, rt_slug, frozen_views=None):
+    """{source: (fetcher or None, cache key, default)} for one title."""
+    return {
+        "wiki": (fetch_wiki_views, wiki_title, 0),
+        "youtube": (None if frozen_views else fetch_youtube_views, yt_id, frozen_views or yt_fallback),
+        "rt": (fetch_rt_score if rt_slug else None, rt_slug, None),
+    }
+
+def jobs_for(data):
+    return live_signal_jobs(data['wiki'], data['yt_id'], data['yt_fallback'], data['rt_slug'], data.get('frozen_views'))
+
+def market_signals(poly_slug, movie_name_simple):
+    """({source: odds}, {source: report}) for the prediction markets, read from the local
+    market store only: odds are polled in the background, never on a page load."""
+    values, report = {}, {}
+    for source, key in (("polymarket", poly_slug), ("manifold", movie_name_simple)):
+        values[source] = None
+        if not key:
+            report[source] = {"status": "skipped", "ms": 0.0, "error": None, "age": None}
+            continue
+        latest = markets.snapshot(source, key)
+        if latest is None:
+            report[source] = {"status": "miss", "ms": 0.0, "error": None, "age": None}
+        else:
+            values[source], age = latest
+            report[source] = {"status": "stale" if age > markets.STALE_AFTER else "cached", "ms": 0.0, "error": None, "age": age}
+        SIGNAL_LOOKUPS.inc(source=source, status=report[source]["status"])
+    return values, report
+
+# Served from the on-disk signal cache (per-source TTLs, stale-while-revalidate), so this
+# is deliberately not wrapped in st.cache_data: that would pin fast-moving market odds for an hour.
+def get_live_data(wiki_title, yt_id, yt_fallback, rt_slug, movie_name_simple, frozen_views=None, poly_slug=None):
+    values, report = fetch_signals(live_signal_jobs(wiki_title, yt_id, yt_fallback, rt_slug, frozen_views))
+    odds, odds_report = market_signals(poly_slug, movie_name_simple)
+    return values["wiki"], values["youtube"], values["rt"], odds["polymarket"], odds["manifold"], {**report, **odds_report}
+
+def live_data_for(data, fetch_misses=True):
+    values, report = fetch_signals(jobs_for(data), fetch_misses)
+    odds, odds_report = market_signals(data.get('poly_slug'), data.get('simple_name', 'Movie'))
+    return values["wiki"], values["youtube"], values["rt"], odds["polymarket"], odds["manifold"], {**report, **odds_report}
+
+def prefetch_live_data(dataset):
+    """Run get_live_data for every title in `dataset` in parallel: {title: live data tuple}."""
+    futures = {title: _slate_pool.submit(live_data_for, data) for title, data in dataset.items()}
+    return {title: future.result() for title, future in futures.items()}
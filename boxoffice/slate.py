@@ -0,0 +1,24 @@
+"""Score a whole slate of titles at their preset inputs and live signals."""
+import pandas as pd
+
+from .batch import calculate_box_office_batch
+
+
+def score_slate(dataset, live):
+    """Score every title in `dataset` at its preset inputs and live signals in one batch."""
+    rows = []
+    for title, data in dataset.items():
+        _, live_yt, live_rt, _, _, report = live[title]
+        # A score of 0 is a real score; only a missing one falls back, as in the tracker.
+        rt_score = live_rt if live_rt is not None else data.get('rt_recorded')
+        rows.append({
+            "title": title, "interest": data['interest'], "total_aware": data['aware'], "theaters": data['theaters'],
+            "rt_score": 70 if rt_score is None else rt_score, "popcorn_score": data.get('popcorn_est', 85),
+            "buzz": data['buzz'], "comp": data['comp'], "trailer_views": live_yt, "intl_multiplier": data['intl_multiplier'],
+            "studio_type": data['studio_type'], "market_demand": data.get('market_demand', 'Normal'),
+            "release_format": data.get('release_format', 'Standard 3-Day'),
+        })
+    inputs = pd.DataFrame(rows).set_index("title")
+    opening, extended, dom_total, global_total = calculate_box_office_batch(inputs)
+    inputs["opening"], inputs["extended"], inputs["dom_total"], inputs["global_total"] = opening, extended, dom_total, global_total
+    return inputs
@@ -0,0 +1,215 @@
+"""Slate release-window planning on the long-lead engine.
+
+Places a slate of film DNAs into candidate release windows to maximize the slate's total
+forecast opening. Each film's season comes from its window's date; its competition level
+from the other slate films opening within CLASH_WEEKS of it. Every (film, window, level)
+opening is scored once up front with calculate_long_lead_batch, so the search itself only
+indexes into that table.
+
+The search is greedy placement (biggest films first) followed by local search over
+every single-film move and every pairwise swap, each round scored in one vectorized
+pass. Local optima are then kicked (a quarter of the slate moved at random) and searched
+again, keeping the best plan. It returns that plan plus the marginal value of every remaining
+single-film move.
+
+    python -m boxoffice.windows slate.csv --start 2026-01-02 --weeks 52
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from . import metrics
+from .batch import calculate_long_lead_batch
+from .engines import ENGINE_SECONDS
+
+FILM_COLUMNS = ("genre", "cast_score", "budget", "rating", "ip_status")
+# The long-lead planner's Release Window and Crowdedness options.
+SEASON_BY_MONTH = {5: "Summer (May-Jul)", 6: "Summer (May-Jul)", 7: "Summer (May-Jul)",
+                   11: "Holiday (Nov-Dec)", 12: "Holiday (Nov-Dec)", 1: "Dump Months (Jan/Sept)", 9: "Dump Months (Jan/Sept)"}
+DEFAULT_SEASON = "Average"
+COMPETITION_LEVELS = ("Low (Clear Weekend)", "Moderate (1 Opener)", "High (2+ Wide Releases)", "Extreme (vs Blockbuster)")
+# Slate films opening this many weeks apart or less compete for the same audience.
+CLASH_WEEKS = 1
+# A rival forecast to open at least this much ($M) on a clear weekend makes it "vs Blockbuster".
+BLOCKBUSTER_OPENING = 100.0
+MAX_ROUNDS = 500
+# Iterated local search: kicks from the best plan so far, each moving this share of the
+# slate to random windows. Smaller kicks mostly fall back into the same local optimum.
+KICKS = 60
+KICK_SHARE = 0.25
+
+
+def weekly_windows(start, weeks=52):
+    """`weeks` Friday release windows from the first Friday on or after `start`: date, season."""
+    first = pd.Timestamp(start)
+    first += pd.Timedelta(days=(4 - first.weekday()) % 7)
+    dates = pd.date_range(first, periods=weeks, freq="7D")
+    return pd.DataFrame({"date": dates, "season": [SEASON_BY_MONTH.get(date.month, DEFAULT_SEASON) for date in dates]})
+
+
+def window_values(films, windows):
+    """(films, windows, levels) array of forecast openings, levels in COMPETITION_LEVELS order."""
+    film = lambda name: np.asarray(films[name])[:, None, None]
+    return calculate_long_lead_batch(
+        **{name: film(name) for name in FILM_COLUMNS},
+        season=np.asarray(windows["season"])[None, :, None],
+        competition_level=np.asarray(COMPETITION_LEVELS)[None, None, :])
+
+
+def _level(rivals, big_rivals):
+    # Index into COMPETITION_LEVELS.
+    return np.where(big_rivals > 0, 3, np.minimum(rivals, 2))
+
+
+class _Slate:
+    # The scoring tables, padded with one "unplaced" window that clashes with nothing and
+    # is worth nothing, so partial plans during greedy placement score like full ones.
+
+    def __init__(self, values, days):
+        n_films, n_windows, n_levels = values.shape
+        self.values = np.concatenate([values, np.zeros((n_films, 1, n_levels))], axis=1)
+        self.clash = np.zeros((n_windows + 1, n_windows + 1), dtype=bool)
+        self.clash[:n_windows, :n_windows] = np.abs(days[:, None] - days[None, :]) <= 7 * CLASH_WEEKS
+        self.big = self.values[:, :, 0] >= BLOCKBUSTER_OPENING
+        self.films = np.arange(n_films)
+        self.windows = np.arange(n_windows)
+        self.unplaced = n_windows
+
+    def totals(self, plans):
+        """Total opening of each of `plans` (plans x films of window indices)."""
+        clash = self.clash[plans[:, :, None], plans[:, None, :]]
+        clash[:, self.films, self.films] = False
+        big = self.big[self.films, plans][:, None, :]
+        return self.values[self.films, plans, _level(clash.sum(axis=2), (clash & big).sum(axis=2))].sum(axis=1)
+
+    def levels(self, plan):
+        clash = self.clash[plan[:, None], plan[None, :]]
+        clash[self.films, self.films] = False
+        return _level(clash.sum(axis=1), (clash & self.big[self.films, plan]).sum(axis=1))
+
+    def move_gains(self, plan):
+        """(films, windows) change in total from moving each film alone to each window.
+
+        Only rival counts change with a move, so every gain comes from the plan's counts
+        plus the two windows involved, without rescoring whole plans.
+        """
+        films, windows = self.films, self.windows
+        pair = self.clash[plan[:, None], plan[None, :]]  # [g, f]: g and f are rivals
+        pair[films, films] = False
+        near = self.clash[plan][:, windows]  # [g, w]: g's window clashes with w
+        big = self.big[films, plan]
+        rivals, big_rivals = pair.sum(axis=1), (pair & big).sum(axis=1)
+        current = self.values[films, plan, _level(rivals, big_rivals)]
+
+        # The moving film against everyone else at its new window.
+        own_rivals = near.sum(axis=0)[None, :] - near
+        own_big = (near & big[:, None]).sum(axis=0)[None, :] - (near & big[:, None])
+        own = self.values[films[:, None], windows[None, :], _level(own_rivals, own_big)] - current[:, None]
+
+        # Everyone else losing the film as a rival at its old window and gaining it at the new:
+        # axes are (moving film f, window w, other film g).
+        others_rivals = rivals[None, None, :] - pair.T[:, None, :] + near.T[None, :, :]
+        others_big = (big_rivals[None, None, :] - (pair.T & big[:, None])[:, None, :]
+                      + (near.T[None, :, :] & self.big[:, :self.unplaced, None]))
+        others = self.values[films, plan, _level(others_rivals, others_big)] - current
+        others[films, :, films] = 0.0
+        return own + others.sum(axis=2)
+
+
+def _swaps(plan):
+    # Every swap of two films in different windows.
+    first, second = np.triu_indices(len(plan), k=1)
+    keep = plan[first] != plan[second]
+    first, second = first[keep], second[keep]
+    plans = np.repeat(plan[None, :], len(first), axis=0)
+    rows = np.arange(len(first))
+    plans[rows, first], plans[rows, second] = plan[second], plan[first]
+    return plans
+
+
+def _local_search(slate, plan, max_rounds):
+    # Take the best single-film move while one improves the plan; only then try swaps,
+    # which cost a full rescore each. Stops when neither improves.
+    total, rounds = slate.totals(plan[None, :])[0], 0
+    while rounds < max_rounds:
+        rounds += 1
+        gains = slate.move_gains(plan)
+        film, window = np.unravel_index(np.argmax(gains), gains.shape)
+        if gains[film, window] > 1e-9:
+            plan = plan.copy()
+            plan[film] = window
+            total += gains[film, window]
+            continue
+        swaps = _swaps(plan)
+        swap_totals = slate.totals(swaps) if len(swaps) else np.zeros(1)
+        if swap_totals.max() <= total + 1e-9:
+            break
+        plan, total = swaps[np.argmax(swap_totals)], swap_totals.max()
+    return plan, total, rounds
+
+
+@metrics.timed(ENGINE_SECONDS, engine="window_plan")
+def optimize_windows(films, windows, kicks=KICKS, seed=0, max_rounds=MAX_ROUNDS):
+    """Assign each film in `films` to one of `windows`, maximizing total forecast opening.
+
+    `films` is a DataFrame of FILM_COLUMNS indexed by title; `windows` has a date and a
+    season per row (weekly_windows). Films may share a window, at the competition cost
+    the long-lead engine puts on it. Returns {"plan", "total", "marginal", "rounds"}:
+    plan is one row per film (window, date, season, competition_level, opening,
+    clear_opening), total the slate's summed opening ($M), and marginal a films x window
+    dates frame of how much the total would change by moving that film there alone.
+    Results are reproducible for a given seed; kicks=0 stops at the first local optimum.
+    """
+    if len(films) == 0:
+        return {"plan": pd.DataFrame(columns=["window", "date", "season", "competition_level", "opening", "clear_opening"], index=films.index),
+                "total": 0.0, "marginal": pd.DataFrame(index=films.index, columns=pd.to_datetime(windows["date"]), dtype=float), "rounds": 0}
+    values = window_values(films, windows)
+    n_films, n_windows, _ = values.shape
+    days = pd.to_datetime(windows["date"]).to_numpy().astype("datetime64[D]").astype(np.int64)
+    slate = _Slate(values, days)
+
+    plan = np.full(n_films, slate.unplaced)
+    for f in np.argsort(-values[:, :, 0].max(axis=1), kind="stable"):
+        plan[f] = np.argmax(slate.move_gains(plan)[f])
+
+    plan, total, rounds = _local_search(slate, plan, max_rounds)
+    rng = np.random.default_rng(seed)
+    for _ in range(kicks):
+        trial = plan.copy()
+        moved = rng.choice(n_films, max(1, round(KICK_SHARE * n_films)), replace=False)
+        trial[moved] = rng.integers(0, n_windows, len(moved))
+        trial, trial_total, trial_rounds = _local_search(slate, trial, max_rounds)
+        rounds += trial_rounds
+        if trial_total > total + 1e-9:
+            plan, total = trial, trial_total
+
+    levels = slate.levels(plan)
+    return {
+        "plan": pd.DataFrame({
+            "window": plan, "date": windows["date"].to_numpy()[plan], "season": windows["season"].to_numpy()[plan],
+            "competition_level": np.asarray(COMPETITION_LEVELS)[levels], "opening": values[slate.films, plan, levels],
+            "clear_opening": values[slate.films, plan, 0],
+        }, index=films.index),
+        "total": float(total),
+        "marginal": pd.DataFrame(slate.move_gains(plan), index=films.index, columns=pd.to_datetime(windows["date"])),
+        "rounds": rounds,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Plan release windows for a slate of films.")
+    parser.add_argument("slate", help=f"CSV with a title column and {', '.join(FILM_COLUMNS)}")
+    parser.add_argument("--start", default=pd.Timestamp.today().strftime("%Y-%m-%d"), help="first candidate week (default: today)")
+    parser.add_argument("--weeks", type=int, default=52, help="number of weekly windows")
+    args = parser.parse_args(argv)
+
+    films = pd.read_csv(args.slate).set_index("title")
+    result = optimize_windows(films, weekly_windows(args.start, args.weeks))
+    pd.set_option("display.width", 160)
+    print(result["plan"].drop(columns="window").sort_values("date").to_string(float_format="%.1f"))
+    print(f"\nSlate opening ${result['total']:.1f}M after {result['rounds']} rounds")
+
+
+if __name__ == "__main__":
+    main()
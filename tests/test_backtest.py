@@ -0,0 +1,8 @@
+from boxoffice.backtest import DEFAULT_RT, film_inputs
+from boxoffice.datasets import historical_data
+
+
+def test_zero_rt_score_is_kept():
+    film = next(iter(historical_data.values()))
+    inputs = film_inputs({"zero": {**film, "rt_recorded": 0}, "unknown": {**film, "rt_recorded": None}})
+    assert inputs["rt_score"].to_dict() == {"zero": 0, "unknown": DEFAULT_RT}
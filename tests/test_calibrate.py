@@ -0,0 +1,36 @@
+import os
+
+import pytest
+
+from boxoffice import calibrate
+
+
+def result(before, after, n_holdout=2):
+    return {
+        "params": dict(calibrate.DEFAULT_MODEL_PARAMS), "fitted": ["interest_weight"], "evaluations": 1, "train_loss": 0.1,
+        "n_train": 5, "n_holdout": n_holdout,
+        "train_mape": {"before": 40.0, "after": 20.0}, "holdout_mape": {"before": before, "after": after},
+    }
+
+
+def test_saves_when_holdout_improves(tmp_path):
+    path = calibrate.save_params(result(46.5, 30.0), seed=0, params_dir=str(tmp_path))
+    assert os.path.basename(path) == "short_term_v1.json"
+
+
+@pytest.mark.parametrize("fit", [result(46.5, 79.4), result(46.5, 46.5), result(None, None, n_holdout=0)])
+def test_refuses_worse_or_unchecked_fits(tmp_path, fit):
+    with pytest.raises(ValueError):
+        calibrate.save_params(fit, seed=0, params_dir=str(tmp_path))
+    assert os.listdir(tmp_path) == []
+    assert calibrate.save_params(fit, seed=0, params_dir=str(tmp_path), force=True).endswith("short_term_v1.json")
+
+
+def test_cli_does_not_save_an_overfit(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(calibrate, "fit", lambda *args, **kwargs: result(46.5, 79.4))
+    monkeypatch.setattr(calibrate, "PARAMS_DIR", str(tmp_path))
+    with pytest.raises(SystemExit) as exit:
+        calibrate.main([])
+    assert exit.value.code == 1 and os.listdir(tmp_path) == []
+    calibrate.main(["--force"])
+    assert os.listdir(tmp_path) == ["short_term_v1.json"]
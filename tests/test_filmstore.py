@@ -0,0 +1,21 @@
+from boxoffice import filmstore
+from boxoffice.filmstore import FILM_SCHEMA, FilmStore
+
+HEADER = ",".join(FILM_SCHEMA)
+
+
+def write_catalogue(directory, title, genre):
+    directory.mkdir()
+    path = directory / "films.csv"
+    path.write_text(f"{HEADER}\n{title},2024-05-03,{genre},PG-13,Original,Summer (May-Jul),100,50,60\n")
+    return str(path)
+
+
+def test_same_named_catalogues_do_not_share_a_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(filmstore, "CACHE_DIR", str(tmp_path / "cache"))
+    first = FilmStore(write_catalogue(tmp_path / "a", "Alpha", "Comedy"))
+    second = FilmStore(write_catalogue(tmp_path / "b", "Beta", "Horror"))
+    assert first.path != second.path
+    assert "Alpha" in first and "Beta" not in first
+    assert second.row("Beta")["genre"] == "Horror"
+    assert second.genres == ["Horror"]
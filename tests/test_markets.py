@@ -0,0 +1,19 @@
+from boxoffice import markets
+from boxoffice.markets import MarketStore, TokenBucket, poll
+
+
+def test_untitled_and_malformed_markets_do_not_abort_the_poll(tmp_path, monkeypatch):
+    event = {"slug": "film-opening", "markets": [
+        {"groupItemTitle": "$100M+", "outcomePrices": '["0.7", "0.3"]'},
+        {"groupItemTitle": None, "question": None, "outcomePrices": '["0.2", "0.8"]'},
+        {"groupItemTitle": "$50-100M", "outcomePrices": "not json"},
+        {"groupItemTitle": "<$50M", "outcomePrices": "[]"},
+    ]}
+    monkeypatch.setattr(markets, "_get_json", lambda url: [event] if "polymarket" in url else [])
+    store = MarketStore(str(tmp_path / "markets.sqlite3"))
+    dataset = {"Film": {"poly_slug": "film-opening", "simple_name": "Film"}}
+
+    updated, errors = poll(dataset, store=store, budget=TokenBucket(1000, 1000))
+    assert updated["polymarket"] == 1 and not errors
+    snapshot, _ = store.latest("polymarket", "film-opening")
+    assert snapshot["buckets"] == {"$100M+": 70}
@@ -0,0 +1,46 @@
+from datetime import date, timedelta
+
+from boxoffice import pageviews
+from boxoffice.pageviews import PageviewStore, features, sync
+
+END = date(2025, 11, 20)
+
+
+def published(days_missing):
+    """A fake fetch_range serving 100 views a day, minus the last `days_missing` days of END."""
+    calls = []
+
+    def fetch_range(article, start, end):
+        calls.append((start, end))
+        last = END - timedelta(days=days_missing)
+        return {start + timedelta(days=i): 100 for i in range((min(end, last) - start).days + 1)}
+
+    return fetch_range, calls
+
+
+def test_unpublished_last_day_is_fetched_again(tmp_path, monkeypatch):
+    store = PageviewStore(str(tmp_path / "pageviews.sqlite3"))
+    fetch_range, calls = published(days_missing=1)
+    monkeypatch.setattr(pageviews, "fetch_range", fetch_range)
+    sync("Film", end=END, store=store)
+    assert store.synced_range("Film")[1] == END - timedelta(days=1)
+    # The missing day is left out of the averages rather than counted as 0.
+    assert features("Film", end=END, store=store)["avg_30"] == 100
+    assert features("Film", end=END, store=store)["wow_growth"] == 0
+
+    fetch_range, calls = published(days_missing=0)
+    monkeypatch.setattr(pageviews, "fetch_range", fetch_range)
+    assert sync("Film", end=END, store=store) == 1
+    assert calls == [(END, END)]
+    assert store.synced_range("Film")[1] == END
+    assert store.series("Film", end=END)[1][-1] == 100
+
+
+def test_old_empty_days_are_not_refetched(tmp_path, monkeypatch):
+    store = PageviewStore(str(tmp_path / "pageviews.sqlite3"))
+    fetch_range, calls = published(days_missing=30)
+    monkeypatch.setattr(pageviews, "fetch_range", fetch_range)
+    sync("Film", end=END, store=store)
+    # Only days within PUBLISH_LAG_DAYS of the end are retried.
+    assert store.missing_range("Film", end=END) == (END - timedelta(days=pageviews.PUBLISH_LAG_DAYS - 1), END)
+    assert features("Film", end=END, store=store) == {"avg_7": 0.0, "avg_30": 0.0, "wow_growth": None, "momentum": None}
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from boxoffice.release_calendar import COMP_FLOOR, ReleaseCalendar
+
+RUN = np.linspace(100.0, 10.0, 16)
+
+
+def test_lone_title_is_unaffected():
+    calendar = ReleaseCalendar()
+    calendar.set("A", "2026-05-01", RUN)
+    assert calendar.factors() == {"A": 1.0}
+
+
+def test_same_day_rivals_split_the_opening_weeks():
+    calendar = ReleaseCalendar()
+    calendar.set("A", "2026-05-01", RUN)
+    calendar.set("B", "2026-05-01", RUN)
+    assert calendar.factors() == pytest.approx({"A": 0.75, "B": 0.75})
+    assert calendar.rivals("A")[0][0] == "B"
+
+
+def test_limited_releases_and_distant_dates_do_not_compete():
+    calendar = ReleaseCalendar()
+    calendar.set("A", "2026-05-01", RUN)
+    calendar.set("Limited", "2026-05-01", RUN, wide=False)
+    calendar.set("Later", "2026-12-04", RUN)
+    factors = calendar.factors()
+    assert factors["A"] == 1.0 and factors["Later"] == 1.0
+    # The limited release still faces A.
+    assert COMP_FLOOR < factors["Limited"] < 1.0
+
+
+def test_incremental_updates_match_a_fresh_calendar():
+    rng = np.random.default_rng(0)
+    days = np.datetime64("2026-01-02") + rng.integers(0, 365, 40)
+    runs = rng.uniform(1.0, 100.0, (40, 16))
+    calendar = ReleaseCalendar()
+    for i in range(40):
+        calendar.set(f"T{i}", days[i], runs[i], wide=bool(i % 5))
+    calendar.factors()
+    # Move some dates, drop a title, then compare against building from scratch.
+    for i in range(0, 40, 7):
+        days[i] += 21
+        calendar.set(f"T{i}", days[i], runs[i], wide=bool(i % 5))
+    calendar.remove("T3")
+    fresh = ReleaseCalendar()
+    for i in range(40):
+        if i != 3:
+            fresh.set(f"T{i}", days[i], runs[i], wide=bool(i % 5))
+    assert calendar.factors() == pytest.approx(fresh.factors())
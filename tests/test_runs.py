@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from boxoffice.runs import RUN_WEEKS, project_runs
+
+STUDIOS = ["Major Franchise", "Family / Animation", "Cult / Indie (A24/Neon)"]
+
+
+@pytest.mark.parametrize("legs", [1.5, 2.5, 4.0, 8.0, RUN_WEEKS, 20.0, 40.0])
+def test_rows_start_at_the_opening_and_sum_to_the_total(legs):
+    opening = np.array([100.0, 25.0, 3.0])
+    curves = project_runs(opening, opening * legs, STUDIOS, "Standard 3-Day")
+    assert curves.shape == (3, RUN_WEEKS)
+    np.testing.assert_allclose(curves.sum(axis=1), opening * legs)
+    np.testing.assert_allclose(curves[:, 0], opening, rtol=1e-6)
+    assert (curves >= 0).all()
+
+
+def test_legs_beyond_the_run_go_in_the_last_week():
+    curve = project_runs(100.0, 2000.0, "Major Franchise", "Standard 3-Day")[0]
+    np.testing.assert_allclose(curve[:-1], 100.0)
+    assert curve[-1] == pytest.approx(2000.0 - 100.0 * (RUN_WEEKS - 1))
+
+
+def test_short_legs_put_the_total_in_week_one():
+    curves = project_runs([100.0, 0.0], [80.0, 5.0], "Major Franchise", "Standard 3-Day")
+    np.testing.assert_allclose(curves[:, 0], [80.0, 5.0])
+    assert (curves[:, 1:] == 0).all()
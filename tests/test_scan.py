@@ -0,0 +1,57 @@
+import pytest
+
+from boxoffice import http_client
+from boxoffice.signals import RT_PATTERNS
+
+
+class StreamedResponse:
+    def __init__(self, body, status_code=200):
+        self.body, self.status_code = body, status_code
+        self.chunks_read = 0
+        self.closed = False
+
+    def iter_content(self, size):
+        for i in range(0, len(self.body), size):
+            self.chunks_read += 1
+            yield self.body[i:i + size]
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Point scan at one canned streamed response; returns the response for inspection."""
+    monkeypatch.setattr(http_client, "SCAN_CHUNK_SIZE", 16)
+
+    def serve(body, status_code=200):
+        response = StreamedResponse(body, status_code)
+
+        class Client:
+            def stream(self, url, headers=None, timeout=None):
+                return response
+        monkeypatch.setattr(http_client, "_client", Client())
+        return response
+    return serve
+
+
+def test_match_split_across_chunks_is_found(serve):
+    serve(b"x" * 10 + b'tomatometerscore="87"' + b"y" * 40)
+    assert http_client.scan("https://example.test/m/film", RT_PATTERNS) == "87"
+
+
+def test_best_pattern_wins_and_stops_the_read(serve):
+    response = serve(b'class="percentage"> 12%' + b"." * 40 + b'tomatometerscore="91"' + b"." * 400)
+    assert http_client.scan("https://example.test/m/film", RT_PATTERNS) == "91"
+    assert response.closed and response.chunks_read < len(response.body) // 16
+
+
+def test_lower_ranked_match_counts_without_a_better_one(serve):
+    serve(b'"ratingValue": "64"' + b"." * 100)
+    assert http_client.scan("https://example.test/m/film", RT_PATTERNS) == "64"
+
+
+def test_error_status_is_not_read(serve):
+    response = serve(b'tomatometerscore="87"', status_code=404)
+    assert http_client.scan("https://example.test/m/film", RT_PATTERNS) is None
+    assert response.chunks_read == 0 and response.closed
@@ -0,0 +1,52 @@
+import asyncio
+import json
+
+import pytest
+
+from boxoffice.service import MAX_BODY_BYTES, PredictionService
+
+LONG_LEAD = {"genre": "Horror", "cast_score": 40, "budget": 20, "rating": "R", "ip_status": "Original",
+             "season": "Average", "competition_level": "Low (Clear Weekend)"}
+
+
+async def exchange(request):
+    """Send raw request bytes to a fresh service; return (status, body) of its one response."""
+    service = PredictionService()
+    server = await asyncio.start_server(service.handle, "127.0.0.1", 0)
+    try:
+        reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+        writer.write(request)
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout=5)
+        writer.close()
+    finally:
+        server.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+def post(path, payload, length=None):
+    body = payload.encode() if isinstance(payload, str) else json.dumps(payload).encode()
+    length = str(len(body)) if length is None else length
+    return (f"POST {path} HTTP/1.1\r\nContent-Length: {length}\r\nConnection: close\r\n\r\n").encode() + body
+
+
+@pytest.mark.parametrize("field, value", [("cast_score", -4), ("budget", -1), ("cast_score", "nan"), ("budget", "inf")])
+def test_out_of_domain_inputs_are_rejected(field, value):
+    status, body = asyncio.run(exchange(post("/v1/long-lead", {**LONG_LEAD, field: value})))
+    assert status == 400 and field in body["error"]
+
+
+def test_non_finite_json_literals_are_rejected():
+    payload = json.dumps({"scenarios": [LONG_LEAD]}).replace('"cast_score": 40', '"cast_score": NaN')
+    assert asyncio.run(exchange(post("/v1/long-lead/batch", payload)))[0] == 400
+
+
+def test_valid_input_is_scored():
+    status, body = asyncio.run(exchange(post("/v1/long-lead", LONG_LEAD)))
+    assert status == 200 and body["opening"] > 0
+
+
+@pytest.mark.parametrize("length, status", [("abc", 400), ("-5", 400), (str(MAX_BODY_BYTES + 1), 413)])
+def test_bad_content_length_gets_a_response(length, status):
+    assert asyncio.run(exchange(post("/v1/long-lead", LONG_LEAD, length=length)))[0] == status
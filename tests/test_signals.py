@@ -0,0 +1,51 @@
+import pytest
+
+from boxoffice import signals
+from boxoffice.signal_cache import SignalCache
+
+
+def test_expired_backoffs_are_dropped(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(signals.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(signals, "_failed_until", {})
+    signals._back_off("wiki", "A")
+    signals._back_off("rt", "B")
+    assert signals._backing_off("wiki", "A", now[0])
+
+    now[0] += signals.FAILURE_BACKOFF
+    assert not signals._backing_off("wiki", "A", now[0])
+    assert ("wiki", "A") not in signals._failed_until
+    # A new failure sweeps every other expired entry.
+    signals._back_off("youtube", "C")
+    assert list(signals._failed_until) == [("youtube", "C")]
+
+
+def test_lease_is_exclusive_until_released_or_expired(tmp_path):
+    cache = SignalCache(str(tmp_path / "signals.sqlite3"))
+    token = cache.acquire_lease("rt", "film", ttl=30)
+    assert token is not None
+    assert cache.acquire_lease("rt", "film", ttl=30) is None
+    cache.release_lease("rt", "film", token)
+    # An expired lease (a crashed holder) is taken over.
+    assert cache.acquire_lease("rt", "film", ttl=0) is not None
+    assert cache.acquire_lease("rt", "film", ttl=30) is not None
+
+
+def test_failed_fetch_holds_its_lease_with_the_error(tmp_path):
+    cache = SignalCache(str(tmp_path / "signals.sqlite3"))
+    token = cache.acquire_lease("rt", "film", ttl=30)
+    cache.release_lease("rt", "film", token, error="Timeout", hold=60)
+    assert cache.lease_error("rt", "film") == "Timeout"
+    with pytest.raises(signals.FetchFailedElsewhere):
+        signals.fetch_shared("rt", lambda key: 90, "film", cache=cache)
+
+
+def test_fetch_shared_reuses_a_value_stored_during_the_wait(tmp_path):
+    cache = SignalCache(str(tmp_path / "signals.sqlite3"))
+    calls = []
+    fetch = lambda key: calls.append(key) or 75
+    assert signals.fetch_shared("rt", fetch, "film", cache=cache) == 75
+    # A value fetched within LEASE_SECONDS is the answer; no second fetch.
+    assert signals.fetch_shared("rt", fetch, "film", cache=cache) == 75
+    assert calls == ["film"]
+    assert cache.acquire_lease("rt", "film", ttl=30) is not None
@@ -0,0 +1,15 @@
+from boxoffice.backtest import film_inputs
+from boxoffice.datasets import historical_data
+from boxoffice.release_calendar import preset_live
+from boxoffice.slate import score_slate
+
+
+def test_zero_rt_score_scores_like_the_backtest():
+    film = {**next(iter(historical_data.values())), "rt_recorded": 0}
+    dataset = {"zero": film, "unknown": {**film, "rt_recorded": None}}
+    slate = score_slate(dataset, preset_live(dataset))
+    assert slate["rt_score"].to_dict() == {"zero": 0, "unknown": 70}
+    assert slate["rt_score"].to_dict() == film_inputs(dataset)["rt_score"].to_dict()
+    # A live score of 0 wins over a recorded one.
+    live = {**preset_live(dataset), "unknown": (0, 0, 0, None, None, {})}
+    assert score_slate({**dataset, "unknown": {**film, "rt_recorded": 90}}, live).loc["unknown", "rt_score"] == 0
@@ -0,0 +1,18 @@
+import pandas as pd
+
+from boxoffice.windows import FILM_COLUMNS, optimize_windows, weekly_windows
+
+WINDOWS = weekly_windows("2026-01-02", 8)
+
+
+def test_empty_slate():
+    result = optimize_windows(pd.DataFrame(columns=FILM_COLUMNS), WINDOWS)
+    assert result["total"] == 0.0 and result["rounds"] == 0
+    assert result["plan"].empty and result["marginal"].shape == (0, len(WINDOWS))
+
+
+def test_one_film_takes_its_best_window():
+    films = pd.DataFrame([{"genre": "Horror", "cast_score": 10, "budget": 15, "rating": "R", "ip_status": "Original"}], index=["Film"])
+    result = optimize_windows(films, weekly_windows("2026-06-05", 30))
+    assert result["plan"].loc["Film", "season"] == "Holiday (Nov-Dec)"
+    assert result["marginal"].to_numpy().max() <= 1e-9